@@ -0,0 +1,211 @@
+import asyncio
+import time
+from dataclasses import dataclass
+
+from playwright.async_api import Browser, BrowserContext, Playwright
+
+from .config import get_settings
+from .metrics import BROWSER_LAUNCH
+
+settings = get_settings()
+
+BROWSER_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--disable-dev-shm-usage",
+    "--no-sandbox",
+    "--disable-setuid-sandbox",
+    "--disable-gpu",
+    "--disable-web-security",
+]
+
+# Desktop Chrome user agent shared by browser contexts and the HTTP tier
+USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/120.0.0.0 Safari/537.36"
+)
+
+
+@dataclass
+class _PooledBrowser:
+    """A warm browser plus the bookkeeping needed to recycle it."""
+
+    browser: Browser
+    contexts_served: int = 0
+    active_contexts: int = 0
+    retiring: bool = False
+
+
+class BrowserPool:
+    """
+    Pool of long-lived Chromium browsers shared by all scrapers.
+
+    Launching Chromium is the most expensive step of a scrape, so the pool
+    keeps `size` browsers warm and hands out fresh `BrowserContext`s instead.
+    A browser is retired after serving `max_contexts` contexts (to bound
+    memory growth and leaked renderer state) and replaced once its last
+    context has been released.
+    """
+
+    def __init__(
+        self,
+        playwright: Playwright,
+        size: int | None = None,
+        max_contexts: int | None = None,
+    ):
+        self.playwright = playwright
+        self.size = max(1, size or settings.browser_pool_size)
+        self.max_contexts = max(1, max_contexts or settings.browser_pool_max_contexts)
+        self._browsers: list[_PooledBrowser] = []
+        self._owners: dict[BrowserContext, _PooledBrowser] = {}
+        self._lock = asyncio.Lock()
+        self._changed = asyncio.Condition(self._lock)  # a launch finished or failed
+        self._launching = 0
+        self._closed = False
+        self.launches = 0
+        self.recycles = 0
+
+    async def start(self) -> None:
+        """Launch all browsers up front so the first scrape is warm."""
+        async with self._lock:
+            while len(self._browsers) < self.size:
+                self._browsers.append(await self._launch())
+
+    async def close(self) -> None:
+        """Close every browser owned by the pool."""
+        async with self._lock:
+            self._closed = True
+            browsers, self._browsers = self._browsers, []
+            self._owners.clear()
+            self._changed.notify_all()
+        for pooled in browsers:
+            await self._close_browser(pooled)
+
+    async def new_context(self, **options) -> BrowserContext:
+        """Create a fresh context on the least-loaded healthy browser."""
+        pooled = await self._acquire()
+        try:
+            context = await pooled.browser.new_context(**options)
+        except Exception:
+            await self._release(pooled)
+            raise
+
+        self._owners[context] = pooled
+        return context
+
+    async def release(self, context: BrowserContext) -> None:
+        """Close a context obtained from `new_context` and recycle if due."""
+        pooled = self._owners.pop(context, None)
+        try:
+            await context.close()
+        except Exception:
+            pass  # Browser may already be gone
+        if pooled:
+            await self._release(pooled)
+
+    def stats(self) -> dict:
+        """Pool state for health/debug endpoints."""
+        return {
+            "size": self.size,
+            "max_contexts": self.max_contexts,
+            "launches": self.launches,
+            "recycles": self.recycles,
+            "browsers": [
+                {
+                    "connected": p.browser.is_connected(),
+                    "contexts_served": p.contexts_served,
+                    "active_contexts": p.active_contexts,
+                    "retiring": p.retiring,
+                }
+                for p in self._browsers
+            ],
+        }
+
+    async def _acquire(self) -> _PooledBrowser:
+        """
+        Count a new context against a browser, launching one if a slot is free.
+
+        A replacement launch reserves its slot under the lock but runs
+        outside it, so a crashed browser doesn't hold up contexts on the
+        healthy ones; callers only wait when every slot is being launched.
+        """
+        async with self._changed:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Browser pool is closed")
+                pooled = self._pick()
+                if pooled is not None:
+                    self._count(pooled)
+                    return pooled
+                if self._free_slots():
+                    self._launching += 1
+                    break
+                await self._changed.wait()
+
+        try:
+            pooled = await self._launch()
+        except Exception:
+            async with self._changed:
+                self._launching -= 1
+                self._changed.notify_all()
+            raise
+
+        async with self._changed:
+            self._launching -= 1
+            self._changed.notify_all()
+            if not self._closed:
+                self._browsers.append(pooled)
+                self._count(pooled)
+                return pooled
+        await self._close_browser(pooled)
+        raise RuntimeError("Browser pool is closed")
+
+    def _free_slots(self) -> int:
+        """Slots not taken by a healthy browser or a launch in progress. Caller holds the lock."""
+        return self.size - self._launching - sum(1 for p in self._browsers if not p.retiring)
+
+    def _pick(self) -> _PooledBrowser | None:
+        """
+        The browser to serve the next context, or None when a free slot
+        should be filled first. Caller holds the lock.
+        """
+        # Drop browsers that crashed or were disconnected
+        for pooled in [p for p in self._browsers if not p.browser.is_connected()]:
+            self._browsers.remove(pooled)
+
+        candidates = [p for p in self._browsers if not p.retiring]
+        if not candidates or self._free_slots():
+            return None
+        return min(candidates, key=lambda p: p.active_contexts)
+
+    def _count(self, pooled: _PooledBrowser) -> None:
+        pooled.contexts_served += 1
+        pooled.active_contexts += 1
+        if pooled.contexts_served >= self.max_contexts:
+            pooled.retiring = True
+
+    async def _release(self, pooled: _PooledBrowser) -> None:
+        async with self._lock:
+            pooled.active_contexts -= 1
+            if not (pooled.retiring and pooled.active_contexts <= 0):
+                return
+            if pooled in self._browsers:
+                self._browsers.remove(pooled)
+            self.recycles += 1
+        await self._close_browser(pooled)
+
+    async def _launch(self) -> _PooledBrowser:
+        started = time.perf_counter()
+        browser = await self.playwright.chromium.launch(
+            headless=settings.browser_headless,
+            args=BROWSER_ARGS,
+        )
+        BROWSER_LAUNCH.observe(time.perf_counter() - started)
+        self.launches += 1
+        return _PooledBrowser(browser=browser)
+
+    async def _close_browser(self, pooled: _PooledBrowser) -> None:
+        try:
+            await pooled.browser.close()
+        except Exception:
+            pass
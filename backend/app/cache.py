@@ -0,0 +1,143 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable
+
+from .config import get_settings
+
+settings = get_settings()
+
+
+@dataclass
+class CacheEntry:
+    """A cached scrape result and when it was produced."""
+
+    value: Any
+    scraped_at: datetime = field(default_factory=datetime.now)
+    stored_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def age(self) -> float:
+        """Seconds since the value was stored."""
+        return time.monotonic() - self.stored_at
+
+    def meta(self, cached: bool) -> dict:
+        """Cache fields reported in ScrapeResponse.meta."""
+        return {
+            "cached": cached,
+            "age_seconds": round(self.age, 3) if cached else 0.0,
+            "scraped_at": self.scraped_at.isoformat(),
+        }
+
+
+def _is_cacheable(value: Any) -> bool:
+    """Only keep successful results; failures should be retried next time."""
+    return not isinstance(value, dict) or bool(value.get("success", True))
+
+
+class ResultCache:
+    """
+    In-process TTL cache for scrape results, keyed by provider.
+
+    An entry younger than its TTL is served as-is. Once past the TTL but
+    still inside the stale-while-revalidate window, the old entry is served
+    immediately while a single background refresh replaces it. Anything
+    older (or a caller whose `max_age` the entry doesn't satisfy) waits for
+    a fresh scrape.
+    """
+
+    def __init__(
+        self,
+        ttl: float | None = None,
+        stale_while_revalidate: float | None = None,
+        ttl_overrides: dict[str, float] | None = None,
+    ):
+        self.ttl = settings.cache_ttl if ttl is None else ttl
+        self.stale_while_revalidate = (
+            settings.cache_stale_while_revalidate
+            if stale_while_revalidate is None
+            else stale_while_revalidate
+        )
+        self.ttl_overrides = settings.cache_ttl_overrides if ttl_overrides is None else ttl_overrides
+        self._entries: dict[str, CacheEntry] = {}
+        self._refreshing: dict[str, asyncio.Task] = {}
+
+    def ttl_for(self, key: str) -> float:
+        """TTL for a key, honouring per-provider overrides."""
+        return self.ttl_overrides.get(key, self.ttl)
+
+    def peek(self, key: str) -> CacheEntry | None:
+        """Return the current entry without checking freshness."""
+        return self._entries.get(key)
+
+    def set(self, key: str, value: Any, scraped_at: datetime | None = None) -> CacheEntry:
+        """Store a value, stamping it as scraped now unless told otherwise."""
+        entry = CacheEntry(value=value, scraped_at=scraped_at or datetime.now())
+        self._entries[key] = entry
+        return entry
+
+    def invalidate(self, key: str | None = None) -> None:
+        """Drop one key, or everything when no key is given."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    async def get(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        max_age: float | None = None,
+    ) -> tuple[CacheEntry, bool]:
+        """
+        Return `(entry, cached)` for a key, fetching when necessary.
+
+        `max_age` lets a caller demand data at most that many seconds old;
+        it also disables serving stale entries for that call.
+        """
+        entry = self._entries.get(key)
+        ttl = self.ttl_for(key)
+
+        if entry:
+            limit = ttl if max_age is None else min(ttl, max_age)
+            if entry.age <= limit:
+                return entry, True
+            if max_age is None and entry.age <= ttl + self.stale_while_revalidate:
+                self._schedule_refresh(key, fetch)
+                return entry, True
+
+        return await self.refresh(key, fetch), False
+
+    def stats(self) -> dict:
+        """Per-key ages and TTLs for debug endpoints."""
+        return {
+            key: {
+                "age_seconds": round(entry.age, 3),
+                "ttl": self.ttl_for(key),
+                "scraped_at": entry.scraped_at.isoformat(),
+                "refreshing": key in self._refreshing,
+            }
+            for key, entry in self._entries.items()
+        }
+
+    async def refresh(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> CacheEntry:
+        """Fetch a new value now and store it if it is cacheable."""
+        value = await fetch()
+        if _is_cacheable(value):
+            return self.set(key, value)
+        return CacheEntry(value=value)
+
+    def _schedule_refresh(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> None:
+        if key in self._refreshing:
+            return
+
+        async def refresh() -> None:
+            try:
+                await self.refresh(key, fetch)
+            except Exception as e:
+                print(f"Background refresh of {key} failed: {e}")
+            finally:
+                self._refreshing.pop(key, None)
+
+        self._refreshing[key] = asyncio.create_task(refresh())
@@ -0,0 +1,71 @@
+import hashlib
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+
+def content_digest(parts: Iterable[str]) -> str:
+    """Stable digest of the content a scrape's extraction methods would read."""
+    digest = hashlib.sha1()
+    for part in parts:
+        digest.update(part.encode("utf-8", "surrogatepass"))
+        digest.update(b"\x1f")
+    return digest.hexdigest()
+
+
+@dataclass
+class _Previous:
+    fingerprint: str
+    result: dict
+
+
+class ChangeDetector:
+    """
+    Remembers each provider's last parsed result and the fingerprint of
+    the content it was parsed from.
+
+    Scrapers look up the fingerprint of a freshly loaded page; a match
+    means the upstream schedule hasn't changed, so the remembered result
+    is reused instead of parsing again. Checks and skips are counted from
+    finished results, so the skip rate also covers scrapes run in fleet
+    worker processes (each of which keeps its own remembered results).
+    """
+
+    def __init__(self):
+        self._previous: dict[str, _Previous] = {}
+        self._checks: dict[str, int] = {}
+        self._skips: dict[str, int] = {}
+
+    def lookup(self, provider: str, fingerprint: str) -> dict | None:
+        """The remembered result when `fingerprint` matches the last run's."""
+        previous = self._previous.get(provider)
+        if previous is None or previous.fingerprint != fingerprint:
+            return None
+        return previous.result
+
+    def remember(self, provider: str, fingerprint: str, result: dict) -> None:
+        self._previous[provider] = _Previous(fingerprint=fingerprint, result=dict(result))
+
+    def forget(self, provider: str) -> None:
+        self._previous.pop(provider, None)
+
+    def observe(self, provider: str, result: Any) -> None:
+        """Count a finished scrape that was fingerprinted, and whether parsing was skipped."""
+        if not isinstance(result, dict) or not result.get("fingerprint"):
+            return
+        self._checks[provider] = self._checks.get(provider, 0) + 1
+        if result.get("unchanged"):
+            self._skips[provider] = self._skips.get(provider, 0) + 1
+
+    def skip_rate(self, provider: str) -> float | None:
+        checks = self._checks.get(provider, 0)
+        return round(self._skips.get(provider, 0) / checks, 3) if checks else None
+
+    def stats(self) -> dict:
+        return {
+            provider: {
+                "checks": checks,
+                "skipped": self._skips.get(provider, 0),
+                "skip_rate": self.skip_rate(provider),
+            }
+            for provider, checks in self._checks.items()
+        }
@@ -1,3 +1,4 @@
+from pydantic import PositiveFloat
 from pydantic_settings import BaseSettings
 from functools import lru_cache
 
@@ -12,11 +13,67 @@ class Settings(BaseSettings):
     # Browser settings
     browser_headless: bool = True
     browser_timeout: int = 30000  # milliseconds
+    browser_pool_size: int = 2  # warm browsers kept by the pool
+    browser_pool_max_contexts: int = 50  # contexts served before a browser is recycled
+    block_resources: bool = True  # apply each scraper's resource blocking policy
+    readiness_timeout: int = 15000  # milliseconds to wait for a page to become ready
+    readiness_quiet_ms: int = 500  # DOM must stop mutating this long to count as ready
+
+    # HAR record/replay: 'off', 'record' (save traffic per provider) or 'replay' (no network)
+    har_mode: str = "off"
+    har_dir: str = "fixtures/har"
+
+    # Per-provider browser sessions (cookies, localStorage) and script/stylesheet cache
+    session_persistence: bool = True
+    session_dir: str = "data/sessions"
+    session_max_age: float = 86400.0  # seconds a saved session is reused
+    http_cache_max_age: float = 86400.0  # seconds a cached asset is served without refetching
+
+    # HTTP tier: fetch pages/JSON with a pooled httpx client before launching a browser
+    http_fast_path: bool = True
+    http_timeout: float = 10.0  # seconds per request
+    http_max_connections: int = 20
 
     # Scraping settings
-    scrape_delay_min: float = 1.0  # seconds
-    scrape_delay_max: float = 3.0  # seconds
     max_retries: int = 3
+    scrape_concurrency: int = 3  # providers scraped in parallel for provider=all
+    scrape_provider_timeout: float = 120.0  # seconds before a provider is abandoned
+    change_detection: bool = True  # reuse the last result when the page content is unchanged
+    scrape_workers: int = 0  # worker processes with their own browsers (0 scrapes in the API process)
+    parse_workers: int = 2  # processes for CPU-bound HTML parsing (0 parses on the event loop)
+    loop_lag_interval: float = 0.1  # seconds between event-loop lag samples
+
+    # Per-provider rate limiting, back-off and circuit breaking
+    rate_limit_enabled: bool = True
+    rate_limit_per_minute: PositiveFloat = 30.0  # navigations per provider per minute
+    rate_limit_burst: int = 5  # navigations allowed back to back
+    rate_limit_overrides: dict[str, PositiveFloat] = {}  # per-provider navigations per minute
+    backoff_base: float = 1.0  # seconds; doubles per consecutive throttle (full jitter)
+    backoff_max: float = 60.0  # seconds
+    circuit_failure_threshold: int = 3  # consecutive failed scrapes before failing fast
+    circuit_reset_timeout: float = 120.0  # seconds before a trial scrape is allowed
+
+    # Result cache settings
+    cache_ttl: float = 300.0  # seconds a scrape result is considered fresh
+    cache_stale_while_revalidate: float = 900.0  # seconds a stale result may still be served
+    cache_ttl_overrides: dict[str, float] = {}  # per-provider TTL, e.g. {"clubgg": 900}
+
+    # Scrape job queue settings
+    job_workers: int = 3  # jobs run concurrently (scrapes are still bounded by scrape_concurrency)
+    job_max_completed: int = 500  # finished jobs kept for polling (least recently used dropped)
+
+    # Response settings
+    fast_serialization: bool = False  # skip response revalidation and encode in one pass with orjson
+
+    # Background scheduler settings (keep intervals below the cache TTL)
+    scheduler_enabled: bool = True
+    scheduler_interval: float = 240.0  # seconds between scheduled scrapes
+    scheduler_interval_overrides: dict[str, float] = {}  # per-provider interval
+    scheduler_jitter: float = 0.1  # +/- fraction of the interval
+
+    # Snapshot store settings (SQLite, WAL mode)
+    store_enabled: bool = True
+    store_path: str = "data/snapshots.db"
 
     class Config:
         env_file = ".env"
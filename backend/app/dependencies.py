@@ -1,10 +1,75 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import httpx
 from playwright.async_api import Playwright
 
+from .browser_pool import BrowserPool
+from .cache import ResultCache
+from .changes import ChangeDetector
+from .config import get_settings
+from .fleet import ScrapeFleet
+from .jobs import ScrapeJobManager
+from .loop_monitor import LoopLagMonitor
+from .progress import ProgressHub
+from .ratelimit import RateLimiterRegistry
+from .scheduler import ScrapeScheduler
+from .search import SnapshotSearch
+from .sessions import SessionStore
+from .singleflight import SingleFlight
+from .store import SnapshotRepository
+
+settings = get_settings()
+
 # Global playwright instance
 playwright_instance: Playwright | None = None
 
+# Global browser pool, owned by the app lifespan
+browser_pool: BrowserPool | None = None
+
+# Global pooled HTTP client for the HTTP tier, owned by the app lifespan
+http_client: httpx.AsyncClient | None = None
+
+# Global scrape worker fleet, owned by the app lifespan in worker mode
+scrape_fleet: ScrapeFleet | None = None
+
+# Global process pool for CPU-bound parsing, owned by the app lifespan
+parse_pool: ProcessPoolExecutor | None = None
+
+# Global event-loop lag monitor, owned by the app lifespan
+loop_monitor: LoopLagMonitor | None = None
+
+# Global scrape result cache
+result_cache: ResultCache | None = None
+
+# Global upstream change detector (last fingerprint and result per provider)
+change_detector: ChangeDetector | None = None
+
+# Global coalescing layer for in-flight scrapes
+scrape_flights: SingleFlight | None = None
+
+# Global per-provider rate limiters and circuit breakers
+rate_limiters: RateLimiterRegistry | None = None
+
+# Global hub for in-progress scrape events (partial results)
+progress_hub: ProgressHub | None = None
+
+# Global background scrape scheduler, owned by the app lifespan
+scrape_scheduler: ScrapeScheduler | None = None
+
+# Global search index over the latest cached snapshots
+snapshot_search: SnapshotSearch | None = None
+
+# Global per-provider browser sessions and asset cache
+session_store: SessionStore | None = None
+
+# Global scrape job queue, owned by the app lifespan
+job_manager: ScrapeJobManager | None = None
 
-def set_playwright(pw: Playwright) -> None:
+# Global snapshot store, owned by the app lifespan
+snapshot_store: SnapshotRepository | None = None
+
+
+def set_playwright(pw: Playwright | None) -> None:
     """Set the global Playwright instance."""
     global playwright_instance
     playwright_instance = pw
@@ -15,3 +80,151 @@ def get_playwright() -> Playwright:
     if playwright_instance is None:
         raise RuntimeError("Playwright not initialized")
     return playwright_instance
+
+
+def set_browser_pool(pool: BrowserPool | None) -> None:
+    """Set the global browser pool."""
+    global browser_pool
+    browser_pool = pool
+
+
+def get_browser_pool() -> BrowserPool | None:
+    """Get the global browser pool, if one has been started."""
+    return browser_pool
+
+
+def set_http_client(client: httpx.AsyncClient | None) -> None:
+    """Set the global HTTP client."""
+    global http_client
+    http_client = client
+
+
+def get_http_client() -> httpx.AsyncClient | None:
+    """Get the global HTTP client, if the HTTP tier is enabled."""
+    return http_client
+
+
+def set_scrape_fleet(fleet: ScrapeFleet | None) -> None:
+    """Set the global scrape worker fleet."""
+    global scrape_fleet
+    scrape_fleet = fleet
+
+
+def get_scrape_fleet() -> ScrapeFleet | None:
+    """Get the global scrape worker fleet, if worker mode is on."""
+    return scrape_fleet
+
+
+def set_parse_pool(pool: ProcessPoolExecutor | None) -> None:
+    """Set the global parsing process pool."""
+    global parse_pool
+    parse_pool = pool
+
+
+def get_parse_pool() -> ProcessPoolExecutor | None:
+    """Get the global parsing process pool, if one has been started."""
+    return parse_pool
+
+
+def set_loop_monitor(monitor: LoopLagMonitor | None) -> None:
+    """Set the global event-loop lag monitor."""
+    global loop_monitor
+    loop_monitor = monitor
+
+
+def get_loop_monitor() -> LoopLagMonitor | None:
+    """Get the global event-loop lag monitor, if one is running."""
+    return loop_monitor
+
+
+def get_result_cache() -> ResultCache:
+    """Get the global result cache, creating it on first use."""
+    global result_cache
+    if result_cache is None:
+        result_cache = ResultCache()
+    return result_cache
+
+
+def get_change_detector() -> ChangeDetector | None:
+    """Get the global change detector, creating it on first use; None when disabled."""
+    global change_detector
+    if not settings.change_detection:
+        return None
+    if change_detector is None:
+        change_detector = ChangeDetector()
+    return change_detector
+
+
+def get_scrape_flights() -> SingleFlight:
+    """Get the global single-flight group for scrapes, creating it on first use."""
+    global scrape_flights
+    if scrape_flights is None:
+        scrape_flights = SingleFlight()
+    return scrape_flights
+
+
+def get_rate_limiters() -> RateLimiterRegistry:
+    """Get the global per-provider rate limiters, creating them on first use."""
+    global rate_limiters
+    if rate_limiters is None:
+        rate_limiters = RateLimiterRegistry()
+    return rate_limiters
+
+
+def get_session_store() -> SessionStore | None:
+    """Get the global session store, creating it on first use; None when disabled."""
+    global session_store
+    if not settings.session_persistence:
+        return None
+    if session_store is None:
+        session_store = SessionStore()
+    return session_store
+
+
+def set_scheduler(scheduler: ScrapeScheduler | None) -> None:
+    """Set the global scrape scheduler."""
+    global scrape_scheduler
+    scrape_scheduler = scheduler
+
+
+def get_scheduler() -> ScrapeScheduler | None:
+    """Get the global scrape scheduler, if one is running."""
+    return scrape_scheduler
+
+
+def get_progress_hub() -> ProgressHub:
+    """Get the global progress hub, creating it on first use."""
+    global progress_hub
+    if progress_hub is None:
+        progress_hub = ProgressHub()
+    return progress_hub
+
+
+def get_snapshot_search() -> SnapshotSearch:
+    """Get the global snapshot search index, creating it on first use."""
+    global snapshot_search
+    if snapshot_search is None:
+        snapshot_search = SnapshotSearch()
+    return snapshot_search
+
+
+def set_snapshot_store(store: SnapshotRepository | None) -> None:
+    """Set the global snapshot store."""
+    global snapshot_store
+    snapshot_store = store
+
+
+def get_snapshot_store() -> SnapshotRepository | None:
+    """Get the global snapshot store, if one is open."""
+    return snapshot_store
+
+
+def set_job_manager(manager: ScrapeJobManager | None) -> None:
+    """Set the global scrape job manager."""
+    global job_manager
+    job_manager = manager
+
+
+def get_job_manager() -> ScrapeJobManager | None:
+    """Get the global scrape job manager, if it is running."""
+    return job_manager
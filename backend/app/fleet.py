@@ -0,0 +1,363 @@
+import asyncio
+import multiprocessing
+import queue
+import threading
+import time
+import uuid
+from multiprocessing.process import BaseProcess
+from typing import Any, Callable
+
+from .config import get_settings
+from .progress import ProgressHub
+from .ratelimit import RateLimiterRegistry
+
+settings = get_settings()
+
+# Messages on the result queue (worker -> API process):
+#   ("ready", worker_id)
+#   ("started", worker_id, job_id)
+#   ("result", worker_id, job_id, result)
+#   ("error", worker_id, job_id, message)
+#   ("partial", provider, event)
+#   ("acquire", worker_id, request_id, provider)  answered on the worker's grant queue
+#   ("throttle", provider)
+#   ("throttle_ok", provider)
+
+
+class _ForwardingHub(ProgressHub):
+    """Worker-side hub that ships every partial event to the API process."""
+
+    def __init__(self, results: multiprocessing.Queue):
+        super().__init__()
+        self._results = results
+
+    def has_subscribers(self, provider: str) -> bool:
+        return True
+
+    def wants_items(self, provider: str) -> bool:
+        return True  # subscribers live in the API process
+
+    def publish(self, provider: str, event: dict[str, Any]) -> None:
+        self._results.put(("partial", provider, event))
+
+
+class _RemoteLimiter:
+    """
+    Worker-side stand-in for a ProviderLimiter. Tokens are granted and
+    back-off is kept by the API process, so the provider's rate holds
+    across the whole fleet rather than per worker.
+    """
+
+    def __init__(self, registry: "_RemoteLimiterRegistry", provider: str):
+        self._registry = registry
+        self.provider = provider
+
+    async def acquire(self) -> None:
+        if settings.rate_limit_enabled:
+            await self._registry.request_token(self.provider)
+
+    def record_throttle(self) -> float:
+        """Report a throttle; the API process applies the cool-down to the next grants."""
+        self._registry.results.put(("throttle", self.provider))
+        return 0.0
+
+    def record_ok(self) -> None:
+        self._registry.results.put(("throttle_ok", self.provider))
+
+
+class _RemoteLimiterRegistry:
+    """Worker-side `get_rate_limiters()`: requests tokens and waits for their grants."""
+
+    def __init__(self, worker_id: int, results: multiprocessing.Queue, grants: multiprocessing.Queue):
+        self.worker_id = worker_id
+        self.results = results
+        self._grants = grants
+        self._limiters: dict[str, _RemoteLimiter] = {}
+        self._waiting: dict[str, asyncio.Future] = {}
+        self._loop = asyncio.get_running_loop()
+        threading.Thread(target=self._read_grants, name="rate-limit-grants", daemon=True).start()
+
+    def get(self, provider: str) -> _RemoteLimiter:
+        limiter = self._limiters.get(provider)
+        if limiter is None:
+            limiter = self._limiters[provider] = _RemoteLimiter(self, provider)
+        return limiter
+
+    async def request_token(self, provider: str) -> None:
+        request_id = uuid.uuid4().hex
+        future = self._loop.create_future()
+        self._waiting[request_id] = future
+        self.results.put(("acquire", self.worker_id, request_id, provider))
+        try:
+            await future
+        finally:
+            self._waiting.pop(request_id, None)
+
+    def stats(self) -> dict:
+        return {}
+
+    def _read_grants(self) -> None:
+        while True:
+            try:
+                request_id = self._grants.get()
+            except (EOFError, OSError):
+                return
+            self._loop.call_soon_threadsafe(self._grant, request_id)
+
+    def _grant(self, request_id: str) -> None:
+        future = self._waiting.get(request_id)
+        if future is not None and not future.done():
+            future.set_result(None)
+
+
+def worker_main(
+    worker_id: int, jobs: multiprocessing.Queue, results: multiprocessing.Queue, grants: multiprocessing.Queue
+) -> None:
+    """Entry point of a scrape worker process."""
+    try:
+        asyncio.run(_worker_loop(worker_id, jobs, results, grants))
+    except KeyboardInterrupt:
+        pass
+
+
+async def _worker_loop(
+    worker_id: int, jobs: multiprocessing.Queue, results: multiprocessing.Queue, grants: multiprocessing.Queue
+) -> None:
+    # Imported here: the scrapers depend on app.dependencies, which imports this module
+    from playwright.async_api import async_playwright
+
+    from . import dependencies
+    from .browser_pool import BrowserPool
+    from .http_client import create_http_client
+    from .scrapers import SCRAPERS
+
+    dependencies.progress_hub = _ForwardingHub(results)
+    dependencies.rate_limiters = _RemoteLimiterRegistry(worker_id, results, grants)
+    pw = await async_playwright().start()
+    dependencies.set_playwright(pw)
+    pool = BrowserPool(pw)
+    await pool.start()
+    dependencies.set_browser_pool(pool)
+    http_client = create_http_client() if settings.http_fast_path else None
+    dependencies.set_http_client(http_client)
+    results.put(("ready", worker_id))
+
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            job = await loop.run_in_executor(None, jobs.get)
+            if job is None:
+                break
+            job_id, provider = job
+            results.put(("started", worker_id, job_id))
+            try:
+                result = await SCRAPERS[provider](pw, pool).run()
+                results.put(("result", worker_id, job_id, result))
+            except Exception as e:
+                results.put(("error", worker_id, job_id, f"{type(e).__name__}: {e}"))
+    finally:
+        if http_client:
+            await http_client.aclose()
+        await pool.close()
+        await pw.stop()
+
+
+class ScrapeFleet:
+    """
+    Pool of scrape worker processes fed from a local work queue.
+
+    Each worker runs its own event loop, Playwright driver, BrowserPool and
+    HTTP client, so scraping scales across cores and a crashed browser (or
+    worker) can't take down the API process. Jobs go out on a
+    multiprocessing queue; a reader thread resolves the waiting futures as
+    results come back. A supervisor restarts dead workers (backing off while
+    a worker keeps dying before it gets ready) and fails the job they were
+    running.
+
+    Rate limiting stays in the API process: workers ask it for each
+    navigation token and report throttles to it, so one set of buckets,
+    back-offs and circuit breakers covers every worker.
+    """
+
+    MAX_RESTART_DELAY = 60.0
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        on_partial: Callable[[str, dict], None] | None = None,
+        limiters: RateLimiterRegistry | None = None,
+    ):
+        self.size = max(1, workers or settings.scrape_workers)
+        self.on_partial = on_partial
+        self.limiters = limiters or RateLimiterRegistry()
+        self._ctx = multiprocessing.get_context("spawn")
+        self._jobs = self._ctx.Queue()
+        self._results = self._ctx.Queue()
+        self._grants: dict[int, multiprocessing.Queue] = {}
+        self._grant_tasks: set[asyncio.Task] = set()
+        self._workers: dict[int, BaseProcess] = {}
+        self._ready: set[int] = set()
+        self._assigned: dict[int, str] = {}
+        self._crashes: dict[int, int] = {}
+        self._respawn_at: dict[int, float] = {}
+        self._pending: dict[str, asyncio.Future] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._reader: threading.Thread | None = None
+        self._supervisor: asyncio.Task | None = None
+        self._stopping = False
+        self.completed = 0
+        self.failed = 0
+        self.restarts = 0
+
+    async def start(self) -> None:
+        """Spawn the workers; they become ready once their browsers are warm."""
+        self._loop = asyncio.get_running_loop()
+        for worker_id in range(self.size):
+            self._spawn(worker_id)
+        self._reader = threading.Thread(target=self._read_results, name="scrape-fleet-results", daemon=True)
+        self._reader.start()
+        self._supervisor = asyncio.create_task(self._supervise())
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Let workers finish their current job, then shut everything down."""
+        self._stopping = True
+        if self._supervisor:
+            self._supervisor.cancel()
+        for task in self._grant_tasks:
+            task.cancel()
+
+        for _ in self._workers:
+            self._jobs.put(None)
+        await asyncio.to_thread(self._join, timeout)
+        self._ready.clear()
+        self._assigned.clear()
+
+        self._results.put(None)
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(RuntimeError("Scrape fleet stopped"))
+        self._pending.clear()
+
+    async def submit(self, provider: str) -> Any:
+        """Queue a scrape of `provider` and wait for a worker's result."""
+        if self._loop is None or self._stopping:
+            raise RuntimeError("Scrape fleet not running")
+        job_id = uuid.uuid4().hex
+        future = self._loop.create_future()
+        self._pending[job_id] = future
+        self._jobs.put((job_id, provider))
+        try:
+            return await future
+        finally:
+            # A cancelled caller just drops the result when it arrives
+            self._pending.pop(job_id, None)
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.size,
+            "alive": sum(1 for proc in self._workers.values() if proc.is_alive()),
+            "ready": len(self._ready),
+            "busy": len(self._assigned),
+            "pending": len(self._pending),
+            "completed": self.completed,
+            "failed": self.failed,
+            "restarts": self.restarts,
+        }
+
+    def _spawn(self, worker_id: int) -> None:
+        # A fresh grant queue, so a restarted worker never sees its predecessor's grants
+        self._grants[worker_id] = self._ctx.Queue()
+        proc = self._ctx.Process(
+            target=worker_main,
+            args=(worker_id, self._jobs, self._results, self._grants[worker_id]),
+            name=f"scrape-worker-{worker_id}",
+            daemon=True,
+        )
+        proc.start()
+        self._workers[worker_id] = proc
+
+    def _join(self, timeout: float) -> None:
+        for proc in self._workers.values():
+            proc.join(timeout)
+            if proc.is_alive():
+                proc.terminate()
+                proc.join(1.0)
+
+    def _read_results(self) -> None:
+        while True:
+            try:
+                message = self._results.get()
+            except (EOFError, OSError, queue.Empty):
+                return
+            if message is None:
+                return
+            self._loop.call_soon_threadsafe(self._handle, message)
+
+    def _handle(self, message: tuple) -> None:
+        kind = message[0]
+        if kind == "partial":
+            if self.on_partial:
+                self.on_partial(message[1], message[2])
+        elif kind == "acquire":
+            task = asyncio.create_task(self._grant_token(*message[1:]))
+            self._grant_tasks.add(task)
+            task.add_done_callback(self._grant_tasks.discard)
+        elif kind == "throttle":
+            self.limiters.get(message[1]).record_throttle()
+        elif kind == "throttle_ok":
+            self.limiters.get(message[1]).record_ok()
+        elif kind == "ready":
+            self._ready.add(message[1])
+            self._crashes.pop(message[1], None)
+        elif kind == "started":
+            self._assigned[message[1]] = message[2]
+        elif kind in ("result", "error"):
+            worker_id, job_id = message[1], message[2]
+            self._assigned.pop(worker_id, None)
+            if kind == "result":
+                self.completed += 1
+                self._resolve(job_id, result=message[3])
+            else:
+                self.failed += 1
+                self._resolve(job_id, error=RuntimeError(message[3]))
+
+    async def _grant_token(self, worker_id: int, request_id: str, provider: str) -> None:
+        await self.limiters.get(provider).acquire()
+        grants = self._grants.get(worker_id)
+        if grants is not None:
+            grants.put(request_id)
+
+    def _resolve(self, job_id: str, result: Any = None, error: Exception | None = None) -> None:
+        future = self._pending.get(job_id)
+        if future is None or future.done():
+            return
+        if error:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    async def _supervise(self) -> None:
+        while not self._stopping:
+            await asyncio.sleep(1.0)
+            now = time.monotonic()
+            for worker_id, proc in list(self._workers.items()):
+                if proc.is_alive() or self._stopping:
+                    continue
+
+                if worker_id not in self._respawn_at:
+                    self._ready.discard(worker_id)
+                    job_id = self._assigned.pop(worker_id, None)
+                    if job_id:
+                        self.failed += 1
+                        self._resolve(job_id, error=RuntimeError(
+                            f"Scrape worker {worker_id} exited (code {proc.exitcode}) during the job"
+                        ))
+                    crashes = self._crashes[worker_id] = self._crashes.get(worker_id, 0) + 1
+                    delay = min(self.MAX_RESTART_DELAY, 2.0 ** (crashes - 1) - 1)
+                    self._respawn_at[worker_id] = now + delay
+                    print(f"Scrape worker {worker_id} exited (code {proc.exitcode}), restarting in {delay:.0f}s")
+
+                if now >= self._respawn_at[worker_id]:
+                    del self._respawn_at[worker_id]
+                    self.restarts += 1
+                    self._spawn(worker_id)
@@ -0,0 +1,37 @@
+import httpx
+
+from .browser_pool import USER_AGENT
+from .config import get_settings
+
+settings = get_settings()
+
+HTTP_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept": "text/html,application/xhtml+xml,application/json;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """
+    Pooled client for the HTTP tier, shared by every scrape in the process.
+
+    Connections are kept alive per host, and multiplexed over HTTP/2 when
+    the `h2` package (httpx[http2]) is installed.
+    """
+    try:
+        import h2  # noqa: F401
+        http2 = True
+    except ImportError:
+        print("h2 not installed, HTTP tier falls back to HTTP/1.1")
+        http2 = False
+    return httpx.AsyncClient(
+        http2=http2,
+        headers=HTTP_HEADERS,
+        timeout=settings.http_timeout,
+        follow_redirects=True,
+        limits=httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_connections,
+        ),
+    )
@@ -0,0 +1,221 @@
+import asyncio
+import itertools
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable
+
+from .config import get_settings
+from .progress import ProgressHub
+
+settings = get_settings()
+
+# Runs one provider and returns (result, cache_meta); must not raise
+ProviderRunner = Callable[[str, float | None], Awaitable[tuple[dict, dict | None]]]
+
+
+@dataclass
+class ScrapeJob:
+    """One queued or finished scrape request."""
+
+    provider: str
+    providers: list[str]
+    max_age: float | None = None
+    priority: int = 0
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    status: str = "queued"  # queued, running, succeeded, failed
+    created_at: datetime = field(default_factory=datetime.now)
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    phase: dict[str, str] = field(default_factory=dict)  # provider -> current browser phase
+    methods: list[dict] = field(default_factory=list)  # extraction methods completed so far
+    duration_ms: float | None = None
+    result: Any = None
+    cache: dict | None = None
+    error: str | None = None
+
+    @property
+    def key(self) -> tuple[str, float | None]:
+        """Identical queued jobs share this key."""
+        return self.provider, self.max_age
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("succeeded", "failed")
+
+    def to_dict(self, include_result: bool = False) -> dict:
+        data = {
+            "id": self.id,
+            "provider": self.provider,
+            "max_age": self.max_age,
+            "priority": self.priority,
+            "status": self.status,
+            "created_at": self.created_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "duration_ms": self.duration_ms,
+            "progress": {
+                "phase": dict(self.phase),
+                "methods": list(self.methods),
+                "last_method": self.methods[-1]["method"] if self.methods else None,
+            },
+            "error": self.error,
+        }
+        if include_result:
+            data["result"] = self.result
+            data["cache"] = self.cache
+        return data
+
+
+class ScrapeJobManager:
+    """
+    Background job queue for long-running scrapes.
+
+    Jobs run in priority order (higher first, FIFO within a priority) on
+    `workers` runner tasks. Submitting a job identical to one still queued
+    returns that job instead (raising its priority if needed). While a job
+    runs it follows the provider's ProgressHub events, so clients polling
+    it can see the browser phase and each extraction method as it lands.
+    Finished jobs are kept in a bounded LRU.
+    """
+
+    def __init__(
+        self,
+        run: ProviderRunner,
+        hub: ProgressHub,
+        workers: int | None = None,
+        max_completed: int | None = None,
+    ):
+        self.run = run
+        self.hub = hub
+        self.workers = max(1, workers or settings.job_workers)
+        self.max_completed = max(1, max_completed or settings.job_max_completed)
+        self._queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self._seq = itertools.count()
+        self._active: dict[str, ScrapeJob] = {}
+        self._queued_by_key: dict[tuple[str, float | None], ScrapeJob] = {}
+        self._completed: OrderedDict[str, ScrapeJob] = OrderedDict()
+        self._tasks: list[asyncio.Task] = []
+        self.submitted = 0
+        self.deduplicated = 0
+
+    def start(self) -> None:
+        """Start the runner tasks."""
+        if not self._tasks:
+            self._tasks = [asyncio.create_task(self._runner()) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        """Cancel the runners; queued jobs are dropped."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def submit(
+        self, provider: str, providers: list[str], max_age: float | None = None, priority: int = 0
+    ) -> tuple[ScrapeJob, bool]:
+        """Queue a job; returns `(job, deduplicated)`."""
+        self.submitted += 1
+        existing = self._queued_by_key.get((provider, max_age))
+        if existing:
+            self.deduplicated += 1
+            if priority > existing.priority:
+                existing.priority = priority
+                self._push(existing)
+            return existing, True
+
+        job = ScrapeJob(provider=provider, providers=providers, max_age=max_age, priority=priority)
+        self._active[job.id] = job
+        self._queued_by_key[job.key] = job
+        self._push(job)
+        return job, False
+
+    def get(self, job_id: str) -> ScrapeJob | None:
+        job = self._active.get(job_id)
+        if job:
+            return job
+        job = self._completed.get(job_id)
+        if job:
+            self._completed.move_to_end(job_id)
+        return job
+
+    def jobs(self) -> list[ScrapeJob]:
+        """Active jobs first (by priority), then recently finished ones."""
+        active = sorted(self._active.values(), key=lambda j: (-j.priority, j.created_at))
+        return active + list(reversed(self._completed.values()))
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "queued": len(self._queued_by_key),
+            "running": sum(1 for job in self._active.values() if job.status == "running"),
+            "completed_retained": len(self._completed),
+            "submitted": self.submitted,
+            "deduplicated": self.deduplicated,
+        }
+
+    def _push(self, job: ScrapeJob) -> None:
+        # Re-prioritised jobs get a new entry; the stale one is skipped on pop
+        self._queue.put_nowait((-job.priority, next(self._seq), job.id, job.priority))
+
+    async def _runner(self) -> None:
+        while True:
+            _, _, job_id, priority = await self._queue.get()
+            job = self._active.get(job_id)
+            if not job or job.status != "queued" or job.priority != priority:
+                continue
+            self._queued_by_key.pop(job.key, None)
+            await self._execute(job)
+
+    async def _execute(self, job: ScrapeJob) -> None:
+        job.status = "running"
+        job.started_at = datetime.now()
+        started = time.perf_counter()
+
+        with self.hub.subscribe(job.providers, items=False) as events:
+            follower = asyncio.create_task(self._follow(job, events))
+            try:
+                outcomes = await asyncio.gather(*[self.run(p, job.max_age) for p in job.providers])
+            except Exception as e:
+                outcomes = [({"provider": p, "success": False, "error": str(e)}, None) for p in job.providers]
+            finally:
+                follower.cancel()
+
+        results = [result for result, _ in outcomes]
+        failures = [r for r in results if not r.get("success")]
+        if len(job.providers) == 1:
+            job.result, job.cache = outcomes[0]
+        else:
+            job.result = results
+            job.cache = {p: meta for p, (_, meta) in zip(job.providers, outcomes) if meta}
+
+        job.status = "failed" if failures and len(failures) == len(results) else "succeeded"
+        if failures:
+            job.error = "; ".join(
+                f"{r.get('provider')}: {r.get('error') or r.get('errors')}" for r in failures
+            )
+        job.finished_at = datetime.now()
+        job.duration_ms = round((time.perf_counter() - started) * 1000, 1)
+        job.phase = {p: "done" for p in job.providers}
+        self._finish(job)
+
+    async def _follow(self, job: ScrapeJob, events: asyncio.Queue) -> None:
+        while True:
+            event = await events.get()
+            if event.get("type") == "phase":
+                job.phase[event["provider"]] = event["phase"]
+            elif event.get("type") == "partial":
+                job.methods.append({
+                    "provider": event["provider"],
+                    "method": event["method"],
+                    "count": event["count"],
+                    "at": datetime.now().isoformat(),
+                })
+
+    def _finish(self, job: ScrapeJob) -> None:
+        self._active.pop(job.id, None)
+        self._completed[job.id] = job
+        while len(self._completed) > self.max_completed:
+            self._completed.popitem(last=False)
@@ -0,0 +1,69 @@
+import asyncio
+import time
+from collections import deque
+
+from .config import get_settings
+
+settings = get_settings()
+
+
+class LoopLagMonitor:
+    """
+    Measures event-loop lag: how late a periodic sleep wakes up.
+
+    Anything that blocks the loop (CPU-bound parsing, sync I/O) shows up as
+    lag; the recent window gives mean/p99/max, and `stalls` counts wakeups
+    later than `stall_threshold` since start.
+    """
+
+    def __init__(
+        self,
+        interval: float | None = None,
+        window: int = 600,
+        stall_threshold: float = 0.1,
+    ):
+        self.interval = settings.loop_lag_interval if interval is None else interval
+        self.stall_threshold = stall_threshold
+        self._samples: deque[float] = deque(maxlen=window)
+        self._task: asyncio.Task | None = None
+        self.max_lag = 0.0
+        self.stalls = 0
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            expected = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            self.record(max(0.0, time.perf_counter() - expected))
+
+    def record(self, lag: float) -> None:
+        self._samples.append(lag)
+        self.max_lag = max(self.max_lag, lag)
+        if lag >= self.stall_threshold:
+            self.stalls += 1
+
+    def stats(self) -> dict:
+        """Lag over the recent window, in milliseconds."""
+        samples = sorted(self._samples)
+        if not samples:
+            return {"samples": 0}
+        return {
+            "samples": len(samples),
+            "mean_ms": round(sum(samples) / len(samples) * 1000, 3),
+            "p99_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1000, 3),
+            "window_max_ms": round(samples[-1] * 1000, 3),
+            "max_ms": round(self.max_lag * 1000, 3),
+            "stalls": self.stalls,
+        }
@@ -1,31 +1,168 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from playwright.async_api import async_playwright
 
+from .browser_pool import BrowserPool
+from .fleet import ScrapeFleet
+from .http_client import create_http_client
+from .jobs import ScrapeJobManager
+from .loop_monitor import LoopLagMonitor
+from .metrics import REGISTRY
 from .config import get_settings
-from .dependencies import set_playwright, get_playwright
-from .routers import scraper_router
+from .dependencies import (
+    set_playwright,
+    set_browser_pool,
+    get_browser_pool,
+    set_http_client,
+    get_http_client,
+    set_scheduler,
+    get_scheduler,
+    set_snapshot_store,
+    get_snapshot_store,
+    set_parse_pool,
+    get_parse_pool,
+    set_loop_monitor,
+    get_loop_monitor,
+    set_scrape_fleet,
+    get_scrape_fleet,
+    get_progress_hub,
+    get_scrape_flights,
+    get_rate_limiters,
+    set_job_manager,
+    get_job_manager,
+)
+from .routers import games_router, jobs_router, scraper_router, snapshot_router
+from .scheduler import ScrapeScheduler
+from .scrape_service import refresh_provider, run_provider
+from .scrapers import SCRAPERS
+from .store import SQLiteSnapshotRepository
 
 settings = get_settings()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Manage application lifecycle - start/stop Playwright."""
-    # Startup: Initialize Playwright
-    pw = await async_playwright().start()
-    set_playwright(pw)
-    print("Playwright initialized")
+    """Manage application lifecycle - start/stop Playwright, the browser and parse pools, HTTP client, store and scheduler."""
+    monitor = LoopLagMonitor()
+    monitor.start()
+    set_loop_monitor(monitor)
+
+    # Startup: Parse workers are spawned (not forked) so they never inherit
+    # the Playwright driver or the event loop
+    if settings.parse_workers > 0:
+        set_parse_pool(ProcessPoolExecutor(
+            max_workers=settings.parse_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        ))
+        print(f"Parse pool started ({settings.parse_workers} processes)")
+
+    pw = None
+    if settings.scrape_workers > 0:
+        # Worker mode: each fleet process owns its own Playwright and browsers,
+        # so this process never starts a browser
+        fleet = ScrapeFleet(on_partial=get_progress_hub().publish, limiters=get_rate_limiters())
+        await fleet.start()
+        set_scrape_fleet(fleet)
+        print(f"Scrape fleet started ({fleet.size} workers)")
+    else:
+        # Startup: Initialize Playwright
+        pw = await async_playwright().start()
+        set_playwright(pw)
+        print("Playwright initialized")
+
+        # Warm the shared browser pool so scrapes only pay for a new context
+        pool = BrowserPool(pw)
+        await pool.start()
+        set_browser_pool(pool)
+        print(f"Browser pool started ({pool.size} browsers)")
+
+        # Scrapes try plain HTTP on one pooled client before taking a browser
+        if settings.http_fast_path:
+            set_http_client(create_http_client())
+            print("HTTP tier client started")
+
+    # Open the snapshot store before anything can produce results
+    if settings.store_enabled:
+        store = SQLiteSnapshotRepository()
+        set_snapshot_store(store)
+        print(f"Snapshot store opened ({store.path})")
+
+    # Run fire-and-poll scrape jobs in the background
+    jobs = ScrapeJobManager(run_provider, get_progress_hub())
+    jobs.start()
+    set_job_manager(jobs)
+
+    # Keep provider snapshots warm so requests never wait on a browser
+    if settings.scheduler_enabled:
+        scheduler = ScrapeScheduler(list(SCRAPERS), refresh_provider)
+        scheduler.start()
+        set_scheduler(scheduler)
+        print(f"Scrape scheduler started ({len(SCRAPERS)} providers)")
 
     yield
 
-    # Shutdown: Close Playwright
-    playwright = get_playwright()
-    if playwright:
-        await playwright.stop()
+    # Shutdown: Stop scheduled scrapes before tearing down browsers
+    scheduler = get_scheduler()
+    if scheduler:
+        await scheduler.stop()
+        set_scheduler(None)
+        print("Scrape scheduler stopped")
+
+    jobs = get_job_manager()
+    if jobs:
+        await jobs.stop()
+        set_job_manager(None)
+
+    # Workers may still deliver results that get stored, so stop them first
+    # and let the scrapes waiting on them save what they got
+    fleet = get_scrape_fleet()
+    if fleet:
+        await fleet.stop()
+        await get_scrape_flights().drain(timeout=5.0)
+        set_scrape_fleet(None)
+        print("Scrape fleet stopped")
+
+    # Shutdown: Close the store once nothing can write to it
+    store = get_snapshot_store()
+    if store:
+        store.close()
+        set_snapshot_store(None)
+        print("Snapshot store closed")
+
+    http_client = get_http_client()
+    if http_client:
+        await http_client.aclose()
+        set_http_client(None)
+        print("HTTP tier client closed")
+
+    # Shutdown: Close the pool before Playwright
+    pool = get_browser_pool()
+    if pool:
+        await pool.close()
+        set_browser_pool(None)
+        print("Browser pool closed")
+
+    # Shutdown: Close Playwright (not started in worker mode)
+    if pw:
+        await pw.stop()
+        set_playwright(None)
         print("Playwright stopped")
 
+    parse_pool = get_parse_pool()
+    if parse_pool:
+        parse_pool.shutdown(cancel_futures=True)
+        set_parse_pool(None)
+        print("Parse pool stopped")
+
+    monitor = get_loop_monitor()
+    if monitor:
+        await monitor.stop()
+        set_loop_monitor(None)
+
 
 app = FastAPI(
     title=settings.app_name,
@@ -45,6 +182,9 @@ app.add_middleware(
 
 # Include routers
 app.include_router(scraper_router.router, prefix="/api/scrapers", tags=["scrapers"])
+app.include_router(snapshot_router.router, prefix="/api/snapshots", tags=["snapshots"])
+app.include_router(games_router.router, prefix="/api/games", tags=["games"])
+app.include_router(jobs_router.router, prefix="/api/scrape-jobs", tags=["scrape-jobs"])
 
 
 @app.get("/")
@@ -56,12 +196,21 @@ async def root():
 @app.get("/health")
 async def health():
     """Detailed health check."""
-    from .dependencies import playwright_instance
+    from .dependencies import playwright_instance, browser_pool, loop_monitor, scrape_fleet
     return {
         "status": "healthy",
         "playwright": playwright_instance is not None,
+        "browser_pool": browser_pool.stats() if browser_pool else None,
+        "scrape_fleet": scrape_fleet.stats() if scrape_fleet else None,
+        "event_loop_lag": loop_monitor.stats() if loop_monitor else None,
         "settings": {
             "headless": settings.browser_headless,
             "timeout": settings.browser_timeout,
         },
     }
+
+
+@app.get("/metrics")
+async def metrics():
+    """Prometheus metrics: scrape phase and method timings, item counts, errors."""
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
@@ -0,0 +1,181 @@
+"""
+Minimal in-process metrics with Prometheus text exposition.
+
+Counters and histograms are registered at import time below and rendered
+by `/metrics`. Labels are passed as keyword arguments; each distinct label
+set is its own series.
+"""
+import math
+import threading
+from bisect import bisect_left
+from typing import Iterable
+
+# Seconds; spans sub-millisecond parsing up to whole scrapes
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+LabelKey = tuple[tuple[str, str], ...]
+
+
+def _label_key(labels: dict[str, str]) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(key: LabelKey, extra: tuple[tuple[str, str], ...] = ()) -> str:
+    pairs = key + extra
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    type = ""
+
+    def __init__(self, name: str, help: str):
+        self.name = name
+        self.help = help
+        self._lock = threading.Lock()
+
+    def header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type}"]
+
+    def render(self) -> list[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing count per label set."""
+
+    type = "counter"
+
+    def __init__(self, name: str, help: str):
+        super().__init__(name, help)
+        self._values: dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(_label_key(labels), 0.0)
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return self.header() + [f"{self.name}{_format_labels(k)} {_format_value(v)}" for k, v in items]
+
+
+class Histogram(_Metric):
+    """Cumulative-bucket histogram per label set."""
+
+    type = "histogram"
+
+    def __init__(self, name: str, help: str, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        super().__init__(name, help)
+        self.buckets = tuple(sorted(buckets))
+        self._series: dict[LabelKey, list] = {}  # key -> [bucket counts..., sum, count]
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = _label_key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0] * (len(self.buckets) + 1) + [0.0, 0]
+            series[index] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def count(self, **labels: str) -> int:
+        series = self._series.get(_label_key(labels))
+        return series[-1] if series else 0
+
+    def render(self) -> list[str]:
+        lines = self.header()
+        with self._lock:
+            items = sorted((k, list(v)) for k, v in self._series.items())
+        for key, series in items:
+            cumulative = 0
+            for bound, hits in zip(self.buckets + (math.inf,), series):
+                cumulative += hits
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(key, (('le', _format_value(bound)),))} {cumulative}"
+                )
+            lines.append(f"{self.name}_sum{_format_labels(key)} {_format_value(series[-2])}")
+            lines.append(f"{self.name}_count{_format_labels(key)} {series[-1]}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: list[_Metric] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+SCRAPE_DURATION = REGISTRY.register(Histogram(
+    "scraper_scrape_duration_seconds", "Wall time of a whole scrape, by provider."
+))
+SCRAPE_PHASE = REGISTRY.register(Histogram(
+    "scraper_phase_duration_seconds",
+    "Time per scrape phase (http, launch, context, navigate, readiness, extract, parse), by provider.",
+))
+METHOD_DURATION = REGISTRY.register(Histogram(
+    "scraper_method_duration_seconds", "Time per extraction method, by provider and method."
+))
+METHOD_ITEMS = REGISTRY.register(Counter(
+    "scraper_method_items_total", "Items found per extraction method, by provider and method."
+))
+SCRAPES = REGISTRY.register(Counter(
+    "scraper_scrapes_total", "Scrapes run, by provider and outcome."
+))
+SCRAPE_TIERS = REGISTRY.register(Counter(
+    "scraper_tier_total", "Scrapes served per tier (http or browser), by provider."
+))
+SCRAPE_ERRORS = REGISTRY.register(Counter(
+    "scraper_errors_total", "Scrape errors, by provider and kind."
+))
+BROWSER_LAUNCH = REGISTRY.register(Histogram(
+    "browser_pool_launch_duration_seconds", "Time to launch a pooled browser."
+))
+SERIALIZATION = REGISTRY.register(Histogram(
+    "response_serialization_duration_seconds", "Time to encode a response body, by path (default or fast)."
+))
+
+
+def observe_scrape(provider: str, result: dict, duration: float) -> None:
+    """Record a finished scrape's timings, per-method counts and outcome."""
+    SCRAPE_DURATION.observe(duration, provider=provider)
+    for phase, ms in (result.get("timings_ms") or {}).items():
+        SCRAPE_PHASE.observe(ms / 1000, provider=provider, phase=phase)
+    for method, stats in (result.get("methods") or {}).items():
+        METHOD_DURATION.observe(stats["ms"] / 1000, provider=provider, method=method)
+        METHOD_ITEMS.inc(stats["count"], provider=provider, method=method)
+
+    if result.get("tier"):
+        SCRAPE_TIERS.inc(provider=provider, tier=result["tier"])
+
+    success = bool(result.get("success"))
+    SCRAPES.inc(provider=provider, outcome="success" if success else "failure")
+    if not success:
+        SCRAPE_ERRORS.inc(provider=provider, kind="scrape_failed")
@@ -0,0 +1,48 @@
+import asyncio
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+
+class ProgressHub:
+    """
+    Fan-out of in-progress scrape events, keyed by provider.
+
+    Scrapers publish as each extraction method finishes; streaming
+    endpoints subscribe to the providers they are waiting on. Publishing
+    with nobody subscribed is a no-op, so scrapers can check
+    `has_subscribers` before building an expensive event, and
+    `wants_items` before serializing the items that go with it.
+    """
+
+    def __init__(self):
+        # provider -> {queue: whether it wants partial items or just counts}
+        self._subscribers: dict[str, dict[asyncio.Queue, bool]] = {}
+
+    def has_subscribers(self, provider: str) -> bool:
+        return bool(self._subscribers.get(provider))
+
+    def wants_items(self, provider: str) -> bool:
+        return any(self._subscribers.get(provider, {}).values())
+
+    def publish(self, provider: str, event: dict[str, Any]) -> None:
+        for queue in self._subscribers.get(provider, ()):
+            queue.put_nowait(event)
+
+    @contextmanager
+    def subscribe(self, providers: list[str], items: bool = True) -> Iterator[asyncio.Queue]:
+        """
+        Yield one queue receiving events for all `providers` until exit.
+        Without `items`, partial events may arrive with counts only.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        for provider in providers:
+            self._subscribers.setdefault(provider, {})[queue] = items
+        try:
+            yield queue
+        finally:
+            for provider in providers:
+                subscribers = self._subscribers.get(provider)
+                if subscribers:
+                    subscribers.pop(queue, None)
+                    if not subscribers:
+                        del self._subscribers[provider]
@@ -0,0 +1,205 @@
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+
+from .config import get_settings
+
+settings = get_settings()
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of scraping a provider whose circuit is open."""
+
+    def __init__(self, provider: str, retry_in: float):
+        super().__init__(f"{provider} is unhealthy; not scraping for another {retry_in:.0f}s")
+        self.provider = provider
+        self.retry_in = retry_in
+
+
+class TokenBucket:
+    """Classic token bucket: `rate` tokens per second, holding at most `burst`."""
+
+    def __init__(self, rate: float, burst: int):
+        if rate <= 0:
+            raise ValueError(f"Token bucket rate must be positive, got {rate}")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self) -> float:
+        """Take one token, waiting for it if necessary; returns seconds waited."""
+        waited = 0.0
+        # The lock keeps waiters in arrival order
+        async with self._lock:
+            self._refill()
+            if self.tokens < 1:
+                wait = (1 - self.tokens) / self.rate
+                await asyncio.sleep(wait)
+                waited = wait
+                self._refill()
+            self.tokens -= 1
+        return waited
+
+
+@dataclass
+class CircuitBreaker:
+    """
+    Opens after `threshold` consecutive failures and fails fast until
+    `reset_timeout` has passed. Then one trial call is let through
+    (half-open): success closes the circuit, failure re-opens it.
+    """
+
+    threshold: int
+    reset_timeout: float
+    failures: int = 0
+    opened_at: float | None = None
+    trial_in_flight: bool = False
+    opens: int = 0
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def retry_in(self) -> float:
+        if self.opened_at is None:
+            return 0.0
+        return max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self.trial_in_flight:
+            self.trial_in_flight = True
+            return True
+        return False
+
+    def cancel_trial(self) -> None:
+        """The trial call was abandoned without an outcome."""
+        self.trial_in_flight = False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self.trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self.trial_in_flight = False
+        if self.opened_at is not None or self.failures >= self.threshold:
+            if self.opened_at is None:
+                self.opens += 1
+            self.opened_at = time.monotonic()
+
+
+class ProviderLimiter:
+    """
+    Rate limiting and failure handling for one provider, shared by every
+    concurrent scrape of it.
+
+    Navigations take a token from the bucket. Throttling signals (HTTP 429
+    or 5xx, failed navigations) push a shared cool-down that grows
+    exponentially with full jitter while they keep coming, so all scrapes
+    of the provider back off together. Whole-scrape outcomes feed the
+    circuit breaker.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        rate: float | None = None,
+        burst: int | None = None,
+        backoff_base: float | None = None,
+        backoff_max: float | None = None,
+        failure_threshold: int | None = None,
+        reset_timeout: float | None = None,
+    ):
+        self.provider = provider
+        per_minute = settings.rate_limit_overrides.get(provider, settings.rate_limit_per_minute)
+        self.bucket = TokenBucket(
+            rate if rate is not None else per_minute / 60,
+            burst if burst is not None else settings.rate_limit_burst,
+        )
+        self.backoff_base = settings.backoff_base if backoff_base is None else backoff_base
+        self.backoff_max = settings.backoff_max if backoff_max is None else backoff_max
+        self.breaker = CircuitBreaker(
+            threshold=failure_threshold or settings.circuit_failure_threshold,
+            reset_timeout=settings.circuit_reset_timeout if reset_timeout is None else reset_timeout,
+        )
+        self.throttle_streak = 0
+        self.cooldown_until = 0.0
+        self.throttles = 0
+        self.waited = 0.0
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for the given retry attempt (0-based)."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    async def acquire(self) -> None:
+        """Wait out any shared cool-down, then take a token."""
+        if not settings.rate_limit_enabled:
+            return
+        cooldown = self.cooldown_until - time.monotonic()
+        if cooldown > 0:
+            await asyncio.sleep(cooldown)
+            self.waited += cooldown
+        # Read the wait first: `+=` around the await would drop concurrent waiters' time
+        waited = await self.bucket.acquire()
+        self.waited += waited
+
+    def record_throttle(self) -> float:
+        """Note a 429/5xx or failed navigation; returns the cool-down applied."""
+        self.throttles += 1
+        delay = self.backoff_delay(self.throttle_streak)
+        self.throttle_streak += 1
+        self.cooldown_until = max(self.cooldown_until, time.monotonic() + delay)
+        return delay
+
+    def record_ok(self) -> None:
+        """A navigation went through: stop escalating the back-off."""
+        self.throttle_streak = 0
+
+    def check_circuit(self) -> None:
+        """Raise CircuitOpenError unless a scrape may run now."""
+        if not self.breaker.allow():
+            raise CircuitOpenError(self.provider, self.breaker.retry_in())
+
+    def stats(self) -> dict:
+        return {
+            "tokens": round(self.bucket.tokens, 2),
+            "rate_per_minute": round(self.bucket.rate * 60, 2),
+            "cooldown_seconds": round(max(0.0, self.cooldown_until - time.monotonic()), 2),
+            "throttles": self.throttles,
+            "waited_seconds": round(self.waited, 2),
+            "circuit": self.breaker.state,
+            "consecutive_failures": self.breaker.failures,
+            "circuit_opens": self.breaker.opens,
+        }
+
+
+class RateLimiterRegistry:
+    """One ProviderLimiter per provider, created on first use."""
+
+    def __init__(self):
+        self._limiters: dict[str, ProviderLimiter] = {}
+
+    def get(self, provider: str) -> ProviderLimiter:
+        limiter = self._limiters.get(provider)
+        if limiter is None:
+            limiter = self._limiters[provider] = ProviderLimiter(provider)
+        return limiter
+
+    def stats(self) -> dict:
+        return {provider: limiter.stats() for provider, limiter in self._limiters.items()}
@@ -0,0 +1,66 @@
+import time
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query
+
+from ..dependencies import get_result_cache, get_snapshot_search
+from ..models.poker import GameVariant, Provider
+from ..scrapers import SCRAPERS
+from ..search import TournamentQuery
+from .scraper_router import ScrapeResponse, make_response
+
+router = APIRouter()
+
+
+@router.get("/search", response_model=ScrapeResponse)
+async def search_games(
+    provider: Optional[Provider] = Query(None),
+    variant: Optional[GameVariant] = Query(None),
+    min_buy_in: Optional[int] = Query(None, ge=0, description="Minimum buy-in in cents"),
+    max_buy_in: Optional[int] = Query(None, ge=0, description="Maximum buy-in in cents"),
+    min_guaranteed: Optional[int] = Query(None, ge=0, description="Minimum guaranteed prize in cents"),
+    start_after: Optional[datetime] = Query(None),
+    start_before: Optional[datetime] = Query(None),
+    late_reg_open: Optional[bool] = Query(None),
+    limit: int = Query(50, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+):
+    """
+    Search tournaments in the latest cached snapshot of every provider.
+
+    Never scrapes: providers without a cached result are simply absent.
+    Results are ordered by start time, then buy-in; pass `meta.next_cursor`
+    back as **cursor** for the next page.
+    """
+    started = time.perf_counter()
+    cache = get_result_cache()
+    search = get_snapshot_search()
+    index = search.index(cache, SCRAPERS)
+
+    query = TournamentQuery(
+        provider=provider.value if provider else None,
+        variant=variant.value if variant else None,
+        min_buy_in=min_buy_in,
+        max_buy_in=max_buy_in,
+        min_guaranteed=min_guaranteed,
+        start_after=start_after,
+        start_before=start_before,
+        late_reg_open=late_reg_open,
+    )
+    try:
+        tournaments, next_cursor = index.search(query, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return make_response(
+        success=True,
+        data=tournaments,
+        meta={
+            "count": len(tournaments),
+            "indexed": len(index),
+            "next_cursor": next_cursor,
+            "snapshots": search.snapshot_times(cache),
+            "query_ms": round((time.perf_counter() - started) * 1000, 3),
+        },
+    )
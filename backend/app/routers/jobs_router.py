@@ -0,0 +1,68 @@
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, Field
+
+from ..dependencies import get_job_manager
+from ..jobs import ScrapeJobManager
+from ..scrapers import SCRAPERS
+from .scraper_router import ProviderParam
+
+router = APIRouter()
+
+
+class ScrapeJobRequest(BaseModel):
+    """Request model for queueing a scrape job."""
+
+    provider: ProviderParam = ProviderParam.all
+    priority: int = Field(0, ge=-100, le=100, description="Higher runs first")
+    max_age: Optional[float] = Field(
+        None, ge=0, description="Maximum age in seconds of cached data; 0 forces a fresh scrape"
+    )
+
+
+def _require_manager() -> ScrapeJobManager:
+    manager = get_job_manager()
+    if manager is None:
+        raise HTTPException(status_code=503, detail="Scrape jobs are not running")
+    return manager
+
+
+@router.post("", status_code=202)
+async def create_job(request: ScrapeJobRequest):
+    """
+    Queue a scrape and return its job id straight away.
+
+    An identical job (same provider and max_age) that is still queued is
+    returned instead of a new one. Poll `GET /api/scrape-jobs/{id}`.
+    """
+    manager = _require_manager()
+    providers = list(SCRAPERS) if request.provider == ProviderParam.all else [request.provider.value]
+    job, deduplicated = manager.submit(
+        request.provider.value, providers, max_age=request.max_age, priority=request.priority
+    )
+    return JSONResponse(
+        status_code=200 if deduplicated else 202,
+        content={"job": job.to_dict(), "deduplicated": deduplicated},
+        headers={"Location": f"/api/scrape-jobs/{job.id}"},
+    )
+
+
+@router.get("")
+async def list_jobs(limit: int = Query(50, ge=1, le=500)):
+    """Active jobs (highest priority first) followed by recently finished ones."""
+    manager = _require_manager()
+    return {
+        "stats": manager.stats(),
+        "jobs": [job.to_dict() for job in manager.jobs()[:limit]],
+    }
+
+
+@router.get("/{job_id}")
+async def get_job(job_id: str):
+    """Job status and progress; includes the result once it has finished."""
+    job = _require_manager().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown or expired job: {job_id}")
+    return job.to_dict(include_result=job.finished)
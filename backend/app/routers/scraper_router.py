@@ -1,11 +1,37 @@
+import asyncio
+import json
+import time
+
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
 from typing import Optional
 from enum import Enum
 
-from ..dependencies import get_playwright
-from ..models.poker import Provider, ScraperResult, GameType
-from ..scrapers import ClubGGScraper, GGPokerScraper, PokerStarsScraper
+from ..config import get_settings
+from ..dependencies import (
+    get_playwright,
+    get_browser_pool,
+    get_result_cache,
+    get_scrape_flights,
+    get_scheduler,
+    get_progress_hub,
+    get_loop_monitor,
+    get_scrape_fleet,
+    get_rate_limiters,
+    get_session_store,
+    get_change_detector,
+)
+from ..metrics import SERIALIZATION
+from ..models.poker import GameType
+from ..ratelimit import CircuitOpenError
+from ..scrape_service import fetch_provider, run_provider
+from ..scrapers import SCRAPERS
+from ..serialization import FastJSONResponse, encode_json
+
+settings = get_settings()
 
 router = APIRouter()
 
@@ -34,17 +60,23 @@ class ScrapeResponse(BaseModel):
     meta: Optional[dict] = None
 
 
-def get_scraper(provider: ProviderParam, playwright):
-    """Factory function to get the appropriate scraper."""
-    scrapers = {
-        ProviderParam.clubgg: ClubGGScraper,
-        ProviderParam.ggpoker: GGPokerScraper,
-        ProviderParam.pokerstars: PokerStarsScraper,
-    }
-    scraper_class = scrapers.get(provider)
-    if scraper_class:
-        return scraper_class(playwright)
-    return None
+def make_response(**fields) -> JSONResponse:
+    """
+    Build and encode a ScrapeResponse for a route to return.
+
+    With fast serialization enabled, the data is trusted internal output, so
+    the envelope is built without validation and encoded in a single pass.
+    Either way the encoding time is recorded per path.
+    """
+    started = time.perf_counter()
+    if settings.fast_serialization:
+        response = FastJSONResponse(ScrapeResponse.model_construct(**fields))
+        path = "fast"
+    else:
+        response = JSONResponse(jsonable_encoder(ScrapeResponse(**fields)))
+        path = "default"
+    SERIALIZATION.observe(time.perf_counter() - started, path=path)
+    return response
 
 
 @router.get("/providers")
@@ -74,11 +106,161 @@ async def list_providers():
     }
 
 
+@router.get("/stats")
+async def scrape_stats():
+    """Cache, coalescing, rate limit, browser pool, worker fleet, session, change detection and event-loop lag counters."""
+    pool = get_browser_pool()
+    fleet = get_scrape_fleet()
+    monitor = get_loop_monitor()
+    sessions = get_session_store()
+    detector = get_change_detector()
+    return {
+        "cache": get_result_cache().stats(),
+        "coalescing": get_scrape_flights().stats(),
+        "rate_limits": get_rate_limiters().stats(),
+        "browser_pool": pool.stats() if pool else None,
+        "scrape_fleet": fleet.stats() if fleet else None,
+        "sessions": await asyncio.to_thread(sessions.stats) if sessions else None,
+        "change_detection": detector.stats() if detector else None,
+        "event_loop_lag": monitor.stats() if monitor else None,
+    }
+
+
+@router.get("/schedules")
+async def list_schedules():
+    """Background refresh schedule and last-run status per provider."""
+    scheduler = get_scheduler()
+    return {
+        "enabled": scheduler is not None,
+        "schedules": scheduler.schedules() if scheduler else [],
+    }
+
+
+@router.post("/schedules/{provider}/run")
+async def run_schedule(
+    provider: ProviderParam,
+    wait: bool = Query(False, description="Wait for the refresh to finish"),
+):
+    """
+    Trigger an immediate background refresh of a provider.
+
+    With **wait**, the refresh runs in this request and the updated status
+    is returned; otherwise the provider's loop is woken and this returns
+    straight away.
+    """
+    scheduler = get_scheduler()
+    if not scheduler:
+        raise HTTPException(status_code=503, detail="Scheduler is not running")
+    if not scheduler.get(provider.value):
+        raise HTTPException(status_code=404, detail=f"No schedule for provider: {provider.value}")
+
+    if wait:
+        state = await scheduler.run_now(provider.value)
+        return {"triggered": True, "schedule": state.to_dict()}
+
+    scheduler.trigger(provider.value)
+    return {"triggered": True, "schedule": scheduler.get(provider.value).to_dict()}
+
+
+class StreamFormat(str, Enum):
+    """Wire formats for the streaming endpoint."""
+
+    ndjson = "ndjson"
+    sse = "sse"
+
+
+STREAM_MEDIA_TYPES = {
+    StreamFormat.ndjson: "application/x-ndjson",
+    StreamFormat.sse: "text/event-stream",
+}
+
+
+def _encode_frame(frame: dict, format: StreamFormat) -> str:
+    if settings.fast_serialization:
+        payload = encode_json(frame).decode()
+    else:
+        # Same datetime form as the REST routes, which encode through pydantic
+        payload = json.dumps(to_jsonable_python(frame))
+    if format == StreamFormat.sse:
+        return f"event: {frame['type']}\ndata: {payload}\n\n"
+    return payload + "\n"
+
+
+@router.get("/stream")
+async def stream_providers(
+    providers: Optional[list[ProviderParam]] = Query(None, description="Providers to include (default: all)"),
+    format: StreamFormat = Query(StreamFormat.ndjson, description="'ndjson' or 'sse'"),
+    partial: bool = Query(True, description="Also emit per-extraction-method partial batches"),
+    max_age: Optional[float] = Query(
+        None, ge=0, description="Maximum age in seconds of cached data; 0 forces a fresh scrape"
+    ),
+):
+    """
+    Stream provider results as they complete.
+
+    Emits a `result` frame per provider the moment it is ready (fastest
+    first), optional `partial` frames while a fresh scrape is still running,
+    and a final `summary` frame.
+    """
+    selected = list(dict.fromkeys(p.value for p in (providers or []) if p != ProviderParam.all))
+    if not selected:
+        selected = list(SCRAPERS)
+
+    async def frames():
+        started = time.perf_counter()
+        hub = get_progress_hub()
+        failed = 0
+        with hub.subscribe(selected if partial else []) as events:
+            tasks = {asyncio.create_task(run_provider(p, max_age)): p for p in selected}
+            pending = set(tasks)
+            next_event: asyncio.Task | None = None
+            try:
+                while pending:
+                    if partial and next_event is None:
+                        next_event = asyncio.create_task(events.get())
+                    waiting = pending | ({next_event} if next_event else set())
+                    done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+
+                    if next_event in done:
+                        yield _encode_frame(next_event.result(), format)
+                        next_event = None
+
+                    for task in done & pending:
+                        pending.discard(task)
+                        result, cache_meta = task.result()
+                        if not result.get("success"):
+                            failed += 1
+                        yield _encode_frame({
+                            "type": "result",
+                            "provider": tasks[task],
+                            "data": result,
+                            "meta": cache_meta,
+                        }, format)
+            finally:
+                # Client went away or we're done; shared scrapes keep running
+                if next_event:
+                    next_event.cancel()
+                for task in pending:
+                    task.cancel()
+
+        yield _encode_frame({
+            "type": "summary",
+            "providers": selected,
+            "providers_failed": failed,
+            "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+        }, format)
+
+    return StreamingResponse(frames(), media_type=STREAM_MEDIA_TYPES[format])
+
+
 @router.get("/{provider}")
 async def scrape_provider(
     provider: ProviderParam,
     game_type: Optional[GameType] = Query(None, description="Filter by game type"),
     format: Optional[str] = Query("full", description="Response format: 'full' or 'minimal'"),
+    max_age: Optional[float] = Query(
+        None, ge=0, description="Maximum age in seconds of cached data; 0 forces a fresh scrape"
+    ),
 ):
     """
     Scrape data from a specific provider.
@@ -86,37 +268,38 @@ async def scrape_provider(
     - **provider**: The provider to scrape (clubgg, ggpoker, pokerstars, all)
     - **game_type**: Optional filter for CASH or TOURNAMENT games
     - **format**: Response format - 'full' includes raw data, 'minimal' is condensed
+    - **max_age**: Optional freshness bound for cached results, in seconds
     """
     try:
-        playwright = get_playwright()
-
         if provider == ProviderParam.all:
-            # Scrape all providers
-            results = []
-            for p in [ProviderParam.clubgg, ProviderParam.ggpoker, ProviderParam.pokerstars]:
-                scraper = get_scraper(p, playwright)
-                if scraper:
-                    try:
-                        result = await scraper.run()
-                        results.append(result)
-                    except Exception as e:
-                        results.append({
-                            "provider": p.value,
-                            "success": False,
-                            "error": str(e),
-                        })
-
-            return ScrapeResponse(
+            # Fetch all providers concurrently, bounded by the scrape semaphore
+            started = time.perf_counter()
+            providers = [ProviderParam.clubgg, ProviderParam.ggpoker, ProviderParam.pokerstars]
+            outcomes = await asyncio.gather(*[
+                run_provider(p.value, max_age)
+                for p in providers
+            ])
+            results = [result for result, _ in outcomes]
+
+            return make_response(
                 success=True,
                 data=results,
-                meta={"providers_scraped": len(results)},
+                meta={
+                    "providers_scraped": len(results),
+                    "providers_failed": sum(1 for r in results if not r.get("success")),
+                    "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+                    "cache": {
+                        p.value: cache_meta
+                        for p, (_, cache_meta) in zip(providers, outcomes)
+                        if cache_meta
+                    },
+                },
             )
 
-        scraper = get_scraper(provider, playwright)
-        if not scraper:
+        if provider.value not in SCRAPERS:
             raise HTTPException(status_code=400, detail=f"Unknown provider: {provider}")
 
-        result = await scraper.run()
+        result, cache_meta = await fetch_provider(provider.value, max_age=max_age)
 
         # Filter by game type if specified
         if game_type and isinstance(result, dict):
@@ -135,15 +318,22 @@ async def scrape_provider(
             result.pop("raw_html", None)
             result.pop("raw_data", None)
 
-        return ScrapeResponse(
+        return make_response(
             success=True,
             data=result,
             meta={
                 "provider": provider.value,
                 "game_type_filter": game_type.value if game_type else None,
+                **cache_meta,
             },
         )
 
+    except HTTPException:
+        raise
+    except CircuitOpenError as e:
+        raise HTTPException(
+            status_code=503, detail=str(e), headers={"Retry-After": str(int(e.retry_in) + 1)}
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -154,15 +344,25 @@ async def test_browser():
     Test endpoint to verify browser automation is working.
     """
     try:
-        playwright = get_playwright()
-        browser = await playwright.chromium.launch(headless=True)
-        context = await browser.new_context()
-        page = await context.new_page()
+        pool = get_browser_pool()
+        if pool:
+            context = await pool.new_context()
+            try:
+                page = await context.new_page()
+                await page.goto("https://example.com")
+                title = await page.title()
+            finally:
+                await pool.release(context)
+        else:
+            playwright = get_playwright()
+            browser = await playwright.chromium.launch(headless=True)
+            context = await browser.new_context()
+            page = await context.new_page()
 
-        await page.goto("https://example.com")
-        title = await page.title()
+            await page.goto("https://example.com")
+            title = await page.title()
 
-        await browser.close()
+            await browser.close()
 
         return {
             "success": True,
@@ -0,0 +1,63 @@
+import asyncio
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query
+
+from ..dependencies import get_snapshot_store
+from ..models.poker import GameVariant, Provider
+from ..store import SnapshotRepository
+from .scraper_router import ScrapeResponse, make_response
+
+router = APIRouter()
+
+
+def _require_store() -> SnapshotRepository:
+    store = get_snapshot_store()
+    if store is None:
+        raise HTTPException(status_code=503, detail="Snapshot store is not enabled")
+    return store
+
+
+@router.get("/tournaments", response_model=ScrapeResponse)
+async def query_tournaments(
+    provider: Optional[Provider] = Query(default=None),
+    variant: Optional[GameVariant] = Query(default=None),
+    min_buy_in: Optional[int] = Query(default=None, ge=0, description="Minimum buy-in in cents"),
+    max_buy_in: Optional[int] = Query(default=None, ge=0, description="Maximum buy-in in cents"),
+    start_after: Optional[datetime] = Query(default=None),
+    start_before: Optional[datetime] = Query(default=None),
+    seen_since: Optional[datetime] = Query(default=None, description="Only tournaments seen since this time"),
+    limit: int = Query(default=100, ge=1, le=1000),
+    offset: int = Query(default=0, ge=0),
+):
+    """
+    Query stored tournaments across all scrapes without touching a browser.
+
+    Results are ordered by start time, then buy-in.
+    """
+    store = _require_store()
+    tournaments = await asyncio.to_thread(
+        store.query_tournaments,
+        provider=provider.value if provider else None,
+        variant=variant.value if variant else None,
+        min_buy_in=min_buy_in,
+        max_buy_in=max_buy_in,
+        start_after=start_after,
+        start_before=start_before,
+        seen_since=seen_since,
+        limit=limit,
+        offset=offset,
+    )
+    return make_response(
+        success=True,
+        data=tournaments,
+        meta={"count": len(tournaments), "limit": limit, "offset": offset},
+    )
+
+
+@router.get("/scrapes")
+async def latest_scrapes(limit: int = Query(default=20, ge=1, le=500)):
+    """Most recent scrapes written to the store."""
+    store = _require_store()
+    return {"scrapes": await asyncio.to_thread(store.latest_scrapes, limit)}
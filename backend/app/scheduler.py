@@ -0,0 +1,144 @@
+import asyncio
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable
+
+from .config import get_settings
+
+settings = get_settings()
+
+
+@dataclass
+class ScheduleState:
+    """Schedule and last-run bookkeeping for one provider."""
+
+    provider: str
+    interval: float
+    status: str = "pending"  # 'pending', 'running', 'ok', 'failed'
+    runs: int = 0
+    failures: int = 0
+    next_run_at: datetime | None = None
+    last_started_at: datetime | None = None
+    last_finished_at: datetime | None = None
+    last_duration_ms: float | None = None
+    last_error: str | None = None
+    wakeup: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+
+    def to_dict(self) -> dict:
+        return {
+            "provider": self.provider,
+            "interval_seconds": self.interval,
+            "status": self.status,
+            "runs": self.runs,
+            "failures": self.failures,
+            "next_run_at": self.next_run_at.isoformat() if self.next_run_at else None,
+            "last_started_at": self.last_started_at.isoformat() if self.last_started_at else None,
+            "last_finished_at": self.last_finished_at.isoformat() if self.last_finished_at else None,
+            "last_duration_ms": self.last_duration_ms,
+            "last_error": self.last_error,
+        }
+
+
+class ScrapeScheduler:
+    """
+    Periodically refreshes every registered provider in the background.
+
+    Each provider runs on its own interval with +/- `jitter` (a fraction of
+    the interval) so scrapes don't line up. `refresh` does the actual work
+    and is expected to store the result as the provider's latest snapshot,
+    which is what request handlers then serve from.
+    """
+
+    def __init__(
+        self,
+        providers: list[str],
+        refresh: Callable[[str], Awaitable[Any]],
+        interval: float | None = None,
+        interval_overrides: dict[str, float] | None = None,
+        jitter: float | None = None,
+    ):
+        interval = settings.scheduler_interval if interval is None else interval
+        overrides = (
+            settings.scheduler_interval_overrides if interval_overrides is None else interval_overrides
+        )
+        self.refresh = refresh
+        self.jitter = settings.scheduler_jitter if jitter is None else jitter
+        self._states = {
+            provider: ScheduleState(provider=provider, interval=overrides.get(provider, interval))
+            for provider in providers
+        }
+        self._tasks: list[asyncio.Task] = []
+
+    def start(self) -> None:
+        """Start one loop per provider."""
+        if self._tasks:
+            return
+        for state in self._states.values():
+            self._tasks.append(asyncio.create_task(self._loop(state)))
+
+    async def stop(self) -> None:
+        """Cancel all provider loops and wait for them to exit."""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def schedules(self) -> list[dict]:
+        """Current schedule and last-run status for every provider."""
+        return [state.to_dict() for state in self._states.values()]
+
+    def get(self, provider: str) -> ScheduleState | None:
+        return self._states.get(provider)
+
+    def trigger(self, provider: str) -> bool:
+        """Wake a provider's loop so it refreshes now. False if unknown."""
+        state = self._states.get(provider)
+        if not state:
+            return False
+        state.wakeup.set()
+        return True
+
+    async def run_now(self, provider: str) -> ScheduleState:
+        """Refresh a provider immediately and wait for the run to finish."""
+        state = self._states.get(provider)
+        if not state:
+            raise KeyError(provider)
+        await self._run_once(state)
+        return state
+
+    async def _loop(self, state: ScheduleState) -> None:
+        # Stagger the first runs so providers don't all start at once
+        delay = random.uniform(0, min(5.0, state.interval * self.jitter))
+        while True:
+            state.next_run_at = datetime.now() + timedelta(seconds=delay)
+            try:
+                await asyncio.wait_for(state.wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+            state.wakeup.clear()
+
+            await self._run_once(state)
+            delay = state.interval * (1 + random.uniform(-self.jitter, self.jitter))
+
+    async def _run_once(self, state: ScheduleState) -> None:
+        state.status = "running"
+        state.last_started_at = datetime.now()
+        started = time.perf_counter()
+        try:
+            result = await self.refresh(state.provider)
+            ok = not isinstance(result, dict) or bool(result.get("success", True))
+            state.last_error = None if ok else "; ".join(result.get("errors") or []) or "Scrape failed"
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            ok = False
+            state.last_error = str(e) or type(e).__name__
+
+        state.runs += 1
+        if not ok:
+            state.failures += 1
+        state.status = "ok" if ok else "failed"
+        state.last_finished_at = datetime.now()
+        state.last_duration_ms = round((time.perf_counter() - started) * 1000, 1)
@@ -0,0 +1,159 @@
+import asyncio
+import time
+from typing import Any
+
+from .config import get_settings
+from .dependencies import (
+    get_change_detector,
+    get_playwright,
+    get_browser_pool,
+    get_result_cache,
+    get_scrape_flights,
+    get_snapshot_store,
+    get_scrape_fleet,
+    get_rate_limiters,
+)
+from .metrics import SCRAPE_ERRORS, SCRAPES, observe_scrape
+from .ratelimit import CircuitOpenError
+from .scrapers import SCRAPERS
+
+settings = get_settings()
+
+# Bounds how many scrapes (request-driven or scheduled) drive browsers at once
+_semaphore: asyncio.Semaphore | None = None
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    global _semaphore
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(max(1, settings.scrape_concurrency))
+    return _semaphore
+
+
+async def scrape_now(provider: str) -> Any:
+    """
+    Run a fresh scrape for a registered provider.
+
+    Bounded by the shared concurrency semaphore and the per-provider
+    timeout; concurrent calls for the same provider share one scrape. In
+    worker mode the scrape runs in a fleet process instead of this one.
+    """
+    scraper_class = SCRAPERS.get(provider)
+    if not scraper_class:
+        raise ValueError(f"Unknown provider: {provider}")
+    limiter = get_rate_limiters().get(provider)
+
+    async def scrape():
+        # Fails fast with CircuitOpenError while the provider is unhealthy
+        try:
+            limiter.check_circuit()
+        except CircuitOpenError:
+            SCRAPE_ERRORS.inc(provider=provider, kind="circuit_open")
+            raise
+        started = time.perf_counter()
+        try:
+            async with _get_semaphore():
+                fleet = get_scrape_fleet()
+                if fleet:
+                    run = fleet.submit(provider)
+                else:
+                    run = scraper_class(get_playwright(), get_browser_pool()).run()
+                result = await asyncio.wait_for(run, timeout=settings.scrape_provider_timeout)
+        except asyncio.CancelledError:
+            limiter.breaker.cancel_trial()
+            raise
+        except Exception as e:
+            limiter.breaker.record_failure()
+            SCRAPES.inc(provider=provider, outcome="failure")
+            kind = "timeout" if isinstance(e, asyncio.TimeoutError) else "exception"
+            SCRAPE_ERRORS.inc(provider=provider, kind=kind)
+            raise
+
+        if isinstance(result, dict) and not result.get("success", True):
+            limiter.breaker.record_failure()
+        else:
+            limiter.breaker.record_success()
+        if isinstance(result, dict):
+            observe_scrape(provider, result, time.perf_counter() - started)
+        detector = get_change_detector()
+        if detector:
+            detector.observe(provider, result)
+        await save_snapshot(provider, result)
+        return result
+
+    return await get_scrape_flights().run(provider, scrape)
+
+
+async def save_snapshot(provider: str, result: Any) -> None:
+    """Persist a successful scrape to the snapshot store, if one is open."""
+    store = get_snapshot_store()
+    if store is None or not isinstance(result, dict) or not result.get("success"):
+        return
+    try:
+        # One transaction per scrape, off the event loop
+        await asyncio.to_thread(store.save_result, provider, result)
+    except Exception as e:
+        print(f"Snapshot store write failed for {provider}: {e}")
+
+
+async def refresh_provider(provider: str) -> Any:
+    """Scrape a provider now and store the result as its latest snapshot."""
+    entry = await get_result_cache().refresh(provider, lambda: scrape_now(provider))
+    return entry.value
+
+
+async def fetch_provider(provider: str, max_age: float | None = None) -> tuple[Any, dict]:
+    """
+    Get one provider's result, scraping only when the cache can't serve it.
+
+    Returns a copy of the result (safe to filter in place) and the cache
+    fields for ScrapeResponse.meta. While the provider's circuit is open,
+    the last cached result is served whatever its age. With change
+    detection on, meta also says whether the result's scrape skipped
+    parsing because the content was unchanged, and the provider's skip rate.
+    """
+    cache = get_result_cache()
+    try:
+        entry, cached = await cache.get(provider, lambda: scrape_now(provider), max_age=max_age)
+        meta = entry.meta(cached)
+    except CircuitOpenError as e:
+        entry = cache.peek(provider)
+        if entry is None:
+            raise
+        meta = {**entry.meta(True), "circuit": "open", "retry_in_seconds": round(e.retry_in, 1)}
+
+    detector = get_change_detector()
+    if detector and isinstance(entry.value, dict) and entry.value.get("fingerprint"):
+        meta["unchanged"] = bool(entry.value.get("unchanged"))
+        meta["skip_rate"] = detector.skip_rate(provider)
+    result = dict(entry.value) if isinstance(entry.value, dict) else entry.value
+    return result, meta
+
+
+async def run_provider(provider: str, max_age: float | None = None) -> tuple[dict, dict | None]:
+    """
+    Fetch one provider's result and tag it with its wall time.
+
+    Failures and timeouts are returned as an unsuccessful result rather than
+    raised, so one provider can never take down a fan-out over several.
+    """
+    started = time.perf_counter()
+    cache_meta = None
+    try:
+        result, cache_meta = await fetch_provider(provider, max_age)
+    except asyncio.TimeoutError:
+        result = {
+            "provider": provider,
+            "success": False,
+            "error": f"Timed out after {settings.scrape_provider_timeout:.0f}s",
+        }
+    except Exception as e:
+        result = {
+            "provider": provider,
+            "success": False,
+            "error": str(e),
+        }
+
+    if isinstance(result, dict):
+        result["duration_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    return result, cache_meta
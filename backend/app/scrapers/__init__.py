@@ -3,7 +3,14 @@ from .clubgg import ClubGGScraper
 from .ggpoker import GGPokerScraper
 from .pokerstars import PokerStarsScraper
 
+# Registered scrapers, keyed by the provider id used in API routes
+SCRAPERS: dict[str, type[BaseScraper]] = {
+    scraper.PROVIDER_ID: scraper
+    for scraper in (ClubGGScraper, GGPokerScraper, PokerStarsScraper)
+}
+
 __all__ = [
+    "SCRAPERS",
     "BaseScraper",
     "ClubGGScraper",
     "GGPokerScraper",
@@ -1,109 +1,577 @@
 import asyncio
-import random
+import json
+import re
+import time
 from abc import ABC, abstractmethod
-from typing import Any
+from contextlib import contextmanager
+from pathlib import Path
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from typing import Any, Callable, Iterator, TypeVar
+from urllib.parse import urlsplit
 
-from playwright.async_api import Browser, BrowserContext, Page, Playwright
+import httpx
+from playwright.async_api import Browser, BrowserContext, Page, Playwright, Response, Route
 
+from ..browser_pool import BROWSER_ARGS, USER_AGENT, BrowserPool
 from ..config import get_settings
+from ..changes import content_digest
+from .dedup import Deduplicator
+from .embedded_json import DEFAULT_GLOBALS, find_embedded_records, find_json_records
+from ..models.poker import GameType, PokerGame, Provider, Tournament, TournamentInfo
+from ..dependencies import (
+    get_change_detector,
+    get_http_client,
+    get_parse_pool,
+    get_progress_hub,
+    get_rate_limiters,
+    get_session_store,
+)
 
 settings = get_settings()
 
+T = TypeVar("T")
+
+# Third-party hosts (analytics, ads, chat widgets) never needed for schedule data
+DEFAULT_BLOCKED_DOMAINS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googlesyndication.com",
+    "doubleclick.net",
+    "facebook.net",
+    "facebook.com",
+    "connect.facebook.net",
+    "hotjar.com",
+    "clarity.ms",
+    "segment.io",
+    "optimizely.com",
+    "newrelic.com",
+    "nr-data.net",
+    "onetrust.com",
+    "cookielaw.org",
+    "intercom.io",
+    "zendesk.com",
+    "tiktok.com",
+    "twitter.com",
+    "bing.com",
+)
+
+# Resolves once the DOM has stopped mutating for `quietMs` and the body has text
+DOM_QUIET_JS = """
+([quietMs, minText]) => new Promise((resolve) => {
+    let timer = null;
+    const observer = new MutationObserver(() => arm());
+    const hasText = () => document.body && document.body.innerText.length > minText;
+    function arm() {
+        clearTimeout(timer);
+        timer = setTimeout(() => {
+            if (!hasText()) return arm();
+            observer.disconnect();
+            resolve(true);
+        }, quietMs);
+    }
+    observer.observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+    arm();
+})
+"""
+
+# Resolves a list of selectors to their elements' textContent in one round trip
+EXTRACT_TEXTS_JS = """
+(selectors) => selectors.map((selector) => {
+    try {
+        return Array.from(document.querySelectorAll(selector), (el) => el.textContent || "");
+    } catch (e) {
+        return [];
+    }
+})
+"""
+
+
+# Hashes the text of the change-detection region in the page, so only the
+# digest crosses CDP. crypto.subtle only exists in secure contexts; elsewhere
+# the joined text is returned for hashing in Python.
+REGION_DIGEST_JS = """
+async (selectors) => {
+    const parts = [];
+    for (const selector of selectors) {
+        let elements = [];
+        try {
+            elements = document.querySelectorAll(selector);
+        } catch (e) {}
+        for (const el of elements) {
+            const text = (el.textContent || "").trim();
+            if (text) parts.push(text);
+        }
+    }
+    if (!parts.length) return null;
+    const text = parts.join("\u001f");
+    if (!(window.crypto && crypto.subtle)) return {text};
+    const digest = await crypto.subtle.digest("SHA-1", new TextEncoder().encode(text));
+    return {digest: Array.from(new Uint8Array(digest), (b) => b.toString(16).padStart(2, "0")).join("")};
+}
+"""
+
+
+# Inline <script> bodies in raw HTML (external scripts have none)
+SCRIPT_RE = re.compile(r"<script\b[^>]*>(.*?)</script\s*>", re.IGNORECASE | re.DOTALL)
+
+
+def inline_scripts(html: str) -> list[str]:
+    """Non-empty inline script bodies of an HTML document. Runs in the parse pool."""
+    return [text for match in SCRIPT_RE.finditer(html) if (text := match.group(1).strip())]
+
+
+def html_embedded_records(html: str, keys: tuple[str, ...], names: tuple[str, ...]) -> list[dict]:
+    """`find_embedded_records` over the inline scripts of an HTML document. Runs in the parse pool."""
+    return find_embedded_records(inline_scripts(html), keys, names)
+
 
 class BaseScraper(ABC):
     """
     Base class for all scrapers using Playwright for headless browser automation.
 
     Provides common functionality for:
-    - Browser/context/page management
-    - Random delays to avoid detection
+    - Browser/context/page management (pooled when a BrowserPool is given)
+    - Per-provider rate limiting and back-off on navigation
     - Retry logic
     - Error handling
+    - Capturing JSON from the site's own XHR/fetch calls
+    - An HTTP tier that tries plain requests before launching a browser
+    - HAR record/replay and per-phase timings for offline benchmarking
     """
 
-    def __init__(self, playwright: Playwright):
+    # Short provider id used for fixture file names (matches the SCRAPERS registry)
+    PROVIDER_ID: str = ""
+    PROVIDER: Provider = Provider.OTHER
+
+    # Record lists every result carries, in output order
+    RESULT_LISTS: tuple[str, ...] = ("games", "tournaments")
+
+    # Regexes matched against XHR/fetch URLs whose JSON bodies should be kept
+    API_URL_PATTERNS: list[str] = []
+
+    # Resource policy: request types and third-party domains aborted via context.route.
+    # Stylesheets are left alone by default since some layouts render content lazily.
+    BLOCKED_RESOURCE_TYPES: frozenset[str] = frozenset({"image", "media", "font"})
+    BLOCKED_DOMAINS: tuple[str, ...] = DEFAULT_BLOCKED_DOMAINS
+
+    # Readiness conditions raced after navigation; the first one to hold wins
+    READY_SELECTORS: list[str] = []  # any of these appearing means content is rendered
+    READY_RESPONSE_PATTERNS: list[str] = []  # an XHR/fetch to a matching URL completing
+
+    # Globals assigned JSON state in inline scripts (`window.__INITIAL_DATA__ = {...}`);
+    # values after these and after `"<JSON_RECORD_KEYS>":` are decoded by the script methods
+    JSON_RECORD_KEYS: tuple[str, ...] = ()
+    EMBEDDED_GLOBALS: tuple[str, ...] = DEFAULT_GLOBALS
+
+    # Pages and JSON endpoints the HTTP tier fetches; empty skips straight to the browser
+    HTTP_URLS: list[str] = []
+
+    # The schedule region whose text, along with captured JSON, fingerprints the page
+    # for change detection. Keep it tight: banners, countdowns and nonces elsewhere on
+    # the page would change the fingerprint on every load.
+    CHANGE_SELECTORS: list[str] = []
+
+    # Timed phases announced to progress subscribers as they start
+    PROGRESS_PHASES = ("http", "launch", "navigate", "readiness")
+
+    def __init__(self, playwright: Playwright, pool: BrowserPool | None = None):
         self.playwright = playwright
+        self.pool = pool
         self.browser: Browser | None = None
         self.context: BrowserContext | None = None
         self.page: Page | None = None
+        self.captured_json: list[tuple[str, Any]] = []
+        self.http_pages: list[str] = []
+        self.validators: list[str] = []  # ETag / Last-Modified of the fetched documents
+        # Start time given to records the page has none for; one value per scrape
+        # (to the minute) so the same record found by two methods compares equal
+        self.scrape_time = datetime.now().replace(second=0, microsecond=0)
+        self.fingerprint: str | None = None
+        self.tier = "browser"
+        self._capture_tasks: list[asyncio.Task] = []
+        self.request_stats: dict[str, Any] = {
+            "allowed": 0,
+            "blocked": 0,
+            "blocked_by_reason": {},
+            "bytes_received": 0,
+        }
+        self.readiness: dict[str, Any] | None = None
+        self.timings: dict[str, float] = {}
+        self.method_stats: dict[str, dict[str, float]] = {}
+        self._method_mark: float | None = None
+        # Saved sessions are bypassed in HAR mode so fixtures stay deterministic
+        self.sessions = get_session_store() if settings.har_mode == "off" and self.PROVIDER_ID else None
+        self.session_stats: dict[str, Any] = {"restored": False, "saved": False, "cache_hits": 0, "cache_misses": 0}
+        self.limiter = get_rate_limiters().get(self.PROVIDER_ID or "default")
+
+    def context_options(self) -> dict[str, Any]:
+        """Options for new browser contexts (realistic viewport and user agent)."""
+        return {
+            "viewport": {"width": 1920, "height": 1080},
+            "user_agent": USER_AGENT,
+            "java_script_enabled": True,
+        }
+
+    @contextmanager
+    def timed(self, phase: str) -> Iterator[None]:
+        """Accumulate wall time spent in a phase into `self.timings` (ms)."""
+        if phase in self.PROGRESS_PHASES:
+            self.report_phase(phase)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - started) * 1000
+            self.timings[phase] = self.timings.get(phase, 0.0) + elapsed
+
+    def har_path(self) -> Path | None:
+        """HAR fixture for this provider, when record/replay is enabled."""
+        if settings.har_mode == "off" or not self.PROVIDER_ID:
+            return None
+        return Path(settings.har_dir) / f"{self.PROVIDER_ID}.har"
 
     async def start_browser(self) -> None:
-        """Initialize the browser with headless configuration."""
-        self.browser = await self.playwright.chromium.launch(
-            headless=settings.browser_headless,
-            args=[
-                "--disable-blink-features=AutomationControlled",
-                "--disable-dev-shm-usage",
-                "--no-sandbox",
-                "--disable-setuid-sandbox",
-                "--disable-gpu",
-                "--disable-web-security",
-            ],
-        )
+        """
+        Get a fresh context from the pool, or launch a dedicated browser.
 
-        # Create context with realistic viewport and user agent
-        self.context = await self.browser.new_context(
-            viewport={"width": 1920, "height": 1080},
-            user_agent=(
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0.0.0 Safari/537.36"
-            ),
-            java_script_enabled=True,
-        )
+        "launch" covers getting a browser (from the pool, it includes the
+        context too); "context" covers context and page setup. The context
+        starts from the provider's saved session, if there is one.
+        """
+        options = self.context_options()
+        state = self.sessions.load_state(self.PROVIDER_ID) if self.sessions else None
+        if state:
+            options["storage_state"] = state
+            self.session_stats["restored"] = True
+
+        if self.pool:
+            with self.timed("launch"):
+                self.context = await self.pool.new_context(**options)
+        else:
+            with self.timed("launch"):
+                self.browser = await self.playwright.chromium.launch(
+                    headless=settings.browser_headless,
+                    args=BROWSER_ARGS,
+                )
+            with self.timed("context"):
+                self.context = await self.browser.new_context(**options)
+
+        with self.timed("context"):
+            # Set default timeout
+            self.context.set_default_timeout(settings.browser_timeout)
+            await self._apply_har_mode()
+            await self._apply_asset_cache()
+            await self._apply_resource_policy()
+
+            self.page = await self.context.new_page()
+            self._watch_responses()
+
+    async def _apply_har_mode(self) -> None:
+        """Record this context's traffic to a HAR, or serve it from one with no network."""
+        path = self.har_path()
+        if not path or not self.context:
+            return
+        if settings.har_mode == "record":
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Written out when the context closes
+            await self.context.route_from_har(path, update=True, update_content="embed")
+        elif settings.har_mode == "replay":
+            if not path.exists():
+                raise FileNotFoundError(f"No HAR fixture for {self.PROVIDER_ID}: {path}")
+            await self.context.route_from_har(path, not_found="abort")
+
+    async def _apply_asset_cache(self) -> None:
+        """Serve scripts and stylesheets from the provider's on-disk cache."""
+        if not self.sessions or not self.context:
+            return
+        sessions, provider = self.sessions, self.PROVIDER_ID
+
+        async def handle(route: Route) -> None:
+            request = route.request
+            if request.method != "GET" or request.resource_type not in sessions.CACHED_RESOURCE_TYPES:
+                await route.fallback()
+                return
+
+            cached = await asyncio.to_thread(sessions.get_asset, provider, request.url)
+            if cached:
+                self.session_stats["cache_hits"] += 1
+                status, headers, body = cached
+                await route.fulfill(status=status, headers=headers, body=body)
+                return
 
-        # Set default timeout
-        self.context.set_default_timeout(settings.browser_timeout)
+            self.session_stats["cache_misses"] += 1
+            try:
+                response = await route.fetch()
+                body = await response.body()
+            except Exception:
+                await route.fallback()
+                return
+            headers = sessions.stored_headers(response.headers)
+            if sessions.cacheable(response.status, response.headers):
+                try:
+                    await asyncio.to_thread(sessions.put_asset, provider, request.url, response.status, headers, body)
+                except OSError as e:
+                    print(f"Asset cache write failed for {provider}: {e}")
+            await route.fulfill(status=response.status, headers=headers, body=body)
+
+        # Registered before the resource policy, so blocked requests never reach it
+        await self.context.route("**/*", handle)
+
+    async def _apply_resource_policy(self) -> None:
+        """Abort blocked resource types and third-party domains for this context."""
+        if not settings.block_resources or not self.context:
+            return
+        if not self.BLOCKED_RESOURCE_TYPES and not self.BLOCKED_DOMAINS:
+            return
+
+        async def handle(route: Route) -> None:
+            request = route.request
+            if request.resource_type in self.BLOCKED_RESOURCE_TYPES:
+                reason = request.resource_type
+            elif self._is_blocked_domain(request.url):
+                reason = "third_party"
+            else:
+                self.request_stats["allowed"] += 1
+                # Fall back rather than continue so a HAR route still gets the request
+                await route.fallback()
+                return
+
+            self.request_stats["blocked"] += 1
+            by_reason = self.request_stats["blocked_by_reason"]
+            by_reason[reason] = by_reason.get(reason, 0) + 1
+            await route.abort()
+
+        await self.context.route("**/*", handle)
+
+    def _is_blocked_domain(self, url: str) -> bool:
+        host = urlsplit(url).hostname or ""
+        return any(host == domain or host.endswith("." + domain) for domain in self.BLOCKED_DOMAINS)
+
+    def _watch_responses(self) -> None:
+        """Count response bytes and capture JSON from URLs matching API_URL_PATTERNS."""
+        if not self.page:
+            return
+        patterns = [re.compile(p, re.IGNORECASE) for p in self.API_URL_PATTERNS]
+
+        def on_response(response: Response) -> None:
+            self._count_bytes(response)
+            if response.request.resource_type not in ("xhr", "fetch"):
+                return
+            if response.status == 429 or response.status >= 500:
+                self.limiter.record_throttle()
+            if patterns and any(p.search(response.url) for p in patterns):
+                self._capture_tasks.append(asyncio.create_task(self._capture_json(response)))
+
+        self.page.on("response", on_response)
+
+    def _count_bytes(self, response: Response) -> None:
+        try:
+            self.request_stats["bytes_received"] += int(response.headers.get("content-length", 0))
+        except ValueError:
+            pass
+
+    async def _capture_json(self, response: Response) -> None:
+        try:
+            if "json" not in response.headers.get("content-type", ""):
+                return
+            self.captured_json.append((response.url, await response.json()))
+        except Exception:
+            pass  # Body unavailable (redirect, aborted) or not valid JSON
+
+    async def get_captured_json(self) -> list[tuple[str, Any]]:
+        """Return `(url, payload)` pairs captured so far, once pending bodies are read."""
+        if self._capture_tasks:
+            tasks, self._capture_tasks = self._capture_tasks, []
+            with self.timed("extract"):
+                await asyncio.gather(*tasks, return_exceptions=True)
+        return list(self.captured_json)
 
-        self.page = await self.context.new_page()
+    def report_phase(self, phase: str) -> None:
+        """Tell anyone following this provider which browser phase just started."""
+        hub = get_progress_hub()
+        if hub.has_subscribers(self.PROVIDER_ID):
+            hub.publish(self.PROVIDER_ID, {"type": "phase", "provider": self.PROVIDER_ID, "phase": phase})
+
+    def report_partial(self, method: str, items: list) -> None:
+        """
+        Record one extraction method's item count and time, and publish its
+        items to anyone streaming this provider. A method's time runs from
+        the previous method (or the page becoming ready) to this report.
+        """
+        now = time.perf_counter()
+        stats = self.method_stats.setdefault(method, {"count": 0, "ms": 0.0})
+        stats["count"] += len(items)
+        if self._method_mark is not None:
+            stats["ms"] = round(stats["ms"] + (now - self._method_mark) * 1000, 1)
+        self._method_mark = now
+
+        hub = get_progress_hub()
+        if not hub.has_subscribers(self.PROVIDER_ID):
+            return
+        event = {
+            "type": "partial",
+            "provider": self.PROVIDER_ID,
+            "method": method,
+            "count": len(items),
+        }
+        # Job progress only needs counts; dump items only for stream subscribers
+        if hub.wants_items(self.PROVIDER_ID):
+            event["items"] = [item.model_dump(mode="json") for item in items]
+        hub.publish(self.PROVIDER_ID, event)
+
+    async def page_content(self) -> str:
+        """Full serialized HTML of the current page."""
+        if not self.page:
+            raise RuntimeError("Browser not started")
+        with self.timed("extract"):
+            return await self.page.content()
+
+    async def run_cpu(self, fn: Callable[..., T], *args: Any) -> T:
+        """
+        Run a CPU-bound parsing function in the parse process pool.
+
+        `fn` must be a module-level function taking and returning plain,
+        compact data (e.g. the HTML string in, tuples out). Without a pool
+        it runs inline.
+        """
+        pool = get_parse_pool()
+        if pool is not None:
+            try:
+                return await asyncio.get_running_loop().run_in_executor(pool, fn, *args)
+            except BrokenProcessPool as e:
+                print(f"Parse pool unavailable, parsing inline: {e}")
+        return fn(*args)
 
     async def close_browser(self) -> None:
         """Clean up browser resources."""
+        for task in self._capture_tasks:
+            task.cancel()
+        self._capture_tasks = []
         if self.page:
             await self.page.close()
             self.page = None
         if self.context:
-            await self.context.close()
+            if self.pool:
+                await self.pool.release(self.context)
+            else:
+                await self.context.close()
             self.context = None
         if self.browser:
             await self.browser.close()
             self.browser = None
 
-    async def random_delay(self) -> None:
-        """Add a random delay to mimic human behavior."""
-        delay = random.uniform(settings.scrape_delay_min, settings.scrape_delay_max)
-        await asyncio.sleep(delay)
-
     async def navigate(self, url: str, wait_for_js: bool = True) -> None:
-        """Navigate to a URL with retry logic and smart waiting."""
+        """
+        Navigate to a URL, then wait until the page is ready.
+
+        Each attempt takes a token from the provider's rate limiter. A
+        failed attempt or a 429/5xx response sets the provider's shared
+        back-off before the next try.
+        """
         if not self.page:
             raise RuntimeError("Browser not started")
 
         for attempt in range(settings.max_retries):
+            await self.limiter.acquire()
+            response_waiter = self._wait_for_ready_response() if wait_for_js else None
             try:
                 # Use domcontentloaded instead of networkidle - much faster
-                await self.page.goto(url, wait_until="domcontentloaded", timeout=20000)
+                with self.timed("navigate"):
+                    response = await self.page.goto(url, wait_until="domcontentloaded", timeout=20000)
+                if response and (response.status == 429 or response.status >= 500):
+                    raise RuntimeError(f"HTTP {response.status} from {url}")
+                if response:
+                    self.record_validators(response.headers)
 
                 if wait_for_js:
-                    # Wait for JS frameworks to render (Vue, React, Wix, etc.)
-                    # Give the page time to execute JavaScript
-                    await asyncio.sleep(2)
-
-                    # Try to wait for body content to be non-empty
-                    try:
-                        await self.page.wait_for_function(
-                            "document.body && document.body.innerText.length > 100",
-                            timeout=10000
-                        )
-                    except Exception:
-                        pass  # Continue even if this times out
+                    with self.timed("readiness"):
+                        await self.wait_until_ready(response_waiter)
+                    response_waiter = None
 
+                self.limiter.record_ok()
+                self._method_mark = time.perf_counter()
                 return
             except Exception as e:
+                delay = self.limiter.record_throttle()
                 if attempt == settings.max_retries - 1:
                     raise
-                print(f"Navigation attempt {attempt + 1} failed: {e}")
-                await self.random_delay()
+                # In worker mode the back-off is applied by the API process's limiter
+                backoff = f" (backing off {delay:.1f}s)" if delay else ""
+                print(f"Navigation attempt {attempt + 1} failed: {e}{backoff}")
+            finally:
+                if response_waiter:
+                    response_waiter.cancel()
+
+    def _wait_for_ready_response(self) -> asyncio.Task | None:
+        """Start waiting for an expected XHR before navigating, so it can't be missed."""
+        if not self.page or not self.READY_RESPONSE_PATTERNS:
+            return None
+        patterns = [re.compile(p, re.IGNORECASE) for p in self.READY_RESPONSE_PATTERNS]
+
+        def expected(response: Response) -> bool:
+            return (
+                response.ok
+                and response.request.resource_type in ("xhr", "fetch")
+                and any(p.search(response.url) for p in patterns)
+            )
+
+        return asyncio.create_task(
+            self.page.wait_for_event(
+                "response", predicate=expected, timeout=settings.readiness_timeout
+            )
+        )
+
+    async def wait_until_ready(self, response_waiter: asyncio.Task | None = None) -> None:
+        """
+        Wait until the first readiness condition holds.
+
+        Races the scraper's READY_SELECTORS, an expected XHR (READY_RESPONSE_PATTERNS)
+        and the DOM going quiet for `readiness_quiet_ms` with some text on
+        the page. Gives up silently after `readiness_timeout`; the condition
+        that fired and the time spent are recorded in `self.readiness`.
+        """
+        if not self.page:
+            raise RuntimeError("Browser not started")
+
+        started = time.perf_counter()
+        conditions: dict[asyncio.Task, str] = {}
+        if self.READY_SELECTORS:
+            conditions[asyncio.create_task(self.page.wait_for_selector(
+                ", ".join(self.READY_SELECTORS),
+                state="attached",
+                timeout=settings.readiness_timeout,
+            ))] = "selector"
+        if response_waiter:
+            conditions[response_waiter] = "response"
+        conditions[asyncio.create_task(self.page.evaluate(
+            DOM_QUIET_JS, [settings.readiness_quiet_ms, 100]
+        ))] = "dom_quiet"
+
+        condition = "timeout"
+        pending = set(conditions)
+        deadline = started + settings.readiness_timeout / 1000
+        try:
+            while pending:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                done, pending = await asyncio.wait(
+                    pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                ready = [t for t in done if not t.cancelled() and t.exception() is None]
+                if ready:
+                    condition = conditions[ready[0]]
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        self.readiness = {
+            "condition": condition,
+            "wait_ms": round((time.perf_counter() - started) * 1000, 1),
+        }
 
     async def wait_for_selector(self, selector: str, timeout: int | None = None) -> None:
         """Wait for an element to appear on the page."""
@@ -122,15 +590,36 @@ class BaseScraper(ABC):
 
     async def get_texts(self, selector: str) -> list[str]:
         """Get text content of all matching elements."""
+        texts_by_selector = await self.extract_texts([selector])
+        return [text.strip() for text in texts_by_selector[selector]]
+
+    async def extract_texts(self, selectors: list[str]) -> dict[str, list[str]]:
+        """
+        Get the text content of every element matching each selector.
+
+        All selectors are resolved inside the page in a single evaluate call,
+        instead of one CDP round trip per element. Invalid selectors yield an
+        empty list and empty texts are dropped.
+        """
         if not self.page:
             raise RuntimeError("Browser not started")
-        elements = await self.page.query_selector_all(selector)
-        texts = []
-        for element in elements:
-            text = await element.text_content()
-            if text:
-                texts.append(text.strip())
-        return texts
+        with self.timed("extract"):
+            results = await self.page.evaluate(EXTRACT_TEXTS_JS, selectors)
+        return {
+            selector: [text for text in texts if text]
+            for selector, texts in zip(selectors, results)
+        }
+
+    async def script_texts(self) -> list[str]:
+        """Inline script bodies, from the fetched HTML in the HTTP tier or else the page."""
+        if self.tier == "http":
+            texts = []
+            for html in self.http_pages:
+                texts.extend(await self.run_cpu(inline_scripts, html))
+            return texts
+        if not self.page:
+            return []
+        return (await self.extract_texts(["script"]))["script"]
 
     async def click(self, selector: str) -> None:
         """Click an element."""
@@ -144,14 +633,316 @@ class BaseScraper(ABC):
             raise RuntimeError("Browser not started")
         await self.page.screenshot(path=path)
 
+    def record_validators(self, headers: Any) -> None:
+        self.validators.extend(
+            f"{name}={value}" for name in ("etag", "last-modified") if (value := headers.get(name))
+        )
+
+    async def region_digest(self, selectors: list[str]) -> str | None:
+        """sha1 of the text of every element matching `selectors`, computed in the page."""
+        if not self.page:
+            raise RuntimeError("Browser not started")
+        region = await self.page.evaluate(REGION_DIGEST_JS, selectors)
+        if not region:
+            return None
+        return region.get("digest") or content_digest([region["text"]])
+
+    async def content_fingerprint(self) -> str | None:
+        """
+        Fingerprint of the schedule data: the captured JSON payloads plus
+        the in-page digest of CHANGE_SELECTORS (or, in the HTTP tier, the
+        inline scripts). When neither has content the documents'
+        ETag/Last-Modified are used; None means there's nothing to compare.
+        """
+        parts = sorted(
+            json.dumps(payload, sort_keys=True, default=str) for _, payload in await self.get_captured_json()
+        )
+        if self.tier == "http":
+            parts.extend(await self.script_texts())
+        elif self.page and self.CHANGE_SELECTORS:
+            digest = await self.region_digest(self.CHANGE_SELECTORS)
+            if digest:
+                parts.append(digest)
+        if not parts:
+            parts = self.validators
+        return content_digest(parts) if parts else None
+
+    async def reuse_if_unchanged(self) -> dict[str, Any] | None:
+        """
+        Call once the content has loaded, before extracting. If it matches
+        the fingerprint of the last successful run, returns that run's
+        result with a fresh timestamp so parsing can be skipped.
+        """
+        detector = get_change_detector()
+        if detector is None or not self.PROVIDER_ID:
+            return None
+        try:
+            with self.timed("extract"):
+                self.fingerprint = await self.content_fingerprint()
+        except Exception as e:
+            print(f"Fingerprinting failed for {self.PROVIDER_ID}: {e}")
+            return None
+        previous = detector.lookup(self.PROVIDER_ID, self.fingerprint) if self.fingerprint else None
+        if previous is None:
+            return None
+        result = dict(previous)
+        result["timestamp"] = datetime.now().isoformat()
+        result["unchanged"] = True
+        return result
+
+    def remember_result(self, result: dict) -> None:
+        """Keep a freshly parsed result for reuse while the content stays the same."""
+        result["fingerprint"] = self.fingerprint
+        result.setdefault("unchanged", False)
+        detector = get_change_detector()
+        if detector is None or not self.fingerprint or result["unchanged"]:
+            return
+        if result.get("success") and self.has_items(result):
+            detector.remember(self.PROVIDER_ID, self.fingerprint, result)
+        else:
+            detector.forget(self.PROVIDER_ID)
+
     async def run(self) -> Any:
-        """Run the scraper with proper setup and teardown."""
+        """
+        Run the scraper: through the HTTP tier when that finds something,
+        otherwise in a browser, with proper setup and teardown.
+        """
+        result = await self.run_http()
+        if result is not None:
+            return result
+
         try:
             await self.start_browser()
-            return await self.scrape()
+            with self.timed("scrape"):
+                result = await self.scrape()
+            if isinstance(result, dict):
+                self.remember_result(result)
+                await self.persist_session(result)
+                result["requests"] = dict(self.request_stats)
+                result["readiness"] = self.readiness
+                result["timings_ms"] = self.phase_timings()
+                result["methods"] = self.method_stats
+                result["session"] = self.session_stats
+                result["tier"] = "browser"
+            return result
+        except Exception:
+            if self.sessions:
+                self.sessions.invalidate(self.PROVIDER_ID)
+            raise
         finally:
             await self.close_browser()
 
+    async def run_http(self) -> dict | None:
+        """
+        Try the HTTP tier: fetch HTTP_URLS with the pooled client and run
+        `scrape_http()` over the responses. Returns None (leaving the
+        scraper ready for the browser) unless that found items.
+        """
+        client = get_http_client()
+        if client is None or not self.HTTP_URLS or settings.har_mode != "off":
+            return None
+
+        self.tier = "http"
+        try:
+            with self.timed("http"):
+                await self.fetch_http(client)
+            self._method_mark = time.perf_counter()
+            with self.timed("scrape"):
+                result = await self.scrape_http()
+        except Exception as e:
+            print(f"HTTP tier failed for {self.PROVIDER_ID}: {e}")
+            result = None
+        finally:
+            self.tier = "browser"
+
+        if not isinstance(result, dict) or not result.get("success") or not self.has_items(result):
+            # Keep the time spent so the escalation cost shows up in the browser result
+            self.timings = {"http": self.timings.get("http", 0.0)}
+            self.method_stats = {}
+            self.captured_json = []
+            self.http_pages = []
+            self.validators = []
+            self.fingerprint = None
+            return None
+
+        self.remember_result(result)
+        result["requests"] = dict(self.request_stats)
+        result["timings_ms"] = self.phase_timings()
+        result["methods"] = self.method_stats
+        result["tier"] = "http"
+        return result
+
+    async def fetch_http(self, client: httpx.AsyncClient) -> None:
+        """
+        GET each of HTTP_URLS. JSON bodies are added to `captured_json`, as
+        if the page had requested them; HTML goes to `http_pages`.
+        """
+        for url in self.HTTP_URLS:
+            await self.limiter.acquire()
+            try:
+                response = await client.get(url)
+            except httpx.HTTPError as e:
+                self.limiter.record_throttle()
+                print(f"HTTP tier request to {url} failed: {e}")
+                continue
+            self.request_stats["allowed"] += 1
+            self.request_stats["bytes_received"] += len(response.content)
+            if response.status_code == 429 or response.status_code >= 500:
+                self.limiter.record_throttle()
+                continue
+            self.limiter.record_ok()
+            if response.status_code != 200:
+                continue
+            self.record_validators(response.headers)
+            if "json" in response.headers.get("content-type", ""):
+                try:
+                    self.captured_json.append((str(response.url), response.json()))
+                except ValueError:
+                    pass
+            else:
+                self.http_pages.append(response.text)
+
+    async def scrape_http(self) -> dict | None:
+        """
+        Build a result from the HTTP tier's responses (`http_pages` and
+        `captured_json`) using the scraper's own parse methods. Providers
+        that can't be scraped without rendering return None.
+        """
+        return None
+
+    async def scrape_http_tournaments(self, parse: Callable[[dict], Tournament | None]) -> dict[str, Any]:
+        """
+        `scrape_http` for tournament schedules: tournaments parsed from the
+        captured JSON and from inline-script JSON, merged and finished the
+        same way as in the browser tier.
+        """
+        previous = await self.reuse_if_unchanged()
+        if previous:
+            return previous
+
+        result = self.new_result("http")
+        dedup = self.deduplicator()
+
+        api_tournaments = await self.json_records(parse)
+        self.report_partial("network", api_tournaments)
+        dedup.add("network", api_tournaments)
+
+        script_tournaments = await self.embedded_json_records(parse)
+        self.report_partial("scripts", script_tournaments)
+        dedup.add("scripts", script_tournaments)
+
+        self.finish_tournaments(result, dedup)
+        return result
+
+    def new_result(self, source: str) -> dict[str, Any]:
+        """Empty result for a scrape from `source` ("web" or "http")."""
+        return {
+            "provider": self.PROVIDER.value,
+            "success": False,
+            "timestamp": datetime.now().isoformat(),
+            "scrape_time": self.scrape_time.isoformat(),
+            "source": source,
+            **{key: [] for key in self.RESULT_LISTS},
+            "errors": [],
+            "warnings": [],
+        }
+
+    def finish_tournaments(self, result: dict[str, Any], dedup: Deduplicator) -> None:
+        """Fill in the result's tournaments, and a game per tournament, from the merged method output."""
+        tournaments = self.deduplicate(result, "tournaments", dedup)
+
+        result["tournaments"] = [t.model_dump() for t in tournaments]
+        result["games"] = [
+            PokerGame(
+                provider=self.PROVIDER,
+                game_type=GameType.TOURNAMENT,
+                variant=t.variant,
+                tournament=TournamentInfo(
+                    buy_in=t.buy_in,
+                    start_time=t.start_time,
+                    guaranteed_prize=t.guaranteed_prize,
+                    name=t.name,
+                ),
+            ).model_dump()
+            for t in tournaments
+        ]
+
+        result["success"] = True
+        result["tournament_count"] = len(tournaments)
+
+    async def json_records(self, parse: Callable[[dict], T | None]) -> list[T]:
+        """Parse the JSON_RECORD_KEYS records of the captured XHR/fetch payloads."""
+        records = []
+        for _, payload in await self.get_captured_json():
+            for item in find_json_records(payload, self.JSON_RECORD_KEYS):
+                record = parse(item)
+                if record:
+                    records.append(record)
+        return records
+
+    async def embedded_json_records(self, parse: Callable[[dict], T | None]) -> list[T]:
+        """Parse the JSON_RECORD_KEYS records of JSON embedded in inline scripts."""
+        keys, names = self.JSON_RECORD_KEYS, self.EMBEDDED_GLOBALS
+        try:
+            if self.tier == "http":
+                # Scripts are cut out of the fetched HTML in the pool as well
+                items = []
+                for html in self.http_pages:
+                    items.extend(await self.run_cpu(html_embedded_records, html, keys, names))
+            else:
+                items = await self.run_cpu(find_embedded_records, await self.script_texts(), keys, names)
+        except Exception:
+            return []
+
+        records = []
+        for item in items:
+            record = parse(item)
+            if record:
+                records.append(record)
+        return records
+
+    def deduplicator(self) -> Deduplicator:
+        """A dedup stage for one record list, aware of this scrape's placeholder start time."""
+        return Deduplicator(unknown_start=self.scrape_time)
+
+    def deduplicate(self, result: dict, key: str, dedup: Deduplicator) -> list:
+        """Merged records of `dedup`, with its counts reported under `result["dedup"][key]`."""
+        records = dedup.results()
+        result.setdefault("dedup", {})[key] = dedup.stats(len(records))
+        return records
+
+    @staticmethod
+    def has_items(result: dict) -> bool:
+        return any(result.get(key) for key in ("tournaments", "games", "cash_games"))
+
+    async def persist_session(self, result: dict) -> None:
+        """
+        Save the session after a scrape that found something; after one
+        that didn't, drop the saved session and asset cache so the next
+        scrape starts clean.
+        """
+        if not self.sessions or not self.context:
+            return
+        if result.get("success") and self.has_items(result):
+            try:
+                await self.sessions.save_state(self.PROVIDER_ID, self.context)
+                self.session_stats["saved"] = True
+            except Exception as e:
+                print(f"Session save failed for {self.PROVIDER_ID}: {e}")
+        else:
+            self.sessions.invalidate(self.PROVIDER_ID)
+
+    def phase_timings(self) -> dict[str, float]:
+        """
+        Per-phase wall times in ms. Parsing is whatever part of `scrape()`
+        was not spent navigating, waiting for readiness or extracting.
+        """
+        timings = dict(self.timings)
+        scrape = timings.pop("scrape", 0.0)
+        browser_work = sum(timings.get(p, 0.0) for p in ("navigate", "readiness", "extract"))
+        timings["parse"] = max(0.0, scrape - browser_work)
+        return {phase: round(ms, 1) for phase, ms in timings.items()}
+
     @abstractmethod
     async def scrape(self) -> Any:
         """
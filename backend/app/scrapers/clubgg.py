@@ -1,10 +1,11 @@
 import re
-from datetime import datetime
 from typing import Any
 
 from playwright.async_api import Playwright
 
 from .base import BaseScraper
+from .parsing import detect_variant, parse_stakes, parse_tournament_text
+from ..browser_pool import BrowserPool
 from ..models.poker import (
     Provider,
     GameType,
@@ -16,6 +17,27 @@ from ..models.poker import (
     Tournament,
 )
 
+# Buy-ins in page content: $55, $109, etc.
+CONTENT_BUYIN_RE = re.compile(r'\$(\d+(?:,\d{3})*)\s*(?:buy-?in|entry|GTD)?', re.IGNORECASE)
+
+# Stakes in page content: 1/2, 2/5, 5/10
+CONTENT_STAKES_RE = re.compile(r'(\d+)/(\d+)\s*(?:NL|PLO)?')
+
+
+def scan_content(html: str) -> tuple[list[int], list[tuple[int, int]]]:
+    """Buy-ins (dollars) and (sb, bb) stakes found in page HTML. Runs in the parse pool."""
+    buyins = [
+        buyin
+        for match in CONTENT_BUYIN_RE.finditer(html)
+        if 10 <= (buyin := int(match.group(1).replace(',', ''))) <= 10000  # Reasonable buy-in range
+    ]
+    stakes = []
+    for match in CONTENT_STAKES_RE.finditer(html):
+        sb, bb = int(match.group(1)), int(match.group(2))
+        if sb < bb and sb <= 100 and bb <= 200:  # Reasonable stakes
+            stakes.append((sb, bb))
+    return buyins, stakes
+
 
 class ClubGGScraper(BaseScraper):
     """
@@ -27,9 +49,18 @@ class ClubGGScraper(BaseScraper):
 
     BASE_URL = "https://www.clubgg.com"
     PROVIDER = Provider.CLUB_GG
-
-    def __init__(self, playwright: Playwright):
-        super().__init__(playwright)
+    PROVIDER_ID = "clubgg"
+    API_URL_PATTERNS = [r"tournament", r"schedule", r"/api/.*(game|club|table)"]
+    JSON_RECORD_KEYS = ("tournaments", "games", "cashGames", "tables")
+    RESULT_LISTS = ("games", "cash_games", "tournaments")
+    # Wix sites typically have this structure once content has rendered
+    READY_SELECTORS = ["[data-mesh-id]"]
+    CHANGE_SELECTORS = ["[data-mesh-id]"]
+    READY_RESPONSE_PATTERNS = API_URL_PATTERNS
+    HTTP_URLS = [BASE_URL]
+
+    def __init__(self, playwright: Playwright, pool: BrowserPool | None = None):
+        super().__init__(playwright, pool)
 
     async def scrape(self) -> dict[str, Any]:
         """
@@ -38,29 +69,14 @@ class ClubGGScraper(BaseScraper):
         Returns:
             Dictionary containing scraped poker room data
         """
-        result = {
-            "provider": self.PROVIDER.value,
-            "success": False,
-            "timestamp": datetime.now().isoformat(),
-            "source": "web",
-            "games": [],
-            "cash_games": [],
-            "tournaments": [],
-            "errors": [],
-            "warnings": [],
-        }
+        result = self.new_result("web")
 
         try:
             # Navigate to the main page
             await self.navigate(self.BASE_URL)
-            await self.random_delay()
 
-            # Wait for Wix content to load
-            # Wix sites typically have this structure
-            try:
-                await self.wait_for_selector("[data-mesh-id]", timeout=10000)
-            except Exception:
-                result["warnings"].append("Wix mesh containers not found")
+            if self.readiness and self.readiness["condition"] == "timeout":
+                result["warnings"].append("Wix content not detected before the readiness timeout")
 
             if not self.page:
                 result["errors"].append("Page not initialized")
@@ -70,21 +86,45 @@ class ClubGGScraper(BaseScraper):
             title = await self.page.title()
             result["page_title"] = title
 
+            # Skip parsing entirely when the content hasn't changed since the last run
+            previous = await self.reuse_if_unchanged()
+            if previous:
+                return previous
+
+            # Primary: JSON from the API calls the site made while loading
+            games_dedup = self.deduplicator()
+            games = await self.json_records(self._parse_json_game)
+            self.report_partial("network", games)
+            games_dedup.add("network", games)
+
+            # Otherwise fall back to scanning the page content
+            if not games:
+                # Look for any text content that contains poker-related keywords
+                body_content = await self.page_content()
+
+                # Extract games from page content
+                games = await self._extract_games_from_content(body_content)
+                self.report_partial("content", games)
+                games_dedup.add("content", games)
+            games = self.deduplicate(result, "games", games_dedup)
+            result["games"] = [g.model_dump() for g in games]
+
             # Try to find tournament/schedule sections
             # ClubGG typically shows tournaments and cash games in different sections
 
-            # Look for any text content that contains poker-related keywords
-            body_content = await self.page.content()
-
-            # Extract games from page content
-            games = await self._extract_games_from_content(body_content)
-            result["games"] = [g.model_dump() for g in games]
-
             # Try to find specific sections
             tournaments = await self._scrape_tournaments()
+            self.report_partial("tournaments", tournaments)
+            dedup = self.deduplicator()
+            dedup.add("tournaments", tournaments)
+            tournaments = self.deduplicate(result, "tournaments", dedup)
             result["tournaments"] = [t.model_dump() for t in tournaments]
 
             cash_games = await self._scrape_cash_games()
+            self.report_partial("cash_games", cash_games)
+            dedup = self.deduplicator()
+            dedup.add("cash_games", cash_games)
+            cash_games = self.deduplicate(result, "cash_games", dedup)
             result["cash_games"] = [c.model_dump() for c in cash_games]
 
             # If no games found, try alternative methods
@@ -94,8 +134,12 @@ class ClubGGScraper(BaseScraper):
                     "ClubGG may have changed structure or uses client-side rendering."
                 )
                 # Try to extract from embedded JSON
-                embedded_games = await self._extract_from_embedded_json()
+                embedded_games = await self.embedded_json_records(self._parse_json_game)
+                self.report_partial("embedded_json", embedded_games)
                 if embedded_games:
+                    dedup = self.deduplicator()
+                    dedup.add("embedded_json", embedded_games)
+                    embedded_games = self.deduplicate(result, "games", dedup)
                     result["games"] = [g.model_dump() for g in embedded_games]
 
             result["success"] = True
@@ -107,50 +151,68 @@ class ClubGGScraper(BaseScraper):
 
         return result
 
+    async def scrape_http(self) -> dict[str, Any]:
+        """
+        Scrape from the server-rendered page and any JSON endpoints, without
+        a browser. Only structured data counts; the DOM sections need Wix to
+        render.
+        """
+        previous = await self.reuse_if_unchanged()
+        if previous:
+            return previous
+
+        result = self.new_result("http")
+
+        dedup = self.deduplicator()
+        games = await self.json_records(self._parse_json_game)
+        self.report_partial("network", games)
+        dedup.add("network", games)
+        if not games:
+            games = await self.embedded_json_records(self._parse_json_game)
+            self.report_partial("embedded_json", games)
+            dedup.add("embedded_json", games)
+
+        games = self.deduplicate(result, "games", dedup)
+        result["games"] = [g.model_dump() for g in games]
+        result["success"] = True
+        result["game_count"] = len(result["games"])
+        return result
+
     async def _extract_games_from_content(self, html_content: str) -> list[PokerGame]:
         """Extract games from HTML content using regex patterns."""
-        games = []
-
-        # Pattern for buy-ins: $55, $109, etc.
-        buyin_pattern = r'\$(\d+(?:,\d{3})*)\s*(?:buy-?in|entry|GTD)?'
-
-        # Pattern for stakes: 1/2, 2/5, 5/10
-        stakes_pattern = r'(\d+)/(\d+)\s*(?:NL|PLO)?'
-
-        # Pattern for times: 8:00 PM, 20:00
-        time_pattern = r'(\d{1,2}):(\d{2})\s*(AM|PM)?'
+        # The regex scan over the full document runs off the event loop
+        buyins, stakes = await self.run_cpu(scan_content, html_content)
+
+        # Buy-ins are tournaments
+        games = [
+            PokerGame(
+                provider=self.PROVIDER,
+                game_type=GameType.TOURNAMENT,
+                variant=GameVariant.NLHE,
+                tournament=TournamentInfo(
+                    buy_in=buyin * 100,  # Convert to cents
+                    start_time=self.scrape_time,
+                    name=f"${buyin} Tournament",
+                ),
+                is_running=False,
+            )
+            for buyin in buyins
+        ]
 
-        # Find buy-ins (tournaments)
-        for match in re.finditer(buyin_pattern, html_content, re.IGNORECASE):
-            buyin = int(match.group(1).replace(',', ''))
-            if 10 <= buyin <= 10000:  # Reasonable buy-in range
-                games.append(PokerGame(
-                    provider=self.PROVIDER,
-                    game_type=GameType.TOURNAMENT,
-                    variant=GameVariant.NLHE,
-                    tournament=TournamentInfo(
-                        buy_in=buyin * 100,  # Convert to cents
-                        start_time=datetime.now(),
-                        name=f"${buyin} Tournament",
-                    ),
-                    is_running=False,
-                ))
-
-        # Find stakes (cash games)
-        for match in re.finditer(stakes_pattern, html_content):
-            sb = int(match.group(1))
-            bb = int(match.group(2))
-            if sb < bb and sb <= 100 and bb <= 200:  # Reasonable stakes
-                games.append(PokerGame(
-                    provider=self.PROVIDER,
-                    game_type=GameType.CASH,
-                    variant=GameVariant.NLHE,
-                    stakes=Stakes(
-                        small_blind=sb * 100,  # Convert to cents
-                        big_blind=bb * 100,
-                    ),
-                    is_running=True,
-                ))
+        # Stakes are cash games
+        games.extend(
+            PokerGame(
+                provider=self.PROVIDER,
+                game_type=GameType.CASH,
+                variant=GameVariant.NLHE,
+                stakes=Stakes(
+                    small_blind=sb * 100,  # Convert to cents
+                    big_blind=bb * 100,
+                ),
+                is_running=True,
+            )
+            for sb, bb in stakes
+        )
 
         return games
 
@@ -171,17 +233,16 @@ class ClubGGScraper(BaseScraper):
             ".schedule-item",
         ]
 
-        for selector in selectors:
-            try:
-                elements = await self.page.query_selector_all(selector)
-                for element in elements:
-                    text = await element.text_content()
-                    if text:
-                        tournament = self._parse_tournament_text(text)
-                        if tournament:
-                            tournaments.append(tournament)
-            except Exception:
-                continue
+        try:
+            texts_by_selector = await self.extract_texts(selectors)
+        except Exception:
+            return tournaments
+
+        for texts in texts_by_selector.values():
+            for text in texts:
+                tournament = self._parse_tournament_text(text)
+                if tournament:
+                    tournaments.append(tournament)
 
         return tournaments
 
@@ -200,116 +261,44 @@ class ClubGGScraper(BaseScraper):
             "[class*='stakes']",
         ]
 
-        for selector in selectors:
-            try:
-                elements = await self.page.query_selector_all(selector)
-                for element in elements:
-                    text = await element.text_content()
-                    if text:
-                        cash_game = self._parse_cash_game_text(text)
-                        if cash_game:
-                            cash_games.append(cash_game)
-            except Exception:
-                continue
-
-        return cash_games
-
-    async def _extract_from_embedded_json(self) -> list[PokerGame]:
-        """Extract games from embedded JSON in script tags."""
-        games = []
-
-        if not self.page:
-            return games
-
         try:
-            # Get all script content
-            scripts = await self.page.query_selector_all("script")
-            for script in scripts:
-                content = await script.text_content()
-                if not content:
-                    continue
-
-                # Look for embedded data patterns
-                patterns = [
-                    r'window\.__PRELOADED_STATE__\s*=\s*({.*?});',
-                    r'"tournaments"\s*:\s*(\[.*?\])',
-                    r'"games"\s*:\s*(\[.*?\])',
-                ]
-
-                for pattern in patterns:
-                    match = re.search(pattern, content, re.DOTALL)
-                    if match:
-                        try:
-                            import json
-                            data = json.loads(match.group(1))
-                            # Parse the data structure
-                            if isinstance(data, list):
-                                for item in data:
-                                    game = self._parse_json_game(item)
-                                    if game:
-                                        games.append(game)
-                        except Exception:
-                            continue
-
+            texts_by_selector = await self.extract_texts(selectors)
         except Exception:
-            pass
+            return cash_games
 
-        return games
+        for texts in texts_by_selector.values():
+            for text in texts:
+                cash_game = self._parse_cash_game_text(text)
+                if cash_game:
+                    cash_games.append(cash_game)
+
+        return cash_games
 
     def _parse_tournament_text(self, text: str) -> Tournament | None:
         """Parse tournament info from text."""
-        # Look for buy-in
-        buyin_match = re.search(r'\$(\d+(?:,\d{3})*)', text)
-        if not buyin_match:
+        parsed = parse_tournament_text(text, with_name=False)
+        if not parsed:
             return None
 
-        buyin = int(buyin_match.group(1).replace(',', ''))
-
-        # Look for guarantee
-        gtd_match = re.search(r'\$?([\d,]+)\s*(?:k|K)?\s*(?:GTD|guaranteed)', text, re.IGNORECASE)
-        guaranteed = None
-        if gtd_match:
-            guaranteed = int(gtd_match.group(1).replace(',', ''))
-            if 'k' in text.lower() or 'K' in text:
-                guaranteed *= 1000
-            guaranteed *= 100  # Convert to cents
-
-        # Determine variant
-        variant = GameVariant.NLHE
-        if re.search(r'PLO5|5-?card', text, re.IGNORECASE):
-            variant = GameVariant.PLO5
-        elif re.search(r'PLO|omaha', text, re.IGNORECASE):
-            variant = GameVariant.PLO
-
         return Tournament(
             provider=self.PROVIDER,
-            variant=variant,
+            variant=parsed.variant,
             name=text[:100].strip(),
-            buy_in=buyin * 100,
-            start_time=datetime.now(),
-            guaranteed_prize=guaranteed,
+            buy_in=parsed.buy_in,
+            start_time=parsed.start_time(self.scrape_time),
+            guaranteed_prize=parsed.guaranteed,
         )
 
     def _parse_cash_game_text(self, text: str) -> CashGame | None:
         """Parse cash game info from text."""
-        # Look for stakes pattern
-        stakes_match = re.search(r'(\d+)/(\d+)', text)
-        if not stakes_match:
+        stakes = parse_stakes(text)
+        if not stakes:
             return None
 
-        sb = int(stakes_match.group(1))
-        bb = int(stakes_match.group(2))
-
-        # Determine variant
-        variant = GameVariant.NLHE
-        if re.search(r'PLO5|5-?card', text, re.IGNORECASE):
-            variant = GameVariant.PLO5
-        elif re.search(r'PLO|omaha', text, re.IGNORECASE):
-            variant = GameVariant.PLO
-
+        sb, bb = stakes
         return CashGame(
             provider=self.PROVIDER,
-            variant=variant,
+            variant=detect_variant(text),
             stakes=Stakes(
                 small_blind=sb * 100,
                 big_blind=bb * 100,
@@ -333,7 +322,7 @@ class ClubGGScraper(BaseScraper):
                     variant=GameVariant.NLHE,
                     tournament=TournamentInfo(
                         buy_in=int(buyin) * 100,
-                        start_time=datetime.now(),
+                        start_time=self.scrape_time,
                         name=data.get('name', ''),
                     ),
                 )
@@ -0,0 +1,273 @@
+"""
+Cross-method deduplication of scraped records.
+
+Each scraper runs several extraction methods over the same page, and they
+mostly find the same tournaments and games. The methods' output goes
+through one Deduplicator per record list: records are grouped under
+normalized keys and each group is merged into its richest record, with
+missing fields filled in from the others.
+"""
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Iterable, TypeVar
+
+from pydantic import BaseModel
+
+from ..models.poker import CashGame, PokerGame, Tournament
+
+R = TypeVar("R", bound=BaseModel)
+
+# How far a record from each extraction method can be trusted: structured
+# JSON beats rendered text, which beats regex hits in raw HTML
+METHOD_RANK = {
+    "network": 3,
+    "scripts": 3,
+    "embedded_json": 3,
+    "swiper": 2,
+    "section": 2,
+    "tables": 2,
+    "cards": 2,
+    "tournaments": 2,
+    "cash_games": 2,
+    "content": 1,
+}
+DEFAULT_RANK = 2
+
+_NON_WORD_RE = re.compile(r"[^\w$]+")
+
+
+def normalize_name(name: str | None) -> str:
+    """Lowercase, punctuation-insensitive, whitespace-collapsed name."""
+    return " ".join(_NON_WORD_RE.sub(" ", (name or "").lower()).split())
+
+
+def placeholder_name(buy_in: int) -> str:
+    """Name the scrapers give a tournament found without one, e.g. "$109 Tournament"."""
+    return f"${buy_in // 100} Tournament"
+
+
+def _is_placeholder(normalized: str, buy_in: int) -> bool:
+    return normalized == f"${buy_in // 100} tournament"
+
+
+@dataclass
+class _Identity:
+    """What a record is matched on; `exact` records (cash games) only match exactly."""
+
+    kind: str
+    tournament_id: str | None = None
+    name: str = ""  # normalized; empty when the record only has a placeholder name
+    buy_in: int | None = None
+    start: datetime | None = None  # to the minute; None when unknown
+    exact: tuple | None = None
+
+
+@dataclass
+class _Member:
+    rank: int
+    richness: int
+    order: int
+    record: BaseModel
+    identity: _Identity
+
+
+@dataclass
+class _Group:
+    members: list[_Member] = field(default_factory=list)
+    identity: _Identity | None = None
+    first_seen: int = 0
+
+
+class Deduplicator:
+    """
+    Merges duplicate records found by different extraction methods.
+
+    Tournaments (and tournament games) match, in order, on provider
+    tournament id, on normalized name + buy-in + start minute, then more
+    loosely: a record without a start time (`unknown_start`, the time the
+    scraper defaults to) matches on name + buy-in, and a record with only
+    a placeholder name matches on buy-in + start minute, or on buy-in
+    alone when its start or the group's is unknown. Tz-aware starts (from
+    JSON) are compared as naive local time, the form text-parsed starts
+    take. Cash games match on variant, stakes and club. Records are taken
+    best method first, so loose records fold into the richest group that
+    fits them.
+
+    Each group becomes its best record (highest method rank, then most
+    fields set) with empty fields, an unknown start or a placeholder name
+    filled in from the others.
+    """
+
+    def __init__(self, unknown_start: datetime | None = None):
+        self.unknown_start = unknown_start
+        self._candidates: list[tuple[int, int, str, BaseModel]] = []
+        self._input_by_method: dict[str, int] = {}
+
+    def add(self, method: str, records: Iterable[BaseModel]) -> None:
+        """Queue one extraction method's records."""
+        rank = METHOD_RANK.get(method, DEFAULT_RANK)
+        count = 0
+        for record in records:
+            self._candidates.append((rank, len(self._candidates), method, record))
+            count += 1
+        self._input_by_method[method] = self._input_by_method.get(method, 0) + count
+
+    def results(self) -> list[BaseModel]:
+        """Merged records, in the order their groups were first seen."""
+        by_id: dict[tuple, _Group] = {}
+        by_full: dict[tuple, _Group] = {}
+        by_name: dict[tuple, _Group] = {}
+        by_start: dict[tuple, _Group] = {}
+        by_buy_in: dict[tuple, _Group] = {}
+        groups: list[_Group] = []
+
+        # One pass, best method first
+        for rank, order, _, record in sorted(self._candidates, key=lambda c: (-c[0], c[1])):
+            ident = self._identify(record)
+            group = self._match(ident, by_id, by_full, by_name, by_start, by_buy_in)
+            if group is None:
+                group = _Group(identity=ident, first_seen=order)
+                groups.append(group)
+            elif group.identity.start is None and ident.start is not None:
+                # A timed record pins down a group that only had loose members so far
+                group.identity = ident
+            group.members.append(_Member(rank, self._richness(record, ident), order, record, ident))
+            group.first_seen = min(group.first_seen, order)
+
+            if ident.exact is not None:
+                by_full.setdefault(ident.exact, group)
+                continue
+            if ident.tournament_id:
+                by_id.setdefault((ident.kind, ident.tournament_id), group)
+            if ident.name and ident.start is not None:
+                by_full.setdefault((ident.kind, ident.name, ident.buy_in, ident.start), group)
+            if ident.name:
+                by_name.setdefault((ident.kind, ident.name, ident.buy_in), group)
+            if ident.start is not None:
+                by_start.setdefault((ident.kind, ident.buy_in, ident.start), group)
+            by_buy_in.setdefault((ident.kind, ident.buy_in), group)
+
+        groups.sort(key=lambda g: g.first_seen)
+        return [self._merge(group) for group in groups]
+
+    def stats(self, output: int) -> dict:
+        """Input and output counts, for reporting how much deduplication saved."""
+        total = sum(self._input_by_method.values())
+        return {
+            "input": total,
+            "output": output,
+            "removed": total - output,
+            "reduction": round(1 - output / total, 3) if total else 0.0,
+            "by_method": dict(self._input_by_method),
+        }
+
+    @staticmethod
+    def _match(ident: _Identity, by_id, by_full, by_name, by_start, by_buy_in) -> _Group | None:
+        if ident.exact is not None:
+            return by_full.get(ident.exact)
+        if ident.tournament_id and (group := by_id.get((ident.kind, ident.tournament_id))):
+            return group
+        if ident.name and ident.start is not None:
+            group = by_full.get((ident.kind, ident.name, ident.buy_in, ident.start))
+            if group:
+                return group
+            # Same name and buy-in, but that group never had a start time
+            group = by_name.get((ident.kind, ident.name, ident.buy_in))
+            return group if group and group.identity.start is None else None
+        if ident.name:
+            return by_name.get((ident.kind, ident.name, ident.buy_in))
+        if ident.start is not None:
+            group = by_start.get((ident.kind, ident.buy_in, ident.start))
+            if group:
+                return group
+            # Same buy-in at another time is a different tournament
+            group = by_buy_in.get((ident.kind, ident.buy_in))
+            return group if group and group.identity.start is None else None
+        return by_buy_in.get((ident.kind, ident.buy_in))
+
+    def _start(self, start: datetime | None) -> datetime | None:
+        if start is None:
+            return None
+        if start.tzinfo is not None:
+            # JSON starts are tz-aware; text parsed from the page is naive local time
+            start = start.astimezone().replace(tzinfo=None)
+        start = start.replace(second=0, microsecond=0)
+        return None if start == self.unknown_start else start
+
+    def _identify(self, record: BaseModel) -> _Identity:
+        if isinstance(record, Tournament):
+            info, kind = record, "T"
+        elif isinstance(record, PokerGame) and record.tournament:
+            info, kind = record.tournament, f"G:{record.game_type.value}"
+        elif isinstance(record, PokerGame):
+            stakes = record.stakes
+            return _Identity(kind="G", exact=(
+                "G", record.game_type.value, record.variant.value, record.club_id,
+                stakes.small_blind if stakes else None, stakes.big_blind if stakes else None,
+            ))
+        elif isinstance(record, CashGame):
+            return _Identity(kind="C", exact=(
+                "C", record.variant.value, record.club_id, record.stakes.small_blind, record.stakes.big_blind,
+            ))
+        else:
+            return _Identity(kind=type(record).__name__, exact=(type(record).__name__, record.model_dump_json()))
+
+        name = normalize_name(info.name)
+        if _is_placeholder(name, info.buy_in):
+            name = ""
+        return _Identity(
+            kind=kind,
+            tournament_id=info.tournament_id or None,
+            name=name,
+            buy_in=info.buy_in,
+            start=self._start(info.start_time),
+        )
+
+    @staticmethod
+    def _richness(record: BaseModel, ident: _Identity) -> int:
+        filled = sum(1 for value in record.__dict__.values() if value not in (None, "", 0, False, []))
+        return filled + (ident.start is not None) + bool(ident.name)
+
+    def _merge(self, group: _Group) -> BaseModel:
+        members = group.members
+        if len(members) == 1:
+            return members[0].record
+        members = sorted(members, key=lambda m: (-m.rank, -m.richness, m.order))
+        best, others = members[0], members[1:]
+
+        if isinstance(best.record, PokerGame) and best.record.tournament:
+            info = best.record.tournament
+            tournament = self._fill(info, best.identity, [(m.record.tournament, m.identity) for m in others])
+            record = best.record.model_copy(update={"tournament": tournament}) if tournament is not info else best.record
+            return self._fill(record, best.identity, [(m.record, m.identity) for m in others], skip=("tournament",))
+        return self._fill(best.record, best.identity, [(m.record, m.identity) for m in others])
+
+    @staticmethod
+    def _fill(
+        best: R, ident: _Identity, others: list[tuple[BaseModel | None, _Identity]], skip: tuple[str, ...] = ()
+    ) -> R:
+        """`best` with empty fields, an unknown start or a placeholder name taken from `others`."""
+        updates = {}
+        for name, value in best.__dict__.items():
+            if name in skip:
+                continue
+            if name == "start_time":
+                missing = ident.start is None
+            elif name == "name" and ident.kind != "G" and ident.exact is None:
+                missing = not ident.name
+            else:
+                missing = value is None or value == ""
+            if not missing:
+                continue
+            for other, other_ident in others:
+                candidate = getattr(other, name, None)
+                if candidate is None or candidate == "":
+                    continue
+                if name == "start_time" and other_ident.start is None:
+                    continue
+                if name == "name" and not other_ident.name:
+                    continue
+                updates[name] = candidate
+                break
+        return best.model_copy(update=updates) if updates else best
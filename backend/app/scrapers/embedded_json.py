@@ -0,0 +1,115 @@
+"""
+Extraction of JSON data embedded in inline scripts.
+
+Pages ship their schedule as `window.__INITIAL_DATA__ = {...}` style
+assignments or as `"tournaments": [...]` members of a larger bundle.
+Instead of regex-capturing the value (which stops at the first closing
+bracket, often inside a string), anchors are found in one linear scan and
+the balanced value after each one is decoded in place with
+`json.JSONDecoder.raw_decode`, so the script is never sliced or copied.
+"""
+import json
+from typing import Any, Iterable
+
+# Globals that frameworks assign the page's initial state to
+DEFAULT_GLOBALS = ("__INITIAL_DATA__", "__PRELOADED_STATE__")
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+
+def _anchors(keys: tuple[str, ...], names: tuple[str, ...]) -> list[tuple[str, bool]]:
+    """`(literal, is_global)` pairs: `"key"` followed by `:`, or `name` followed by `=`."""
+    return [(f'"{key}"', False) for key in keys] + [(name, True) for name in names]
+
+
+def _value_start(text: str, literal: str, is_global: bool, at: int) -> int | None:
+    """Index of the value after an anchor literal found at `at`, or None if it isn't one."""
+    if is_global and at and (text[at - 1].isalnum() or text[at - 1] in "_$"):
+        return None
+    end = len(text)
+    pos = at + len(literal)
+    while pos < end and text[pos] in _WHITESPACE:
+        pos += 1
+    if pos >= end or text[pos] != ("=" if is_global else ":"):
+        return None
+    if is_global and text.startswith("=", pos + 1):
+        return None
+    pos += 1
+    while pos < end and text[pos] in _WHITESPACE:
+        pos += 1
+    return pos if pos < end and text[pos] in "[{" else None
+
+
+def iter_embedded_json(
+    text: str, keys: Iterable[str] = (), names: Iterable[str] = DEFAULT_GLOBALS
+) -> Iterable[Any]:
+    """
+    Yield each JSON object or array that follows an anchor in `text`.
+
+    Each anchor literal is located with `str.find` and the hits are walked
+    in order, so the scan is linear in the length of the script. Anchors
+    inside a value that was decoded are skipped (the outer value already
+    contains them). Values that aren't valid JSON, such as JS object
+    literals with bare keys, are skipped too.
+    """
+    anchors = _anchors(tuple(keys), tuple(names))
+    # Next occurrence of each anchor at or after the scan position
+    hits = [text.find(literal) for literal, _ in anchors]
+    pos = 0
+    while True:
+        found = [(at, n) for n, at in enumerate(hits) if at >= 0]
+        if not found:
+            return
+        at, n = min(found)
+        literal, is_global = anchors[n]
+        next_pos = at + 1
+        start = _value_start(text, literal, is_global, at)
+        if start is not None:
+            try:
+                value, next_pos = _decoder.raw_decode(text, start)
+            except ValueError:
+                pass
+            else:
+                yield value
+        pos = max(pos, next_pos)
+        hits = [text.find(anchors[k][0], pos) if 0 <= hit < pos else hit for k, hit in enumerate(hits)]
+
+
+def find_json_records(data: Any, keys: tuple[str, ...]) -> list[dict]:
+    """
+    Collect the objects from every list stored under one of `keys`, at
+    any depth. A top-level list is treated as a list of records.
+    """
+    if isinstance(data, list):
+        return [item for item in data if isinstance(item, dict)]
+
+    records = []
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key in keys and isinstance(value, list):
+                    records.extend(item for item in value if isinstance(item, dict))
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
+        elif isinstance(node, list):
+            stack.extend(item for item in node if isinstance(item, (dict, list)))
+    return records
+
+
+def find_embedded_records(
+    scripts: list[str], keys: tuple[str, ...], names: tuple[str, ...] = DEFAULT_GLOBALS
+) -> list[dict]:
+    """
+    The `keys` records of every embedded JSON value across `scripts`.
+    Runs in the parse pool, so only the records are sent back, not the
+    whole decoded page state.
+    """
+    return [
+        record
+        for script in scripts
+        for value in iter_embedded_json(script, keys, names)
+        for record in find_json_records(value, keys)
+    ]
@@ -0,0 +1,150 @@
+"""
+Shared text parsing for tournament and cash-game strings.
+
+All patterns are compiled once at import. `parse_tournament_text` finds the
+buy-in, guarantee and start time in a single tokenizing pass over the text
+and returns a compact `ParsedText` record that each scraper turns into its
+own models (applying its own buy-in bounds and name fallbacks).
+"""
+import re
+from datetime import datetime
+from typing import NamedTuple
+
+from ..models.poker import GameVariant
+
+# One pass picks up every numeric token. Guarantees are tried before plain
+# money so "$10K GTD" is never mistaken for a buy-in.
+_TOKEN_RE = re.compile(
+    r"""
+    (?P<gtd>\$?\s*(?P<gtd_amount>\d[\d,]*(?:\.\d+)?)\s*(?P<gtd_unit>[KM])?\s*(?:GTD|guaranteed))
+    | (?P<money>\$\s*(?P<amount>\d[\d,]*(?:\.\d+)?)(?P<unit>[KM]\b)?)
+    | (?P<time>(?<!\d)(?P<hour>\d{1,2}):(?P<minute>\d{2})\s*(?P<period>AM|PM|ET|PT|UTC)?)
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+
+_NAME_RE = re.compile(
+    r"\b((?:[A-Za-z][\w\s\-]*)?(?:Championship|Series|Main Event|Daily|Weekly|Sunday|Saturday|Turbo|Hyper))"
+)
+_NUMBERED_NAME_RE = re.compile(r"#\d+[:\s]+([A-Za-z][\w\s\-]+)")
+_MONEY_RE = re.compile(r"(\d[\d,]*(?:\.\d+)?)(?:\s*([KM])\b)?", re.IGNORECASE)
+_STAKES_RE = re.compile(r"(\d+)/(\d+)")
+
+_UNITS = {"k": 1_000, "m": 1_000_000}
+
+TOURNAMENT_KEYWORDS = (
+    "$", "buy-in", "gtd", "guaranteed", "tournament", "nlhe", "plo", "sat", "satellite",
+)
+
+
+class ParsedText(NamedTuple):
+    """Fields found in a tournament text. Money is in cents."""
+
+    buy_in: int
+    guaranteed: int | None
+    hour: int | None
+    minute: int | None
+    variant: GameVariant
+    name: str | None
+
+    def start_time(self, base: datetime | None = None) -> datetime:
+        """`base` (default now) with the parsed time of day applied, if any."""
+        start = base or datetime.now()
+        if self.hour is None:
+            return start
+        return start.replace(hour=self.hour, minute=self.minute)
+
+
+def _to_cents(amount: str, unit: str | None) -> int:
+    try:
+        value = float(amount.replace(",", ""))
+    except ValueError:
+        return 0
+    return int(round(value * _UNITS.get((unit or "").lower(), 1) * 100))
+
+
+def parse_money(text: str) -> float:
+    """Parse a money string like "$1,500", "$10K" or "2.5M" into dollars."""
+    match = _MONEY_RE.search(text)
+    if not match:
+        return 0.0
+    return _to_cents(match.group(1), match.group(2)) / 100
+
+
+def detect_variant(text: str) -> GameVariant:
+    """Game variant from free text; NLHE unless something else is named."""
+    lowered = text.lower()
+    if "plo5" in lowered or "5-card" in lowered or "5card" in lowered:
+        return GameVariant.PLO5
+    if "plo" in lowered or "omaha" in lowered:
+        return GameVariant.PLO
+    if "mixed" in lowered or "horse" in lowered:
+        return GameVariant.MIXED
+    return GameVariant.NLHE
+
+
+def looks_like_tournament(text: str) -> bool:
+    """Cheap pre-filter before the full parse."""
+    if not text:
+        return False
+    lowered = text.lower()
+    return any(keyword in lowered for keyword in TOURNAMENT_KEYWORDS)
+
+
+def parse_name(text: str) -> str | None:
+    """Descriptive tournament name, e.g. "Sunday Million" or "#12: Bounty Hunter"."""
+    match = _NAME_RE.search(text) or _NUMBERED_NAME_RE.search(text)
+    return match.group(1).strip() if match else None
+
+
+def parse_tournament_text(text: str, with_name: bool = True) -> ParsedText | None:
+    """
+    Parse buy-in, guarantee, start time, variant and (optionally) name.
+
+    Returns None when the text has no buy-in. The first amount of each kind
+    wins, matching how schedules list "buy-in ... guarantee ... time".
+    """
+    if not text:
+        return None
+
+    buy_in = guaranteed = hour = minute = None
+    for match in _TOKEN_RE.finditer(text):
+        kind = match.lastgroup
+        if kind == "money":
+            if buy_in is None:
+                buy_in = _to_cents(match.group("amount"), match.group("unit"))
+        elif kind == "gtd":
+            if guaranteed is None:
+                guaranteed = _to_cents(match.group("gtd_amount"), match.group("gtd_unit"))
+        elif kind == "time" and hour is None:
+            h, m = int(match.group("hour")), int(match.group("minute"))
+            period = (match.group("period") or "").upper()
+            if period == "PM" and h < 12:
+                h += 12
+            elif period == "AM" and h == 12:
+                h = 0
+            if h < 24 and m < 60:
+                hour, minute = h, m
+
+        if buy_in is not None and guaranteed is not None and hour is not None:
+            break
+
+    if buy_in is None:
+        return None
+
+    return ParsedText(
+        buy_in=buy_in,
+        guaranteed=guaranteed,
+        hour=hour,
+        minute=minute,
+        variant=detect_variant(text),
+        name=parse_name(text) if with_name else None,
+    )
+
+
+def parse_stakes(text: str) -> tuple[int, int] | None:
+    """Small/big blind (in the site's units) from a "1/2"-style string."""
+    match = _STAKES_RE.search(text)
+    if not match:
+        return None
+    return int(match.group(1)), int(match.group(2))
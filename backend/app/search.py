@@ -0,0 +1,195 @@
+import base64
+import json
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Iterable
+
+from .cache import ResultCache
+from .store import _known_start, _minute, tournament_fingerprint
+
+# (start_time, buy_in, fingerprint): the result order and the cursor key
+SortKey = tuple[datetime, int, str]
+
+# Where tournaments without a known (parseable) start time sort
+_NO_START = datetime.min.replace(tzinfo=timezone.utc)
+
+
+def normalize_start(value: Any) -> datetime:
+    """
+    A start time as an aware UTC datetime. Scrapers emit both aware UTC
+    values (from JSON) and naive local ones (parsed from page text), which
+    don't compare; naive values are taken as local time.
+    """
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return _NO_START
+    if not isinstance(value, datetime):
+        return _NO_START
+    return value.astimezone(timezone.utc)
+
+
+def _enum_value(value: Any) -> Any:
+    return getattr(value, "value", value)
+
+
+def sort_key(t: dict, unknown_start: str | None = None) -> SortKey:
+    """
+    `unknown_start` is the scrape time (to the minute) of the result `t`
+    came from; a start equal to it is the placeholder the scrapers give
+    untimed records, and sorts as unknown.
+    """
+    start = _known_start(t.get("start_time"), unknown_start)
+    return normalize_start(start), int(t.get("buy_in") or 0), tournament_fingerprint(t, unknown_start)
+
+
+def encode_cursor(key: SortKey) -> str:
+    start, buy_in, fingerprint = key
+    payload = json.dumps([start.isoformat(), buy_in, fingerprint])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> SortKey:
+    """Inverse of `encode_cursor`; raises ValueError on anything malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        start, buy_in, fingerprint = json.loads(base64.urlsafe_b64decode(padded))
+        return normalize_start(datetime.fromisoformat(start)), int(buy_in), str(fingerprint)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+
+@dataclass
+class TournamentQuery:
+    """Search filters. Money is in cents; unset fields don't filter."""
+
+    provider: str | None = None
+    variant: str | None = None
+    min_buy_in: int | None = None
+    max_buy_in: int | None = None
+    min_guaranteed: int | None = None
+    start_after: datetime | None = None
+    start_before: datetime | None = None
+    late_reg_open: bool | None = None
+
+    def matches(self, t: dict) -> bool:
+        """Equality/threshold filters not served by the sorted indexes."""
+        if self.provider is not None and _enum_value(t.get("provider")) != self.provider:
+            return False
+        if self.variant is not None and _enum_value(t.get("variant")) != self.variant:
+            return False
+        if self.min_guaranteed is not None and (t.get("guaranteed_prize") or 0) < self.min_guaranteed:
+            return False
+        if self.late_reg_open is not None and bool(t.get("late_reg_open")) != self.late_reg_open:
+            return False
+        return True
+
+
+class TournamentIndex:
+    """
+    Immutable, sorted in-memory index over a set of tournaments.
+
+    Tournaments are kept in (start_time, buy_in, fingerprint) order, which
+    is also the result order. A second array sorted by buy-in maps back to
+    positions in that order, so both range filters are answered with
+    bisect instead of a scan; the narrower range drives the query and the
+    remaining predicates are checked only on its candidates. Cursors carry
+    the last sort key, so pagination stays stable across index rebuilds.
+    Tournaments without a known start sort first and never match a start
+    window.
+    """
+
+    def __init__(self, tournaments: Iterable[dict], unknown_start: str | None = None):
+        self._build((sort_key(t, unknown_start), t) for t in tournaments)
+
+    @classmethod
+    def from_results(cls, results: Iterable[dict]) -> "TournamentIndex":
+        """Index the tournaments of several scrape results, each with its own scrape time."""
+        index = cls([])
+        index._build(
+            (sort_key(t, _minute(result.get("scrape_time")) or None), t)
+            for result in results
+            for t in result.get("tournaments") or []
+        )
+        return index
+
+    def _build(self, keyed: Iterable[tuple[SortKey, dict]]) -> None:
+        keyed = sorted(keyed, key=lambda pair: pair[0])
+        self.keys: list[SortKey] = [key for key, _ in keyed]
+        self.items: list[dict] = [t for _, t in keyed]
+        self._start_keys = [key[0] for key in self.keys]
+        self._first_known = bisect_right(self._start_keys, _NO_START)
+
+        by_buy_in = sorted((key[1], rank) for rank, key in enumerate(self.keys))
+        self._buy_in_keys = [buy_in for buy_in, _ in by_buy_in]
+        self._buy_in_ranks = [rank for _, rank in by_buy_in]
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def search(
+        self, query: TournamentQuery, limit: int = 50, cursor: str | None = None
+    ) -> tuple[list[dict], str | None]:
+        """Return one page of matches and the cursor for the next page (or None)."""
+        lo = 0 if query.start_after is None else bisect_left(self._start_keys, normalize_start(query.start_after))
+        hi = len(self.keys) if query.start_before is None else bisect_right(self._start_keys, normalize_start(query.start_before))
+        if query.start_after is not None or query.start_before is not None:
+            lo = max(lo, self._first_known)
+        if cursor:
+            lo = max(lo, bisect_right(self.keys, decode_cursor(cursor)))
+
+        candidates: Iterable[int] = range(lo, hi)
+        if query.min_buy_in is not None or query.max_buy_in is not None:
+            b_lo = 0 if query.min_buy_in is None else bisect_left(self._buy_in_keys, query.min_buy_in)
+            b_hi = len(self._buy_in_keys) if query.max_buy_in is None else bisect_right(self._buy_in_keys, query.max_buy_in)
+            if b_hi - b_lo < hi - lo:
+                candidates = sorted(r for r in self._buy_in_ranks[b_lo:b_hi] if lo <= r < hi)
+            else:
+                min_buy_in = query.min_buy_in if query.min_buy_in is not None else float("-inf")
+                max_buy_in = query.max_buy_in if query.max_buy_in is not None else float("inf")
+                candidates = (r for r in candidates if min_buy_in <= self.keys[r][1] <= max_buy_in)
+
+        page: list[int] = []
+        for rank in candidates:
+            if query.matches(self.items[rank]):
+                page.append(rank)
+                if len(page) > limit:
+                    break
+
+        next_cursor = encode_cursor(self.keys[page[limit - 1]]) if len(page) > limit else None
+        return [self.items[r] for r in page[:limit]], next_cursor
+
+
+class SnapshotSearch:
+    """
+    Keeps a `TournamentIndex` over the latest cached result of each provider.
+
+    The index is rebuilt lazily, only when a cache entry has been replaced
+    since the last query, so searches never trigger or wait on a scrape.
+    """
+
+    def __init__(self):
+        self._index = TournamentIndex([])
+        self._versions: dict[str, float] = {}
+        self.rebuilds = 0
+
+    def index(self, cache: ResultCache, providers: Iterable[str]) -> TournamentIndex:
+        entries = {p: entry for p in providers if (entry := cache.peek(p)) is not None}
+        versions = {p: entry.stored_at for p, entry in entries.items()}
+        if versions != self._versions:
+            self._index = TournamentIndex.from_results(
+                entry.value for entry in entries.values() if isinstance(entry.value, dict)
+            )
+            self._versions = versions
+            self.rebuilds += 1
+        return self._index
+
+    def snapshot_times(self, cache: ResultCache) -> dict[str, str]:
+        """When each indexed provider snapshot was scraped."""
+        return {
+            p: entry.scraped_at.isoformat()
+            for p in self._versions
+            if (entry := cache.peek(p)) is not None
+        }
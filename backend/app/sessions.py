@@ -0,0 +1,128 @@
+import hashlib
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Any
+
+from playwright.async_api import BrowserContext
+
+from .config import get_settings
+
+settings = get_settings()
+
+# Hop-by-hop and encoding headers that no longer describe a decoded, stored body
+_DROPPED_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding", "connection"})
+
+
+class SessionStore:
+    """
+    Per-provider browser sessions and static asset cache on disk.
+
+    After a successful scrape the context's storage state (cookies and
+    localStorage) is saved, and new contexts for that provider start from
+    it, so consent walls and geo/locale redirects are already behind them.
+    Scripts and stylesheets are cached per provider as well, since pooled
+    contexts don't keep Chromium's disk cache. A failed scrape invalidates
+    both, in case the saved session is what broke it.
+
+    Layout: `<root>/<provider>/storage_state.json` and
+    `<root>/<provider>/http_cache/<sha1(url)>.{json,body}`. Writes go
+    through a temp file and rename, so worker processes can share it.
+    """
+
+    CACHED_RESOURCE_TYPES = frozenset({"script", "stylesheet"})
+
+    def __init__(
+        self,
+        root: str | Path | None = None,
+        max_age: float | None = None,
+        cache_max_age: float | None = None,
+    ):
+        self.root = Path(root or settings.session_dir)
+        self.max_age = settings.session_max_age if max_age is None else max_age
+        self.cache_max_age = settings.http_cache_max_age if cache_max_age is None else cache_max_age
+
+    def state_path(self, provider: str) -> Path:
+        return self.root / provider / "storage_state.json"
+
+    def cache_dir(self, provider: str) -> Path:
+        return self.root / provider / "http_cache"
+
+    def load_state(self, provider: str) -> str | None:
+        """Path of the provider's saved storage state, unless missing or expired."""
+        path = self.state_path(provider)
+        try:
+            age = time.time() - path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+        if age > self.max_age:
+            path.unlink(missing_ok=True)
+            return None
+        return str(path)
+
+    async def save_state(self, provider: str, context: BrowserContext) -> None:
+        """Snapshot the context's cookies and localStorage for the next scrape."""
+        path = self.state_path(provider)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        await context.storage_state(path=tmp)
+        os.replace(tmp, path)
+
+    def invalidate(self, provider: str) -> None:
+        """Drop the provider's saved session and cached assets."""
+        self.state_path(provider).unlink(missing_ok=True)
+        shutil.rmtree(self.cache_dir(provider), ignore_errors=True)
+
+    def _cache_paths(self, provider: str, url: str) -> tuple[Path, Path]:
+        key = hashlib.sha1(url.encode()).hexdigest()
+        directory = self.cache_dir(provider)
+        return directory / f"{key}.json", directory / f"{key}.body"
+
+    def get_asset(self, provider: str, url: str) -> tuple[int, dict[str, str], bytes] | None:
+        """Cached `(status, headers, body)` for a URL, if present and fresh."""
+        meta_path, body_path = self._cache_paths(provider, url)
+        try:
+            meta = json.loads(meta_path.read_text())
+            if time.time() - meta["stored_at"] > self.cache_max_age or meta["url"] != url:
+                return None
+            return meta["status"], meta["headers"], body_path.read_bytes()
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def put_asset(self, provider: str, url: str, status: int, headers: dict[str, str], body: bytes) -> None:
+        meta_path, body_path = self._cache_paths(provider, url)
+        meta_path.parent.mkdir(parents=True, exist_ok=True)
+        suffix = f".{os.getpid()}.tmp"
+        body_tmp = body_path.with_suffix(suffix)
+        body_tmp.write_bytes(body)
+        os.replace(body_tmp, body_path)
+        # Meta last: an entry only counts once its body is in place
+        meta_tmp = meta_path.with_suffix(suffix)
+        meta_tmp.write_text(json.dumps({
+            "url": url,
+            "status": status,
+            "headers": headers,
+            "stored_at": time.time(),
+        }))
+        os.replace(meta_tmp, meta_path)
+
+    @staticmethod
+    def cacheable(status: int, headers: dict[str, str]) -> bool:
+        cache_control = headers.get("cache-control", "").lower()
+        return status == 200 and "no-store" not in cache_control and "private" not in cache_control
+
+    @staticmethod
+    def stored_headers(headers: dict[str, str]) -> dict[str, str]:
+        return {k: v for k, v in headers.items() if k.lower() not in _DROPPED_HEADERS}
+
+    def stats(self) -> dict[str, Any]:
+        providers = sorted(p.name for p in self.root.iterdir() if p.is_dir()) if self.root.exists() else []
+        return {
+            provider: {
+                "session": self.state_path(provider).exists(),
+                "cached_assets": len(list(self.cache_dir(provider).glob("*.json"))),
+            }
+            for provider in providers
+        }
@@ -0,0 +1,68 @@
+import asyncio
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable
+
+
+@dataclass
+class FlightCounters:
+    """Per-key request accounting."""
+
+    requests: int = 0
+    executions: int = 0
+    coalesced: int = 0
+    failures: int = 0
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls for the same key onto one in-flight task.
+
+    The first caller for a key starts the work; everyone arriving while it
+    runs awaits the same task. Waiters are shielded from the task, so a
+    client disconnecting (cancelling its waiter) never cancels the shared
+    scrape for the others.
+    """
+
+    def __init__(self):
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._counters: dict[str, FlightCounters] = {}
+
+    async def run(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Run `fn` for `key`, or join the call already in flight."""
+        counters = self._counters.setdefault(key, FlightCounters())
+        counters.requests += 1
+
+        task = self._inflight.get(key)
+        if task is None:
+            counters.executions += 1
+            task = asyncio.create_task(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._finish(key, t))
+        else:
+            counters.coalesced += 1
+
+        return await asyncio.shield(task)
+
+    def in_flight(self, key: str) -> bool:
+        """Whether a call for `key` is currently running."""
+        return key in self._inflight
+
+    async def drain(self, timeout: float) -> None:
+        """Wait up to `timeout` seconds for every in-flight call to finish."""
+        tasks = list(self._inflight.values())
+        if tasks:
+            await asyncio.wait(tasks, timeout=timeout)
+
+    def stats(self) -> dict[str, dict]:
+        """Counters per key, plus whether a call is currently in flight."""
+        return {
+            key: {**asdict(counters), "in_flight": key in self._inflight}
+            for key, counters in self._counters.items()
+        }
+
+    def _finish(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Retrieve the exception so an unawaited failure isn't logged as lost
+        if not task.cancelled() and task.exception() is not None:
+            self._counters[key].failures += 1
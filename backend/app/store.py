@@ -0,0 +1,328 @@
+import hashlib
+import json
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+from .config import get_settings
+
+settings = get_settings()
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scrapes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    provider TEXT NOT NULL,
+    scraped_at TEXT NOT NULL,
+    success INTEGER NOT NULL,
+    tournaments INTEGER NOT NULL,
+    cash_games INTEGER NOT NULL,
+    games INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_scrapes_provider ON scrapes (provider, scraped_at);
+
+CREATE TABLE IF NOT EXISTS tournaments (
+    fingerprint TEXT PRIMARY KEY,
+    provider TEXT NOT NULL,
+    variant TEXT NOT NULL,
+    tournament_id TEXT,
+    name TEXT NOT NULL,
+    buy_in INTEGER NOT NULL,
+    start_time TEXT,
+    guaranteed_prize INTEGER,
+    late_reg_open INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tournaments_provider ON tournaments (provider);
+CREATE INDEX IF NOT EXISTS idx_tournaments_variant ON tournaments (variant);
+CREATE INDEX IF NOT EXISTS idx_tournaments_buy_in ON tournaments (buy_in);
+CREATE INDEX IF NOT EXISTS idx_tournaments_start_time ON tournaments (start_time);
+
+CREATE TABLE IF NOT EXISTS cash_games (
+    fingerprint TEXT PRIMARY KEY,
+    provider TEXT NOT NULL,
+    variant TEXT NOT NULL,
+    small_blind INTEGER NOT NULL,
+    big_blind INTEGER NOT NULL,
+    club_id TEXT,
+    data TEXT NOT NULL,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_cash_games_provider ON cash_games (provider);
+CREATE INDEX IF NOT EXISTS idx_cash_games_variant ON cash_games (variant);
+
+CREATE TABLE IF NOT EXISTS games (
+    fingerprint TEXT PRIMARY KEY,
+    provider TEXT NOT NULL,
+    game_type TEXT NOT NULL,
+    variant TEXT NOT NULL,
+    buy_in INTEGER,
+    start_time TEXT,
+    data TEXT NOT NULL,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_games_provider ON games (provider);
+CREATE INDEX IF NOT EXISTS idx_games_variant ON games (variant);
+CREATE INDEX IF NOT EXISTS idx_games_buy_in ON games (buy_in);
+CREATE INDEX IF NOT EXISTS idx_games_start_time ON games (start_time);
+"""
+
+
+def _iso(value: Any) -> str | None:
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _utc(value: Any) -> str | None:
+    """
+    Start time as a UTC ISO string, so stored starts and query bounds
+    compare correctly as text. Naive times are taken as local time.
+    """
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return value
+    if isinstance(value, datetime):
+        return value.astimezone(timezone.utc).isoformat()
+    return _iso(value)
+
+
+def _minute(value: Any) -> str:
+    """Start time truncated to the minute, so re-parsed times stay stable."""
+    return (_iso(value) or "")[:16]
+
+
+def _known_start(value: Any, unknown_start: str | None) -> Any:
+    """
+    `value`, or None when it is the scrape-time placeholder the scrapers
+    give records without a start time (`unknown_start`, to the minute).
+    """
+    return None if unknown_start and _minute(value) == unknown_start else value
+
+
+def _digest(*parts: Any) -> str:
+    key = "|".join("" if p is None else str(p.value if isinstance(p, Enum) else p) for p in parts)
+    return hashlib.sha1(key.encode()).hexdigest()
+
+
+def tournament_fingerprint(t: dict, unknown_start: str | None = None) -> str:
+    """
+    Provider tournament id when there is one, else name + buy-in + start
+    minute. A placeholder start is left out, so an untimed tournament keeps
+    its fingerprint from one scrape to the next.
+    """
+    if t.get("tournament_id"):
+        return _digest("T", t["provider"], "id", t["tournament_id"])
+    start = _known_start(t.get("start_time"), unknown_start)
+    return _digest("T", t["provider"], (t.get("name") or "").strip().lower(), t.get("buy_in"), _minute(start))
+
+
+def cash_game_fingerprint(c: dict) -> str:
+    stakes = c.get("stakes") or {}
+    return _digest("C", c["provider"], c.get("variant"), stakes.get("small_blind"), stakes.get("big_blind"), c.get("club_id"))
+
+
+def game_fingerprint(g: dict, unknown_start: str | None = None) -> str:
+    tournament = g.get("tournament") or {}
+    stakes = g.get("stakes") or {}
+    start = _known_start(tournament.get("start_time"), unknown_start)
+    return _digest(
+        "G", g["provider"], g.get("game_type"), g.get("variant"), g.get("club_id"),
+        (tournament.get("name") or "").strip().lower(), tournament.get("buy_in"),
+        _minute(start), stakes.get("small_blind"), stakes.get("big_blind"),
+    )
+
+
+class SnapshotRepository(ABC):
+    """Storage for everything the scrapers produce, independent of the backend."""
+
+    @abstractmethod
+    def save_result(self, provider: str, result: dict, scraped_at: datetime | None = None) -> dict:
+        """Upsert one scrape's items; returns counts per kind."""
+
+    @abstractmethod
+    def query_tournaments(
+        self,
+        provider: str | None = None,
+        variant: str | None = None,
+        min_buy_in: int | None = None,
+        max_buy_in: int | None = None,
+        start_after: datetime | None = None,
+        start_before: datetime | None = None,
+        seen_since: datetime | None = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> list[dict]:
+        """Stored tournaments matching the filters, soonest start first."""
+
+    @abstractmethod
+    def latest_scrapes(self, limit: int = 20) -> list[dict]:
+        """Most recent scrape log entries."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Release the underlying connection."""
+
+
+class SQLiteSnapshotRepository(SnapshotRepository):
+    """
+    SQLite (WAL mode) implementation of the snapshot store.
+
+    Items are deduplicated by a stable fingerprint and stamped with when
+    they were first and last seen. Start times that are only the scrape
+    time placeholder (the result's `scrape_time`) are stored as NULL. Each scrape is written in a single
+    transaction. Calls are synchronous; run them in a worker thread from
+    async code.
+    """
+
+    def __init__(self, path: str | None = None):
+        self.path = path or settings.store_path
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(SCHEMA)
+
+    def save_result(self, provider: str, result: dict, scraped_at: datetime | None = None) -> dict:
+        seen = (scraped_at or datetime.now()).isoformat()
+        unknown_start = _minute(result.get("scrape_time")) or None
+        tournaments = [
+            (
+                tournament_fingerprint(t, unknown_start), t["provider"], t["variant"], t.get("tournament_id") or None,
+                t["name"], t["buy_in"], _utc(_known_start(t.get("start_time"), unknown_start)), t.get("guaranteed_prize"),
+                int(bool(t.get("late_reg_open"))), json.dumps(t, default=_iso), seen, seen,
+            )
+            for t in result.get("tournaments") or []
+        ]
+        cash_games = [
+            (
+                cash_game_fingerprint(c), c["provider"], c["variant"], c["stakes"]["small_blind"],
+                c["stakes"]["big_blind"], c.get("club_id"), json.dumps(c, default=_iso), seen, seen,
+            )
+            for c in result.get("cash_games") or []
+        ]
+        games = [
+            (
+                game_fingerprint(g, unknown_start), g["provider"], g["game_type"], g["variant"],
+                (g.get("tournament") or {}).get("buy_in"),
+                _utc(_known_start((g.get("tournament") or {}).get("start_time"), unknown_start)),
+                json.dumps(g, default=_iso), seen, seen,
+            )
+            for g in result.get("games") or []
+        ]
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                """
+                INSERT INTO tournaments (fingerprint, provider, variant, tournament_id, name, buy_in,
+                    start_time, guaranteed_prize, late_reg_open, data, first_seen, last_seen)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (fingerprint) DO UPDATE SET
+                    variant = excluded.variant, name = excluded.name, buy_in = excluded.buy_in,
+                    start_time = excluded.start_time, guaranteed_prize = excluded.guaranteed_prize,
+                    late_reg_open = excluded.late_reg_open, data = excluded.data,
+                    last_seen = excluded.last_seen
+                """,
+                tournaments,
+            )
+            self._conn.executemany(
+                """
+                INSERT INTO cash_games (fingerprint, provider, variant, small_blind, big_blind,
+                    club_id, data, first_seen, last_seen)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (fingerprint) DO UPDATE SET
+                    data = excluded.data, last_seen = excluded.last_seen
+                """,
+                cash_games,
+            )
+            self._conn.executemany(
+                """
+                INSERT INTO games (fingerprint, provider, game_type, variant, buy_in, start_time,
+                    data, first_seen, last_seen)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (fingerprint) DO UPDATE SET
+                    data = excluded.data, last_seen = excluded.last_seen
+                """,
+                games,
+            )
+            self._conn.execute(
+                """
+                INSERT INTO scrapes (provider, scraped_at, success, tournaments, cash_games, games)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (provider, seen, int(bool(result.get("success"))), len(tournaments), len(cash_games), len(games)),
+            )
+
+        return {"tournaments": len(tournaments), "cash_games": len(cash_games), "games": len(games)}
+
+    def query_tournaments(
+        self,
+        provider: str | None = None,
+        variant: str | None = None,
+        min_buy_in: int | None = None,
+        max_buy_in: int | None = None,
+        start_after: datetime | None = None,
+        start_before: datetime | None = None,
+        seen_since: datetime | None = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> list[dict]:
+        clauses, params = [], []
+        for column, op, value in (
+            ("provider", "=", provider),
+            ("variant", "=", variant),
+            ("buy_in", ">=", min_buy_in),
+            ("buy_in", "<=", max_buy_in),
+            ("start_time", ">=", _utc(start_after)),
+            ("start_time", "<=", _utc(start_before)),
+            ("last_seen", ">=", _iso(seen_since)),
+        ):
+            if value is not None:
+                clauses.append(f"{column} {op} ?")
+                params.append(value)
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            rows = self._conn.execute(
+                f"""
+                SELECT data, fingerprint, first_seen, last_seen FROM tournaments {where}
+                ORDER BY start_time, buy_in LIMIT ? OFFSET ?
+                """,
+                [*params, limit, offset],
+            ).fetchall()
+
+        return [
+            {
+                **json.loads(row["data"]),
+                "fingerprint": row["fingerprint"],
+                "first_seen": row["first_seen"],
+                "last_seen": row["last_seen"],
+            }
+            for row in rows
+        ]
+
+    def latest_scrapes(self, limit: int = 20) -> list[dict]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM scrapes ORDER BY id DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [dict(row) | {"success": bool(row["success"])} for row in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,153 @@
+"""
+Measure how much cross-method deduplication shrinks scrape payloads.
+
+Builds a synthetic GGPoker scrape in which the same schedule is found by
+several methods, the way the live page produces it: the schedule API
+(JSON with ids and start times), carousel slides and section containers
+(overlapping selectors, so each slide's text comes back more than once,
+sometimes without a time) and content regex hits with placeholder names.
+It then compares the old per-scraper key `(name, buy_in, start_time)`,
+with start times defaulting to `datetime.now()` per record, against the
+Deduplicator. Reports record counts, payload bytes and dedup time, and
+checks that every scheduled tournament survives exactly once with the
+JSON record's fields.
+
+    python -m scripts.benchmark_dedup
+    python -m scripts.benchmark_dedup --tournaments 200 2000 --runs 5
+"""
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+from app.models.poker import GameType, GameVariant, PokerGame, Provider, Tournament, TournamentInfo
+from app.scrapers.dedup import Deduplicator, placeholder_name
+
+NAMES = ["Sunday Million", "Bounty Hunters Daily", "Main Event", "Super Turbo", "Hyper Series", "Daily Deepstack"]
+
+
+def make_methods(size: int, seed: int, scrape_time: datetime, legacy: bool) -> list[tuple[str, list[Tournament]]]:
+    """Each method's output. `legacy` stamps unknown start times with `datetime.now()` per record."""
+    rng = random.Random(seed)
+
+    def unknown_start() -> datetime:
+        return datetime.now() if legacy else scrape_time
+
+    schedule = [
+        (
+            str(1000 + i),
+            f"{rng.choice(NAMES)} #{i}",
+            rng.randint(1, 1000) * 100,
+            scrape_time + timedelta(minutes=rng.randint(1, 2000)),
+            rng.choice([None, rng.randint(1, 500) * 100_000]),
+        )
+        for i in range(size)
+    ]
+
+    def record(tid, name, buy_in, start, gtd) -> Tournament:
+        return Tournament(
+            provider=Provider.GG_POKER, variant=GameVariant.NLHE, tournament_id=tid,
+            name=name, buy_in=buy_in, start_time=start, guaranteed_prize=gtd,
+        )
+
+    network = [record(tid, name, buy_in, start, gtd) for tid, name, buy_in, start, gtd in schedule]
+    # Slides show about half the schedule; text parsing recovers the time for most of them
+    slides = [
+        record(None, name, buy_in, start if rng.random() < 0.7 else unknown_start(), gtd)
+        for _, name, buy_in, start, gtd in rng.sample(schedule, size // 2)
+    ]
+    # Overlapping section selectors return every slide twice, plus some cards of their own
+    section = [s.model_copy(update={"start_time": unknown_start()}) for s in slides for _ in range(2)]
+    section += [
+        record(None, name, buy_in, unknown_start(), None)
+        for _, name, buy_in, _, _ in rng.sample(schedule, size // 4)
+    ]
+    # "$X buy-in" regex hits anywhere in the HTML
+    content = [
+        record(None, placeholder_name(buy_in), buy_in, unknown_start(), None)
+        for _, _, buy_in, _, _ in schedule
+        for _ in range(rng.randint(1, 3))
+    ]
+    return [("network", network), ("swiper", slides), ("section", section), ("content", content)]
+
+
+def payload(tournaments: list[Tournament]) -> int:
+    """Bytes of the tournaments and games lists as the API returns them."""
+    games = [
+        PokerGame(
+            provider=t.provider,
+            game_type=GameType.TOURNAMENT,
+            variant=t.variant,
+            tournament=TournamentInfo(
+                buy_in=t.buy_in, start_time=t.start_time, guaranteed_prize=t.guaranteed_prize, name=t.name,
+            ),
+        ).model_dump(mode="json")
+        for t in tournaments
+    ]
+    body = {"tournaments": [t.model_dump(mode="json") for t in tournaments], "games": games}
+    return len(json.dumps(body))
+
+
+def legacy_dedup(methods: list[tuple[str, list[Tournament]]]) -> list[Tournament]:
+    seen, unique = set(), []
+    for _, records in methods:
+        for t in records:
+            key = (t.name, t.buy_in, t.start_time.isoformat() if t.start_time else "")
+            if key not in seen:
+                seen.add(key)
+                unique.append(t)
+    return unique
+
+
+def engine_dedup(methods: list[tuple[str, list[Tournament]]], scrape_time: datetime) -> list[Tournament]:
+    dedup = Deduplicator(unknown_start=scrape_time)
+    for method, records in methods:
+        dedup.add(method, records)
+    return dedup.results()
+
+
+def check(size: int, methods: list[tuple[str, list[Tournament]]], merged: list[Tournament]) -> None:
+    network = {t.tournament_id: t for t in methods[0][1]}
+    assert len(merged) == size, f"expected {size} tournaments, got {len(merged)}"
+    assert {t.tournament_id for t in merged} == set(network), "a scheduled tournament was lost or split"
+    for t in merged:
+        assert t == network[t.tournament_id], f"merged record differs from the JSON record: {t}"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tournaments", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    scrape_time = datetime.now().replace(second=0, microsecond=0)
+    print(f"{'schedule':>9}{'found':>8}{'legacy':>8}{'engine':>8}{'legacy KB':>11}{'engine KB':>11}"
+          f"{'reduction':>11}{'dedup ms':>10}")
+    for size in args.tournaments:
+        legacy_methods = make_methods(size, args.seed, scrape_time, legacy=True)
+        methods = make_methods(size, args.seed, scrape_time, legacy=False)
+        found = sum(len(records) for _, records in methods)
+
+        legacy = legacy_dedup(legacy_methods)
+        timings = []
+        for _ in range(args.runs):
+            started = time.perf_counter()
+            merged = engine_dedup(methods, scrape_time)
+            timings.append((time.perf_counter() - started) * 1000)
+        check(size, methods, merged)
+
+        legacy_bytes, engine_bytes = payload(legacy), payload(merged)
+        print(
+            f"{size:>9}{found:>8}{len(legacy):>8}{len(merged):>8}"
+            f"{legacy_bytes / 1024:>11.1f}{engine_bytes / 1024:>11.1f}"
+            f"{1 - engine_bytes / legacy_bytes:>10.1%}{statistics.median(timings):>10.2f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
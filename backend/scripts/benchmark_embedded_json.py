@@ -0,0 +1,129 @@
+"""
+Compare the embedded-JSON extractor against the old regex extraction.
+
+Builds synthetic inline-script bundles the way provider pages ship them:
+megabytes of minified JS around a `window.__INITIAL_DATA__ = {...}`
+assignment whose state holds several `"tournaments": [...]` arrays, with
+names containing `]`, `}` and `;`. The old approach ran one lazy
+`(\\[.*?\\])` / `({.*?});` regex per key and `json.loads` on the capture,
+so it stopped at the first closing bracket and found nothing or a
+fragment. Reports time per bundle and records found, and checks that the
+extractor finds every tournament exactly once.
+
+    python -m scripts.benchmark_embedded_json
+    python -m scripts.benchmark_embedded_json --sizes 1 8 --runs 5
+"""
+import argparse
+import json
+import random
+import re
+import statistics
+import sys
+import time
+
+from app.scrapers.embedded_json import DEFAULT_GLOBALS, find_embedded_records
+
+KEYS = ("tournaments", "schedule", "events")
+NAMES = ["Sunday Million", "Bounty [PKO]", "Main Event {Day 1}", "Turbo; Rebuy", "Hyper Series", "Deepstack"]
+NOISE = (
+    'function a{0}(e,t){{if(e==null)return t;var n=[e,t].map(function(r){{return r["x{0}"]}});'
+    'return n.length>1?{{k:n[0],v:"}}];"}}:null}}'
+    'var c{0}=document.querySelectorAll(".lobby [data-id=\\"{0}\\"]");window.i{0}=c{0}.length;\n'
+)
+
+
+def make_bundle(megabytes: float, seed: int) -> tuple[str, int]:
+    """One script of about `megabytes` MB, and how many tournaments it embeds."""
+    rng = random.Random(seed)
+    sections = []
+    count = 0
+    for s in range(8):
+        tournaments = []
+        for _ in range(rng.randint(20, 120)):
+            tournaments.append({
+                "id": str(count),
+                "name": f"{rng.choice(NAMES)} #{count}",
+                "buyIn": rng.randint(1, 1000),
+                "startTime": f"2026-10-17T{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:00Z",
+                "tags": [rng.choice(["pko", "turbo", "}];"]) for _ in range(rng.randint(0, 3))],
+            })
+            count += 1
+        sections.append({"id": s, "title": f"Section {s}", "tournaments": tournaments})
+    state = json.dumps({"lobby": {"sections": sections}, "user": None, "flags": {"a": [1, 2]}})
+
+    target = int(megabytes * 1024 * 1024) - len(state)
+    noise, i = [], 0
+    size = 0
+    while size < target:
+        chunk = NOISE.format(i)
+        noise.append(chunk)
+        size += len(chunk)
+        i += 1
+    half = len(noise) // 2
+    text = "".join(noise[:half]) + f"window.__INITIAL_DATA__ = {state};\n" + "".join(noise[half:])
+    return text, count
+
+
+def legacy_extract(scripts: list[str]) -> list:
+    """The per-scraper regex loop this module replaced."""
+    patterns = [rf'"{key}"\s*:\s*(\[.*?\])' for key in KEYS]
+    patterns.append(r'window\.__INITIAL_DATA__\s*=\s*({.*?});')
+    records = []
+    for content in scripts:
+        for pattern in patterns:
+            match = re.search(pattern, content, re.DOTALL)
+            if match:
+                try:
+                    data = json.loads(match.group(1))
+                except Exception:
+                    continue
+                if isinstance(data, list):
+                    records.extend(data)
+                elif isinstance(data, dict):
+                    for key in KEYS:
+                        if isinstance(data.get(key), list):
+                            records.extend(data[key])
+    return records
+
+
+def engine_extract(scripts: list[str]) -> list:
+    return find_embedded_records(scripts, KEYS, DEFAULT_GLOBALS)
+
+
+def timed(fn, scripts: list[str], runs: int) -> tuple[list, float]:
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        records = fn(scripts)
+        timings.append((time.perf_counter() - started) * 1000)
+    return records, statistics.median(timings)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=float, nargs="+", default=[0.5, 2, 8], help="bundle size in MB")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'MB':>6}{'embedded':>10}{'legacy':>8}{'engine':>8}{'legacy ms':>11}{'engine ms':>11}")
+    for size in args.sizes:
+        text, embedded = make_bundle(size, args.seed)
+        scripts = [text]
+
+        legacy, legacy_ms = timed(legacy_extract, scripts, args.runs)
+        engine, engine_ms = timed(engine_extract, scripts, args.runs)
+
+        ids = [item["id"] for item in engine]
+        assert len(ids) == embedded, f"expected {embedded} tournaments, got {len(ids)}"
+        assert len(set(ids)) == embedded, "a tournament was decoded more than once"
+
+        print(
+            f"{len(text) / 1024 / 1024:>6.1f}{embedded:>10}{len(legacy):>8}{len(engine):>8}"
+            f"{legacy_ms:>11.1f}{engine_ms:>11.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""
+Show event-loop lag while scrapers regex-scan large page HTML.
+
+Runs each provider's `scan_content` over a synthetic multi-megabyte page,
+first inline on the event loop (parse_workers=0) and then in a process
+pool, while a LoopLagMonitor samples the loop. Lag near zero means other
+requests and scrapes keep being served during parsing.
+
+    python -m scripts.benchmark_loop_lag
+    python -m scripts.benchmark_loop_lag --size-mb 8 --repeat 5 --workers 4
+"""
+import argparse
+import asyncio
+import multiprocessing
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from app.loop_monitor import LoopLagMonitor
+from app.scrapers import clubgg, ggpoker, pokerstars
+
+SCANNERS = {
+    "clubgg": clubgg.scan_content,
+    "ggpoker": ggpoker.scan_content,
+    "pokerstars": pokerstars.scan_content,
+}
+
+
+def make_html(size_mb: float, seed: int) -> str:
+    """Page-sized HTML with tournament snippets scattered through markup noise."""
+    rng = random.Random(seed)
+    parts, size = [], 0
+    while size < size_mb * 2**20:
+        if rng.random() < 0.2:
+            chunk = (
+                f'<div class="t">Sunday Special ${rng.randint(5, 500)} buy-in '
+                f'${rng.randint(1, 100)},000 GTD {rng.randint(1, 5)}/{rng.randint(2, 10)} NL</div>'
+            )
+        else:
+            chunk = f'<span class="c{rng.randint(0, 999)}" data-x="{rng.random():.6f}">Lorem ipsum</span>'
+        parts.append(chunk)
+        size += len(chunk)
+    return "".join(parts)
+
+
+async def run_mode(html: str, repeat: int, pool: ProcessPoolExecutor | None) -> tuple[float, dict]:
+    monitor = LoopLagMonitor(interval=0.01, stall_threshold=0.05)
+    monitor.start()
+    await asyncio.sleep(0.05)
+    loop = asyncio.get_running_loop()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for scan in SCANNERS.values():
+            if pool:
+                await loop.run_in_executor(pool, scan, html)
+            else:
+                scan(html)
+                # Let the monitor observe the stall, as a concurrent request would
+                await asyncio.sleep(0)
+    elapsed = time.perf_counter() - started
+    await asyncio.sleep(0.05)
+    await monitor.stop()
+    return elapsed, monitor.stats()
+
+
+async def run(args: argparse.Namespace) -> int:
+    html = make_html(args.size_mb, args.seed)
+    print(f"page: {len(html) / 2**20:.1f} MiB, {args.repeat} x {len(SCANNERS)} scans")
+    print(f"{'mode':<10}{'seconds':>9}{'mean lag':>10}{'p99 lag':>10}{'max lag':>10}{'stalls':>8}")
+
+    pool = ProcessPoolExecutor(max_workers=args.workers, mp_context=multiprocessing.get_context("spawn"))
+    try:
+        # Warm the workers so process start-up isn't counted
+        await asyncio.gather(*[
+            asyncio.get_running_loop().run_in_executor(pool, ggpoker.scan_content, "")
+            for _ in range(args.workers)
+        ])
+        for mode, executor in (("inline", None), ("pool", pool)):
+            elapsed, stats = await run_mode(html, args.repeat, executor)
+            print(
+                f"{mode:<10}{elapsed:>9.2f}{stats['mean_ms']:>8.1f}ms{stats['p99_ms']:>8.1f}ms"
+                f"{stats['max_ms']:>8.1f}ms{stats['stalls']:>8}"
+            )
+    finally:
+        pool.shutdown()
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=float, default=4.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=1)
+    return asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+"""
+Benchmark the scrapers offline against recorded HAR fixtures.
+
+Record fixtures once (needs network), then replay them as often as needed:
+
+    python -m scripts.benchmark_replay --record
+    python -m scripts.benchmark_replay --runs 20
+    python -m scripts.benchmark_replay --runs 20 --pooled ggpoker
+
+Each run reports per-phase timings (launch, navigate, readiness, extract,
+parse); the summary shows mean/p50/p95/max per provider and phase.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+PHASES = ["launch", "navigate", "readiness", "extract", "parse", "total"]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("providers", nargs="*", help="Providers to run (default: all)")
+    parser.add_argument("--runs", type=int, default=5, help="Replays per provider")
+    parser.add_argument("--record", action="store_true", help="Record fresh HAR fixtures instead")
+    parser.add_argument("--pooled", action="store_true", help="Reuse warm browsers between runs")
+    parser.add_argument("--har-dir", default=None, help="Fixture directory (default: settings.har_dir)")
+    return parser.parse_args()
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def run(args: argparse.Namespace) -> int:
+    from playwright.async_api import async_playwright
+
+    from app.browser_pool import BrowserPool
+    from app.scrapers import SCRAPERS
+
+    providers = args.providers or list(SCRAPERS)
+    unknown = [p for p in providers if p not in SCRAPERS]
+    if unknown:
+        print(f"Unknown providers: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+
+    runs = 1 if args.record else args.runs
+    samples: dict[str, dict[str, list[float]]] = {}
+
+    async with async_playwright() as pw:
+        pool = None
+        if args.pooled:
+            pool = BrowserPool(pw, size=1)
+            await pool.start()
+
+        try:
+            for provider in providers:
+                samples[provider] = {phase: [] for phase in PHASES}
+                for i in range(runs):
+                    scraper = SCRAPERS[provider](pw, pool)
+                    started = time.perf_counter()
+                    result = await scraper.run()
+                    total = (time.perf_counter() - started) * 1000
+
+                    timings = result.get("timings_ms", {}) if isinstance(result, dict) else {}
+                    for phase in PHASES[:-1]:
+                        samples[provider][phase].append(timings.get(phase, 0.0))
+                    samples[provider]["total"].append(total)
+
+                    count = len(result.get("tournaments", [])) + len(result.get("games", []))
+                    status = "ok" if result.get("success") else f"failed: {result.get('errors')}"
+                    print(f"{provider} run {i + 1}/{runs}: {total:8.1f} ms, {count} items, {status}")
+        finally:
+            if pool:
+                await pool.close()
+
+    if args.record:
+        print(f"Recorded fixtures in {os.environ['HAR_DIR']}")
+        return 0
+
+    print()
+    print(f"{'provider':<12}{'phase':<11}{'mean':>10}{'p50':>10}{'p95':>10}{'max':>10}")
+    for provider, phases in samples.items():
+        for phase in PHASES:
+            values = phases[phase]
+            print(
+                f"{provider:<12}{phase:<11}"
+                f"{statistics.fmean(values):>10.1f}{percentile(values, 50):>10.1f}"
+                f"{percentile(values, 95):>10.1f}{max(values):>10.1f}"
+            )
+    return 0
+
+
+def main() -> int:
+    args = parse_args()
+    # Settings are read once at import time, so configure them before importing the app
+    os.environ["HAR_MODE"] = "record" if args.record else "replay"
+    if args.har_dir:
+        os.environ["HAR_DIR"] = args.har_dir
+    os.environ.setdefault("HAR_DIR", "fixtures/har")
+    os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
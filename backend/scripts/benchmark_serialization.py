@@ -0,0 +1,111 @@
+"""
+Compare response serialization paths on large tournament payloads.
+
+"default" is what FastAPI does with a returned ScrapeResponse: validate
+the envelope, walk it with `jsonable_encoder`, then `json.dumps`. "fast"
+is the `settings.fast_serialization` path: `model_construct` plus
+`FastJSONResponse` (orjson). Start times mix naive local values with
+tz-aware UTC and offset ones, as the scrapers produce them, and both
+paths must produce identical bytes. Reports latency and peak Python
+memory (tracemalloc) per path.
+
+    python -m scripts.benchmark_serialization
+    python -m scripts.benchmark_serialization --sizes 1000 10000 50000 --runs 10
+"""
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+from fastapi.encoders import jsonable_encoder
+
+from app.models.poker import GameVariant, Provider, Tournament
+from app.routers.scraper_router import ScrapeResponse
+from app.serialization import FastJSONResponse
+
+
+def make_result(size: int, seed: int) -> dict:
+    """A GGPoker-sized scrape result as the scrapers produce it."""
+    rng = random.Random(seed)
+    base = datetime.now().replace(microsecond=0)
+    # Text-parsed starts are naive local times, JSON ones are tz-aware
+    zones = [None, timezone.utc, timezone(timedelta(hours=-5))]
+    tournaments = [
+        Tournament(
+            provider=Provider.GG_POKER,
+            variant=rng.choice(list(GameVariant)),
+            tournament_id=str(i),
+            name=f"Daily Special #{i}",
+            buy_in=rng.randint(100, 100_000),
+            start_time=(base + timedelta(minutes=rng.randint(0, 10_000))).replace(tzinfo=rng.choice(zones)),
+            guaranteed_prize=rng.choice([None, rng.randint(1_000, 10_000_000) * 100]),
+            late_reg_open=rng.random() < 0.3,
+        ).model_dump()
+        for i in range(size)
+    ]
+    return {
+        "success": True,
+        "provider": Provider.GG_POKER,
+        "timestamp": base,
+        "games": [],
+        "cash_games": [],
+        "tournaments": tournaments,
+    }
+
+
+def default_path(result: dict) -> bytes:
+    response = ScrapeResponse(success=True, data=result, meta={"provider": "ggpoker"})
+    content = jsonable_encoder(response)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode()
+
+
+def fast_path(result: dict) -> bytes:
+    response = ScrapeResponse.model_construct(success=True, data=result, meta={"provider": "ggpoker"})
+    return FastJSONResponse(response).body
+
+
+PATHS = {"default": default_path, "fast": fast_path}
+
+
+def measure(fn, result: dict, runs: int) -> tuple[list[float], int, int]:
+    times = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        body = fn(result)
+        times.append((time.perf_counter() - started) * 1000)
+
+    tracemalloc.start()
+    fn(result)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return times, peak, len(body)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'items':>8}{'path':>9}{'mean ms':>10}{'min ms':>10}{'peak MiB':>10}{'bytes':>12}")
+    for size in args.sizes:
+        result = make_result(size, args.seed)
+        if default_path(result) != fast_path(result):
+            print(f"Paths disagree at {size} items", file=sys.stderr)
+            return 1
+        for name, fn in PATHS.items():
+            times, peak, size_bytes = measure(fn, result, args.runs)
+            print(
+                f"{size:>8}{name:>9}{statistics.fmean(times):>10.1f}{min(times):>10.1f}"
+                f"{peak / 2**20:>10.1f}{size_bytes:>12,}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+from datetime import datetime, timedelta, timezone
+
+from app.models.poker import (
+    CashGame, GameType, GameVariant, PokerGame, Provider, Stakes, Tournament, TournamentInfo,
+)
+from app.scrapers.dedup import Deduplicator, placeholder_name
+
+SCRAPE_TIME = datetime(2026, 10, 17, 9, 0)
+START = datetime(2026, 10, 17, 19, 0)
+
+
+def tournament(name: str, buy_in: int = 10900, start: datetime | None = START, **fields) -> Tournament:
+    return Tournament(
+        provider=Provider.GG_POKER, variant=GameVariant.NLHE, name=name, buy_in=buy_in,
+        start_time=start or SCRAPE_TIME, **fields,
+    )
+
+
+def merge(*methods: tuple[str, list]) -> list:
+    dedup = Deduplicator(unknown_start=SCRAPE_TIME)
+    for method, records in methods:
+        dedup.add(method, records)
+    return dedup.results()
+
+
+def test_matches_on_tournament_id():
+    merged = merge(
+        ("network", [tournament("Sunday Million", tournament_id="42")]),
+        ("scripts", [tournament("SUNDAY MILLION (re-entry)", start=START + timedelta(hours=1), tournament_id="42")]),
+    )
+    assert len(merged) == 1
+    assert merged[0].name == "Sunday Million"
+
+
+def test_matches_on_name_buy_in_and_start_minute():
+    merged = merge(
+        ("swiper", [tournament("Sunday Million!", start=START + timedelta(seconds=30))]),
+        ("section", [tournament("sunday  million", start=START)]),
+        ("section", [tournament("Sunday Million", start=START + timedelta(minutes=30))]),
+    )
+    assert len(merged) == 2
+
+
+def test_untimed_record_folds_into_timed_group_by_name_and_buy_in():
+    merged = merge(
+        ("swiper", [tournament("Bounty Hunters", start=START)]),
+        ("section", [tournament("Bounty Hunters", start=None), tournament("Bounty Hunters", start=None)]),
+    )
+    assert len(merged) == 1
+    assert merged[0].start_time == START
+
+
+def test_placeholder_names_fold_by_buy_in():
+    merged = merge(
+        ("network", [tournament("Main Event", buy_in=21500)]),
+        ("content", [tournament(placeholder_name(21500), buy_in=21500, start=None) for _ in range(3)]),
+        ("content", [tournament(placeholder_name(500), buy_in=500, start=None)]),
+    )
+    assert sorted(t.name for t in merged) == ["$5 Tournament", "Main Event"]
+
+
+def test_timed_placeholder_names_keep_their_start():
+    merged = merge(
+        ("content", [
+            tournament(placeholder_name(2500), buy_in=2500, start=START),
+            tournament(placeholder_name(2500), buy_in=2500, start=START + timedelta(hours=2)),
+            tournament(placeholder_name(2500), buy_in=2500, start=START + timedelta(hours=2, seconds=20)),
+        ]),
+    )
+    assert sorted(t.start_time for t in merged) == [START, START + timedelta(hours=2)]
+
+
+def test_cash_games_match_exactly():
+    def cash(small_blind: int, club_id: str | None = "club-1") -> CashGame:
+        return CashGame(
+            provider=Provider.CLUB_GG, variant=GameVariant.NLHE,
+            stakes=Stakes(small_blind=small_blind, big_blind=small_blind * 2), club_id=club_id,
+        )
+
+    merged = merge(("tables", [cash(50), cash(50), cash(100), cash(50, club_id="club-2")]))
+    assert len(merged) == 3
+
+
+def test_merge_keeps_the_best_record_and_fills_gaps_from_the_rest():
+    network = tournament("Sunday Million", tournament_id="42")
+    slide = tournament("Sunday Million", start=None, guaranteed_prize=1_000_000_00, late_reg_open=True)
+    content = tournament(placeholder_name(10900), start=None, max_entries=5000)
+
+    [merged] = merge(("content", [content]), ("swiper", [slide]), ("network", [network]))
+    # The network record wins on rank; empty fields come from the others
+    assert merged.tournament_id == "42"
+    assert merged.start_time == START
+    assert merged.guaranteed_prize == 1_000_000_00
+    assert merged.max_entries == 5000
+    # Falsy-but-set fields of the best record are not overwritten
+    assert merged.late_reg_open is False
+
+
+def test_richer_record_wins_within_a_rank():
+    sparse = tournament("Daily Deepstack", start=None)
+    rich = tournament("Daily Deepstack", guaranteed_prize=50_000_00, current_entries=120)
+
+    [merged] = merge(("section", [sparse, rich]))
+    assert merged is rich
+
+
+def test_placeholder_name_is_replaced_by_a_real_one():
+    [merged] = merge(
+        ("network", [tournament(placeholder_name(10900), tournament_id="7")]),
+        ("swiper", [tournament("Sunday Million", tournament_id="7", start=None)]),
+    )
+    assert merged.name == "Sunday Million"
+
+
+def test_tz_aware_json_start_matches_naive_local_text_start():
+    aware = datetime(2026, 10, 17, 19, 0, tzinfo=timezone.utc)
+    local = aware.astimezone().replace(tzinfo=None)
+
+    merged = merge(
+        ("network", [tournament("Sunday Million", start=aware, tournament_id="42")]),
+        ("swiper", [tournament("Sunday Million", start=local)]),
+        ("section", [tournament("Sunday Million", start=None)]),
+    )
+    assert len(merged) == 1
+    assert merged[0].start_time == aware
+
+
+def test_tournament_games_merge_their_info():
+    def game(name: str, start: datetime, gtd: int | None = None) -> PokerGame:
+        return PokerGame(
+            provider=Provider.CLUB_GG, game_type=GameType.TOURNAMENT, variant=GameVariant.NLHE,
+            tournament=TournamentInfo(buy_in=5500, start_time=start, name=name, guaranteed_prize=gtd),
+        )
+
+    [merged] = merge(
+        ("embedded_json", [game("Club Classic", START)]),
+        ("tournaments", [game("Club Classic", SCRAPE_TIME, gtd=10_000_00)]),
+    )
+    assert merged.tournament.start_time == START
+    assert merged.tournament.guaranteed_prize == 10_000_00
+
+
+def test_stats_report_the_reduction():
+    dedup = Deduplicator(unknown_start=SCRAPE_TIME)
+    dedup.add("network", [tournament("A", tournament_id="1"), tournament("B", tournament_id="2")])
+    dedup.add("content", [tournament(placeholder_name(10900), start=None)] * 2)
+    output = dedup.results()
+    stats = dedup.stats(len(output))
+    assert stats["input"] == 4
+    assert stats["by_method"] == {"network": 2, "content": 2}
+    assert stats["removed"] == 4 - len(output)
@@ -0,0 +1,29 @@
+import pytest
+
+from app.scrapers.parsing import parse_money
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("$1,500", 1500.0),
+        ("$10K", 10_000.0),
+        ("2.5M", 2_500_000.0),
+        ("$10 K GTD", 10_000.0),
+        ("no money here", 0.0),
+    ],
+)
+def test_parse_money(text, expected):
+    assert parse_money(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("$5 Mystery Bounty", 5.0),
+        ("$10 Mega Satellite", 10.0),
+        ("$20 Knockout", 20.0),
+    ],
+)
+def test_parse_money_ignores_words_starting_with_a_unit(text, expected):
+    assert parse_money(text) == expected
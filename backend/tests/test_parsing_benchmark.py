@@ -0,0 +1,69 @@
+"""
+Benchmarks for the shared tournament text parser.
+
+Runs synthetic GGPoker-style slide texts and PokerStars-style table rows
+through `looks_like_tournament` + `parse_tournament_text` at several
+scales. Use pytest-benchmark's own options to compare runs over time:
+
+    python -m pytest tests/test_parsing_benchmark.py --benchmark-only
+    python -m pytest tests/test_parsing_benchmark.py --benchmark-autosave --benchmark-compare
+"""
+import random
+
+import pytest
+
+from app.scrapers.parsing import looks_like_tournament, parse_tournament_text
+
+NAMES = ["Sunday Million", "Bounty Hunters Daily", "Main Event", "Super Turbo", "Hyper Series"]
+VARIANTS = ["NLHE", "PLO", "PLO5", "Mixed"]
+
+
+def slide_text(rng: random.Random) -> str:
+    """Carousel slide as text_content() returns it: labels run together."""
+    return (
+        f"{rng.choice(NAMES)}{rng.choice(VARIANTS)}"
+        f"${rng.randint(1, 1050)}Buy-in${rng.randint(1, 500)}K GTD"
+        f"{rng.randint(1, 12)}:{rng.choice(['00', '15', '30', '45'])} {rng.choice(['AM', 'PM'])} ET"
+    )
+
+
+def row_text(rng: random.Random) -> str:
+    """Schedule table row: time | name | buy-in | guarantee."""
+    return (
+        f"{rng.randint(0, 23):02d}:{rng.choice(['00', '30'])}  "
+        f"#{rng.randint(1, 99)}: {rng.choice(NAMES)} {rng.choice(VARIANTS)}  "
+        f"${rng.randint(1, 215)}.{rng.choice(['00', '50'])}  "
+        f"${rng.randint(1, 100):,},000 Guaranteed"
+    )
+
+
+def noise_text(rng: random.Random) -> str:
+    """Non-tournament element text that the pre-filter should reject."""
+    return rng.choice(["Download the app", "Promotions", "Responsible gaming", "Sign up now"])
+
+
+def make_corpus(size: int, kind: str, seed: int = 1) -> list[str]:
+    rng = random.Random(seed)
+    make = slide_text if kind == "slide" else row_text
+    # Roughly one element in ten is unrelated page chrome
+    return [noise_text(rng) if rng.random() < 0.1 else make(rng) for _ in range(size)]
+
+
+def parse_all(texts: list[str]) -> int:
+    parsed = 0
+    for text in texts:
+        if looks_like_tournament(text) and parse_tournament_text(text):
+            parsed += 1
+    return parsed
+
+
+@pytest.mark.parametrize("kind", ["slide", "row"])
+@pytest.mark.parametrize("size", [1_000, 10_000])
+def test_parse_throughput(benchmark, kind, size):
+    texts = make_corpus(size, kind)
+    benchmark.extra_info["items"] = size
+
+    parsed = benchmark(parse_all, texts)
+
+    # Everything except the page chrome (which has no digits) should parse
+    assert parsed == sum(any(c.isdigit() for c in text) for text in texts)
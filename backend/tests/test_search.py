@@ -0,0 +1,67 @@
+from datetime import datetime, timedelta, timezone
+
+from app.search import TournamentIndex, TournamentQuery
+
+
+def tournament(name: str, start: datetime | None) -> dict:
+    return {"provider": "GG_POKER", "variant": "NLHE", "name": name, "buy_in": 10900, "start_time": start}
+
+
+def local_naive(value: datetime) -> datetime:
+    """The same instant as a naive local time, as text parsing produces it."""
+    return value.astimezone().replace(tzinfo=None)
+
+
+def test_mixed_naive_and_aware_start_times_sort_and_filter_by_instant():
+    noon = datetime(2026, 10, 17, 12, 0, tzinfo=timezone.utc)
+    index = TournamentIndex([
+        tournament("aware 13:00", noon + timedelta(hours=1)),
+        tournament("naive 12:30", local_naive(noon + timedelta(minutes=30))),
+        tournament("aware 11:00", noon - timedelta(hours=1)),
+        tournament("naive 14:00", local_naive(noon + timedelta(hours=2))),
+        tournament("untimed", None),
+    ])
+
+    page, _ = index.search(TournamentQuery(), limit=10)
+    assert [t["name"] for t in page] == ["untimed", "aware 11:00", "naive 12:30", "aware 13:00", "naive 14:00"]
+
+    query = TournamentQuery(start_after=noon, start_before=local_naive(noon + timedelta(hours=1)))
+    page, _ = index.search(query, limit=10)
+    assert [t["name"] for t in page] == ["naive 12:30", "aware 13:00"]
+
+
+def test_cursor_pages_through_mixed_start_times():
+    noon = datetime(2026, 10, 17, 12, 0, tzinfo=timezone.utc)
+    index = TournamentIndex(
+        tournament(f"t{i}", noon + timedelta(minutes=i) if i % 2 else local_naive(noon + timedelta(minutes=i)))
+        for i in range(7)
+    )
+
+    names, cursor = [], None
+    while True:
+        page, cursor = index.search(TournamentQuery(), limit=3, cursor=cursor)
+        names += [t["name"] for t in page]
+        if cursor is None:
+            break
+    assert names == [f"t{i}" for i in range(7)]
+
+
+def test_scrape_time_placeholder_start_is_unknown():
+    scrape_time = datetime(2026, 10, 17, 9, 0)
+    evening = local_naive(datetime(2026, 10, 17, 19, 0, tzinfo=timezone.utc))
+    result = {
+        "scrape_time": scrape_time.isoformat(),
+        "tournaments": [
+            tournament("evening", evening),
+            tournament("untimed", scrape_time),
+        ],
+    }
+    index = TournamentIndex.from_results([result])
+
+    page, _ = index.search(TournamentQuery(), limit=10)
+    assert [t["name"] for t in page] == ["untimed", "evening"]
+
+    around_scrape = TournamentQuery(start_after=scrape_time - timedelta(hours=1), start_before=scrape_time + timedelta(hours=1))
+    assert index.search(around_scrape, limit=10)[0] == []
+    page, _ = index.search(TournamentQuery(start_before=evening), limit=10)
+    assert [t["name"] for t in page] == ["evening"]
@@ -0,0 +1,74 @@
+from datetime import datetime, timedelta, timezone
+
+from app.models.poker import GameType, GameVariant, PokerGame, Provider, Tournament, TournamentInfo
+from app.store import SQLiteSnapshotRepository, tournament_fingerprint
+
+
+def make_result(scrape_time: datetime, start_time: datetime | None = None) -> dict:
+    """A scrape of one untimed tournament, which the scrapers stamp with the scrape time."""
+    start = start_time or scrape_time
+    tournament = Tournament(
+        provider=Provider.GG_POKER, variant=GameVariant.NLHE, name="$109 Tournament",
+        buy_in=10900, start_time=start,
+    )
+    game = PokerGame(
+        provider=Provider.GG_POKER, game_type=GameType.TOURNAMENT, variant=GameVariant.NLHE,
+        tournament=TournamentInfo(buy_in=10900, start_time=start, name="$109 Tournament"),
+    )
+    return {
+        "provider": "ggpoker",
+        "success": True,
+        "scrape_time": scrape_time.isoformat(),
+        "tournaments": [tournament.model_dump()],
+        "games": [game.model_dump()],
+    }
+
+
+def count(store: SQLiteSnapshotRepository, table: str) -> int:
+    return store._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def test_same_untimed_scrape_saved_twice_keeps_one_row():
+    store = SQLiteSnapshotRepository(":memory:")
+    first = datetime(2026, 10, 17, 12, 0)
+    store.save_result("ggpoker", make_result(first), scraped_at=first)
+    store.save_result("ggpoker", make_result(first + timedelta(minutes=5)), scraped_at=first + timedelta(minutes=5))
+
+    assert count(store, "tournaments") == 1
+    assert count(store, "games") == 1
+    assert count(store, "scrapes") == 2
+    [row] = store.query_tournaments()
+    assert row["first_seen"] != row["last_seen"]
+    store.close()
+
+
+def test_timed_tournaments_keep_their_start_in_the_key():
+    store = SQLiteSnapshotRepository(":memory:")
+    scrape_time = datetime(2026, 10, 17, 12, 0)
+    store.save_result("ggpoker", make_result(scrape_time, scrape_time + timedelta(hours=7)))
+    store.save_result("ggpoker", make_result(scrape_time, scrape_time + timedelta(hours=8)))
+
+    assert count(store, "tournaments") == 2
+    store.close()
+
+
+def test_fingerprint_hashes_enum_values():
+    tournament = make_result(datetime(2026, 10, 17, 12, 0))["tournaments"][0]
+    as_json = {**tournament, "provider": "GG_POKER", "variant": "NLHE"}
+    assert tournament_fingerprint(tournament) == tournament_fingerprint(as_json)
+
+
+def test_start_window_compares_local_and_utc_starts():
+    store = SQLiteSnapshotRepository(":memory:")
+    scrape_time = datetime(2026, 10, 17, 12, 0)
+    utc_start = datetime(2026, 10, 17, 18, 0, tzinfo=timezone.utc)
+    local_start = datetime(2026, 10, 17, 20, 0, tzinfo=timezone.utc).astimezone().replace(tzinfo=None)
+    store.save_result("ggpoker", make_result(scrape_time, utc_start))
+    store.save_result("ggpoker", make_result(scrape_time, local_start))
+
+    bound = datetime(2026, 10, 17, 19, 0, tzinfo=timezone.utc)
+    [after] = store.query_tournaments(start_after=bound)
+    [before] = store.query_tournaments(start_before=bound.astimezone().replace(tzinfo=None))
+    assert datetime.fromisoformat(after["start_time"]) == local_start
+    assert datetime.fromisoformat(before["start_time"]) == utc_start
+    store.close()